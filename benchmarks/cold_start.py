@@ -0,0 +1,238 @@
+"""Benchmark the cold start of the examples and of large synthetic clis.
+
+Every invocation runs in a fresh python process, so the measured wall time includes
+interpreter start, importing clipstick, pydantic and rich, defining the model and
+parsing. Every example is invoked with valid arguments, with `-h` and with invalid
+arguments.
+
+Unix only: the peak memory of a process is taken from `os.wait4`. A process inherits
+the peak memory of the process starting it, so all invocations are started by a small
+separate spawner process instead of this (much larger) one.
+
+Run with: `python -m benchmarks.cold_start [--runs 50] [--save-baseline baseline.json]`
+Compare with an earlier run: `python -m benchmarks.cold_start --baseline baseline.json`
+"""
+from __future__ import annotations
+
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from statistics import median, quantiles
+from typing import NamedTuple
+
+from clipstick import parse
+from clipstick._synthetic import synthetic_args, synthetic_source
+from pydantic import BaseModel, PositiveInt
+
+ROOT = Path(__file__).parent.parent
+
+# Valid and invalid arguments of every example.
+EXAMPLES: dict[str, tuple[list[str], list[str]]] = {
+    "boolean": (["--required", "-w"], []),
+    "choice": (["option1"], ["option3"]),
+    "collection": (["--required-collection", "a"], ["-o", "x"]),
+    "keyword": (["--my-value", "1"], ["--my-value", "x"]),
+    "name": (["alice", "--repeat-count", "1"], ["alice", "--age", "x"]),
+    "positional": (["1"], ["x"]),
+    "simple": (["alice", "--repeat-count", "1"], []),
+    "subcommand": (["clone", "my_repo"], ["push"]),
+    "types_file_exists": (["pyproject.toml"], ["does_not_exist.txt"]),
+    "types_non_negative_int": (["--my-age", "3"], ["--my-age", "0"]),
+}
+
+# Options, subcommands and depth of the synthetic clis.
+SYNTHETIC: dict[str, tuple[int, int, int]] = {
+    "synthetic_large": (20, 5, 2),
+    "synthetic_huge": (50, 8, 2),
+}
+
+
+class Case(NamedTuple):
+    """An invocation of a cli and its expected exit code."""
+
+    name: str
+    command: list[str]
+    exit_code: int
+
+
+class Result(NamedTuple):
+    """Wall times in milliseconds and the peak memory of all runs of a case."""
+
+    p50: float
+    p90: float
+    p99: float
+    max_rss: float
+    """Peak memory in MiB."""
+
+
+def _cases(folder: Path) -> list[Case]:
+    python = sys.executable
+    cases = [
+        Case("python", [python, "-c", "pass"], 0),
+        Case("import clipstick", [python, "-c", "import clipstick"], 0),
+    ]
+    for example, (valid, invalid) in EXAMPLES.items():
+        command = [python, "-m", f"examples.{example}"]
+        cases.extend(
+            (
+                Case(f"{example} valid", [*command, *valid], 0),
+                Case(f"{example} help", [*command, "-h"], 0),
+                Case(f"{example} error", [*command, *invalid], 1),
+            )
+        )
+    for name, size in SYNTHETIC.items():
+        script = folder / f"{name}.py"
+        script.write_text(
+            f"{synthetic_source(*size)}\n\n"
+            "from clipstick import parse\n\n"
+            "parse(Main)\n",
+            encoding="utf-8",
+        )
+        command = [python, str(script)]
+        cases.extend(
+            (
+                Case(f"{name} valid", [*command, *synthetic_args(*size)], 0),
+                Case(f"{name} help", [*command, "-h"], 0),
+                Case(f"{name} error", [*command, "value", "--option-0", "x"], 1),
+            )
+        )
+    return cases
+
+
+# Runs every command it reads from stdin and writes its wall time, exit code and
+# peak memory to stdout. Does not import anything besides these modules.
+SPAWNER = """
+import json, os, sys, time
+
+quiet = [
+    (os.POSIX_SPAWN_OPEN, fd, os.devnull, os.O_WRONLY, 0) for fd in (1, 2)
+]
+for line in sys.stdin:
+    command = json.loads(line)
+    start = time.perf_counter()
+    pid = os.posix_spawn(command[0], command, os.environ, file_actions=quiet)
+    _, status, usage = os.wait4(pid, 0)
+    elapsed = time.perf_counter() - start
+    print(json.dumps([elapsed, os.waitstatus_to_exitcode(status), usage.ru_maxrss]))
+    sys.stdout.flush()
+"""
+
+
+class Spawner:
+    """Runs commands in fresh processes, started by a separate small process."""
+
+    def __init__(self) -> None:
+        """Start the spawner process."""
+        self._process = subprocess.Popen(
+            [sys.executable, "-c", SPAWNER],
+            cwd=ROOT,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+
+    def close(self) -> None:
+        """Stop the spawner process."""
+        assert self._process.stdin is not None
+        self._process.stdin.close()
+        self._process.wait()
+
+    def run(self, case: Case) -> tuple[float, float]:
+        """Return the wall time in seconds and the peak memory in MiB of an invocation."""
+        assert self._process.stdin is not None and self._process.stdout is not None
+        self._process.stdin.write(json.dumps(case.command) + "\n")
+        self._process.stdin.flush()
+        elapsed, exit_code, max_rss = json.loads(self._process.stdout.readline())
+        if exit_code != case.exit_code:
+            raise RuntimeError(
+                f"{case.name!r} exited with {exit_code}, "
+                f"expected {case.exit_code}: {' '.join(case.command)}"
+            )
+        # kilobytes on linux, bytes on macOS.
+        rss_unit = 1 if sys.platform == "darwin" else 1024
+        return elapsed, max_rss * rss_unit / 2**20
+
+
+def _measure(spawner: Spawner, case: Case, runs: int) -> Result:
+    timings, peaks = zip(*(spawner.run(case) for _ in range(runs)))
+    if runs == 1:
+        p50 = p90 = p99 = timings[0]
+    else:
+        percentiles = quantiles(timings, n=100, method="inclusive")
+        p50, p90, p99 = median(timings), percentiles[89], percentiles[98]
+    return Result(p50 * 1000, p90 * 1000, p99 * 1000, max(peaks))
+
+
+def _change(current: float, baseline: float) -> str:
+    return f"{(current - baseline) / baseline:>+8.1%}"
+
+
+class ColdStart(BaseModel):
+    """Benchmark the cold start of the examples and of large synthetic clis."""
+
+    runs: PositiveInt = 20
+    """The number of invocations of every case."""
+
+    baseline: Path | None = None
+    """Compare with the results stored in this file."""
+
+    save_baseline: Path | None = None
+    """Store the results in this file."""
+
+    max_regression: float = 0.1
+    """Exit with 1 when the median of a case is this fraction slower than the baseline."""
+
+    def main(self) -> None:
+        """Run the benchmark."""
+        baseline: dict[str, dict[str, float]] = {}
+        if self.baseline is not None:
+            baseline = json.loads(self.baseline.read_text(encoding="utf-8"))["results"]
+        print(f"python {platform.python_version()}, {self.runs} runs per case")
+        header = f"{'case':<32}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'rss MiB':>9}"
+        if baseline:
+            header += f"{'p50':>9}{'rss':>9}"
+        print(header)
+
+        results: dict[str, Result] = {}
+        regressions: list[str] = []
+        spawner = Spawner()
+        with tempfile.TemporaryDirectory() as folder:
+            for case in _cases(Path(folder)):
+                result = results[case.name] = _measure(spawner, case, self.runs)
+                line = (
+                    f"{case.name:<32}{result.p50:>9.1f}{result.p90:>9.1f}"
+                    f"{result.p99:>9.1f}{result.max_rss:>9.1f}"
+                )
+                if (stored := baseline.get(case.name)) is not None:
+                    line += _change(result.p50, stored["p50"])
+                    line += _change(result.max_rss, stored["max_rss"])
+                    if result.p50 > stored["p50"] * (1 + self.max_regression):
+                        regressions.append(case.name)
+                print(line)
+        spawner.close()
+
+        if self.save_baseline is not None:
+            self.save_baseline.write_text(
+                json.dumps(
+                    {
+                        "python": platform.python_version(),
+                        "platform": platform.platform(),
+                        "runs": self.runs,
+                        "results": {
+                            name: result._asdict() for name, result in results.items()
+                        },
+                    },
+                    indent=2,
+                ),
+                encoding="utf-8",
+            )
+        if regressions:
+            print(f"Slower than the baseline: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    parse(ColdStart).main()
@@ -0,0 +1,81 @@
+"""Benchmark how the time of parsing adversarial arguments grows with their number.
+
+Times matching and validating the cases of `tests.test_complexity` for a small and
+a large number of arguments. Growth is the ratio of the two times divided by the
+ratio of the sizes: about 1 for a linear parse, about the ratio of the sizes for a
+quadratic one.
+
+Run with: `python -m benchmarks.complexity [size]`
+"""
+import contextlib
+import sys
+import timeit
+from math import ceil
+from typing import Callable
+
+from clipstick._clipstick import DUMMY_ENTRY_POINT
+from clipstick._exceptions import ParseErrors
+from clipstick._lexer import lex
+from clipstick._parse import compile_model
+from clipstick._tokens import ParseOptions, ParseState
+from pydantic import BaseModel
+
+from tests.test_complexity import ABBREVIATION_CASES, CASES, SCALE
+
+DEFAULT_SIZE = 500
+
+
+def _match_and_validate(
+    model: type[BaseModel], args: list[str], options: ParseOptions
+) -> None:
+    root = compile_model(model, DUMMY_ENTRY_POINT)
+    state = ParseState(root, lex(args), options)
+    root.match(0, state)
+    if not state.errors:
+        with contextlib.suppress(ParseErrors):
+            root.parse(state)
+
+
+def _seconds(func: Callable[[], object], number: int) -> float:
+    """Return the fastest of a few runs of calling func a number of times."""
+    return min(timeit.repeat(func, number=number, repeat=3)) / number
+
+
+def _growth(
+    make: Callable[[int], tuple[type[BaseModel], list[str]]],
+    size: int,
+    options: ParseOptions,
+) -> tuple[float, float]:
+    """Return the seconds of the large parse and its growth compared to the small one."""
+    small_model, small_args = make(size)
+    large_model, large_args = make(size * SCALE)
+
+    def small_parse() -> None:
+        _match_and_validate(small_model, list(small_args), options)
+
+    def large_parse() -> None:
+        _match_and_validate(large_model, list(large_args), options)
+
+    small_parse()
+    large_parse()
+    # the large parse is repeated for at least 10ms, to keep the noise of timing small.
+    number = ceil(0.01 / timeit.timeit(large_parse, number=1))
+    small_seconds = _seconds(small_parse, number * SCALE)
+    large_seconds = _seconds(large_parse, number)
+    return large_seconds, large_seconds / small_seconds / SCALE
+
+
+def main(size: int = DEFAULT_SIZE) -> None:
+    print(f"{size} and {size * SCALE} arguments")
+    cases = [(name, make, ParseOptions()) for name, make in CASES.items()]
+    cases.extend(
+        (name, make, ParseOptions(allow_abbrev=True))
+        for name, make in ABBREVIATION_CASES.items()
+    )
+    for name, make, options in cases:
+        seconds, growth = _growth(make, size, options)
+        print(f"{name:<28}{seconds * 1000:>10.2f} ms    growth {growth:.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE)
@@ -0,0 +1,8 @@
+"""Compare clipstick with argparse, click and typer for equivalent clis.
+
+Run with: `python -m benchmarks.frameworks [--runs 10] [--parses 200]`
+
+Every framework defines the same cli (see `spec`) using its own adapter module.
+Frameworks which are not installed are skipped. Nothing is imported here, so a
+cold start of one framework does not import any of the others.
+"""
@@ -0,0 +1,95 @@
+"""Compare clipstick with argparse, click and typer for equivalent clis.
+
+For every framework and scale this measures:
+- import: the time to import the framework, on top of starting the interpreter.
+- cold start: the time of a fresh process building the cli and parsing arguments.
+- parse: the time to parse the arguments once the cli is built.
+- help: the time to render the help of the main command.
+"""
+import contextlib
+import io
+import subprocess
+import sys
+import time
+from importlib import import_module
+from importlib.util import find_spec
+from pathlib import Path
+from statistics import median
+
+from clipstick import parse
+from pydantic import BaseModel, PositiveInt
+
+from benchmarks.frameworks.spec import SCALES, build_spec, spec_args
+
+ROOT = Path(__file__).parent.parent.parent
+FRAMEWORKS = ("clipstick", "argparse", "click", "typer")
+
+
+def _process_time(command: list[str], runs: int) -> float:
+    """Return the median wall time of running a command in a fresh process."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return median(timings)
+
+
+def _call_time(func, repeat: int) -> float:
+    """Return the median time of calling a function."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return median(timings)
+
+
+class Frameworks(BaseModel):
+    """Compare clipstick with argparse, click and typer for equivalent clis."""
+
+    runs: PositiveInt = 10
+    """The number of fresh processes per import and cold start measurement."""
+
+    parses: PositiveInt = 200
+    """The number of parses and help renders per measurement."""
+
+    def main(self) -> None:
+        """Run the benchmark."""
+        python = sys.executable
+        frameworks = [name for name in FRAMEWORKS if find_spec(name) is not None]
+        if skipped := sorted(set(FRAMEWORKS) - set(frameworks)):
+            print(f"Not installed, skipped: {', '.join(skipped)}")
+        print(f"python {sys.version.split()[0]}")
+        print(
+            f"{'scale':<8}{'framework':<11}{'import ms':>11}{'cold start ms':>15}"
+            f"{'parse µs':>11}{'help ms':>10}"
+        )
+
+        interpreter = _process_time([python, "-c", "pass"], self.runs)
+        imports = {
+            name: _process_time([python, "-c", f"import {name}"], self.runs)
+            - interpreter
+            for name in frameworks
+        }
+        for scale, size in SCALES.items():
+            spec = build_spec(*size)
+            args = spec_args(spec)
+            for name in frameworks:
+                adapter = import_module(f"benchmarks.frameworks.{name}_cli")
+                cold_start = _process_time(
+                    [python, "-m", "benchmarks.frameworks.run", name, scale], self.runs
+                )
+                cli = adapter.build(spec, "bench")
+                parse_time = _call_time(lambda: adapter.parse(cli, args), self.parses)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    help_time = _call_time(lambda: adapter.help(cli), self.parses)
+                print(
+                    f"{scale:<8}{name:<11}{imports[name] * 1e3:>11.1f}"
+                    f"{cold_start * 1e3:>15.1f}{parse_time * 1e6:>11.1f}"
+                    f"{help_time * 1e3:>10.2f}"
+                )
+
+
+if __name__ == "__main__":
+    parse(Frameworks).main()
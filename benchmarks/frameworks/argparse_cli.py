@@ -0,0 +1,45 @@
+"""The benchmark cli defined using argparse."""
+import argparse
+from typing import Sequence
+
+from benchmarks.frameworks.spec import CHOICES, Spec
+
+
+def _add_arguments(parser: argparse.ArgumentParser, spec: Spec) -> None:
+    parser.add_argument("name")
+    for field, kind in spec.options:
+        key = f"--{field.replace('_', '-')}"
+        if kind == "int":
+            parser.add_argument(key, type=int, default=0)
+        elif kind == "bool":
+            parser.add_argument(key, action="store_true")
+        elif kind == "list":
+            parser.add_argument(key, action="append")
+        elif kind == "choice":
+            parser.add_argument(key, choices=CHOICES, default="a")
+        else:
+            parser.add_argument(key, default="")
+    if spec.subcommands:
+        subparsers = parser.add_subparsers(dest="sub_command", required=True)
+        for sub_command in spec.subcommands:
+            _add_arguments(
+                subparsers.add_parser(sub_command.name, help=sub_command.name),
+                sub_command,
+            )
+
+
+def build(spec: Spec, prog: str) -> argparse.ArgumentParser:
+    """Return the parser of the cli."""
+    parser = argparse.ArgumentParser(prog=prog)
+    _add_arguments(parser, spec)
+    return parser
+
+
+def parse(cli: argparse.ArgumentParser, args: Sequence[str]) -> object:
+    """Parse the arguments."""
+    return cli.parse_args(args)
+
+
+def help(cli: argparse.ArgumentParser) -> None:
+    """Print the help of the main command."""
+    print(cli.format_help())
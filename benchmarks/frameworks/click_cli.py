@@ -0,0 +1,51 @@
+"""The benchmark cli defined using click."""
+from typing import Any, Sequence
+
+import click
+
+from benchmarks.frameworks.spec import CHOICES, Spec
+
+
+def _params(spec: Spec) -> list[click.Parameter]:
+    params: list[click.Parameter] = [click.Argument(["name"])]
+    for field, kind in spec.options:
+        key = f"--{field.replace('_', '-')}"
+        if kind == "int":
+            params.append(click.Option([key], type=int, default=0))
+        elif kind == "bool":
+            params.append(click.Option([key], is_flag=True, default=False))
+        elif kind == "list":
+            params.append(click.Option([key], multiple=True))
+        elif kind == "choice":
+            params.append(click.Option([key], type=click.Choice(CHOICES), default="a"))
+        else:
+            params.append(click.Option([key], default=""))
+    return params
+
+
+def _callback(**kwargs: Any) -> dict[str, Any]:
+    return kwargs
+
+
+def _command(spec: Spec, name: str) -> click.Command:
+    if not spec.subcommands:
+        return click.Command(name, params=_params(spec), callback=_callback)
+    group = click.Group(name, params=_params(spec), callback=_callback)
+    for sub_command in spec.subcommands:
+        group.add_command(_command(sub_command, sub_command.name))
+    return group
+
+
+def build(spec: Spec, prog: str) -> click.Command:
+    """Return the command of the cli."""
+    return _command(spec, prog)
+
+
+def parse(cli: click.Command, args: Sequence[str]) -> object:
+    """Parse the arguments."""
+    return cli.main(list(args), standalone_mode=False)
+
+
+def help(cli: click.Command) -> None:
+    """Print the help of the main command."""
+    cli.main(["--help"], standalone_mode=False)
@@ -0,0 +1,32 @@
+"""The benchmark cli defined using clipstick."""
+from typing import Sequence
+
+from clipstick import parse as _parse
+from clipstick._synthetic import synthetic_model
+from pydantic import BaseModel
+
+from benchmarks.frameworks.spec import Spec
+
+
+def build(spec: Spec, prog: str) -> type[BaseModel]:
+    """Return the model of the cli."""
+    options = len(spec.options)
+    subcommands = len(spec.subcommands)
+    depth = 0
+    while spec.subcommands:
+        spec = spec.subcommands[0]
+        depth += 1
+    return synthetic_model(options, subcommands, depth)
+
+
+def parse(cli: type[BaseModel], args: Sequence[str]) -> object:
+    """Parse the arguments."""
+    return _parse(cli, list(args))
+
+
+def help(cli: type[BaseModel]) -> None:
+    """Print the help of the main command."""
+    try:
+        _parse(cli, ["-h"])
+    except SystemExit:
+        pass
@@ -0,0 +1,14 @@
+"""Build the cli of a framework and parse arguments, as a cold start.
+
+Run with: `python -m benchmarks.frameworks.run <framework> <scale>`
+"""
+import sys
+from importlib import import_module
+
+from benchmarks.frameworks.spec import SCALES, build_spec, spec_args
+
+if __name__ == "__main__":
+    framework, scale = sys.argv[1:]
+    adapter = import_module(f"benchmarks.frameworks.{framework}_cli")
+    spec = build_spec(*SCALES[scale])
+    adapter.parse(adapter.build(spec, "bench"), spec_args(spec))
@@ -0,0 +1,65 @@
+"""The cli surface defined by every framework.
+
+Equal to the synthetic models of `clipstick._synthetic` (names, kinds of options and
+arguments), but without importing clipstick.
+"""
+from __future__ import annotations
+
+from typing import NamedTuple
+
+# The kinds of options, in the order of `clipstick._synthetic`.
+KINDS = ("int", "bool", "list", "choice", "str")
+CHOICES = ("a", "b")
+# The value provided for each kind of option. None for a flag.
+VALUES = {"int": "1", "bool": None, "list": "a", "choice": "b", "str": "value"}
+
+# Options, subcommands and depth.
+SCALES: dict[str, tuple[int, int, int]] = {
+    "small": (5, 0, 0),
+    "medium": (10, 3, 2),
+    "large": (20, 5, 2),
+}
+
+
+class Spec(NamedTuple):
+    """A (sub)command with a `name` positional, options and subcommands."""
+
+    name: str
+    """The name of the subcommand. Empty for the main command."""
+
+    options: list[tuple[str, str]]
+    """The field name and kind of every option."""
+
+    subcommands: list[Spec]
+
+
+def build_spec(
+    options: int, subcommands: int, depth: int, path: tuple[int, ...] = ()
+) -> Spec:
+    """Return the command tree of a scale."""
+    return Spec(
+        name="-".join(("cmd", *(str(idx) for idx in path))) if path else "",
+        options=[(f"option_{idx}", KINDS[idx % len(KINDS)]) for idx in range(options)],
+        subcommands=[
+            build_spec(options, subcommands, depth - 1, (*path, idx))
+            for idx in range(subcommands if depth else 0)
+        ],
+    )
+
+
+def spec_args(spec: Spec) -> list[str]:
+    """Return arguments providing every token along the last subcommands.
+
+    Options precede the positional, as a click group stops parsing its options at
+    the first positional.
+    """
+    args = []
+    for field, kind in spec.options:
+        key = f"--{field.replace('_', '-')}"
+        value = VALUES[kind]
+        args.extend((key,) if value is None else (key, value))
+    args.append("value")
+    if spec.subcommands:
+        last = spec.subcommands[-1]
+        args.extend((last.name, *spec_args(last)))
+    return args
@@ -0,0 +1,83 @@
+"""The benchmark cli defined using typer.
+
+Typer derives a cli from function signatures. The functions are created from the spec,
+with a signature declaring the arguments and options.
+"""
+import inspect
+from enum import Enum
+from typing import Any, Callable, List, Optional, Sequence
+
+import click
+import typer
+
+from benchmarks.frameworks.spec import CHOICES, Spec
+
+Choice = Enum("Choice", {choice: choice for choice in CHOICES})  # type: ignore[misc]
+
+
+def _parameter(field: str, kind: str) -> inspect.Parameter:
+    key = f"--{field.replace('_', '-')}"
+    annotation: Any
+    if kind == "int":
+        annotation, default = int, typer.Option(0, key)
+    elif kind == "bool":
+        annotation, default = bool, typer.Option(False, key)
+    elif kind == "list":
+        annotation, default = Optional[List[str]], typer.Option(None, key)
+    elif kind == "choice":
+        annotation, default = Choice, typer.Option(Choice.a.value, key)
+    else:
+        annotation, default = str, typer.Option("", key)
+    return inspect.Parameter(
+        field,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        annotation=annotation,
+        default=default,
+    )
+
+
+def _function(spec: Spec) -> Callable[..., Any]:
+    def command(**kwargs: Any) -> dict[str, Any]:
+        return kwargs
+
+    command.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+        [
+            inspect.Parameter(
+                "name",
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                annotation=str,
+                default=typer.Argument(...),
+            ),
+            *(_parameter(field, kind) for field, kind in spec.options),
+        ]
+    )
+    return command
+
+
+def _app(spec: Spec) -> typer.Typer:
+    app = typer.Typer(add_completion=False)
+    if not spec.subcommands:
+        app.command()(_function(spec))
+        return app
+    app.callback()(_function(spec))
+    for sub_command in spec.subcommands:
+        if sub_command.subcommands:
+            app.add_typer(_app(sub_command), name=sub_command.name)
+        else:
+            app.command(sub_command.name)(_function(sub_command))
+    return app
+
+
+def build(spec: Spec, prog: str) -> click.Command:
+    """Return the (click) command of the cli."""
+    return typer.main.get_command(_app(spec))
+
+
+def parse(cli: click.Command, args: Sequence[str]) -> object:
+    """Parse the arguments."""
+    return cli.main(list(args), prog_name="bench", standalone_mode=False)
+
+
+def help(cli: click.Command) -> None:
+    """Print the help of the main command."""
+    cli.main(["--help"], prog_name="bench", standalone_mode=False)
@@ -0,0 +1,51 @@
+"""Benchmark parsing a (large) response file into a `list[Path]` collection.
+
+Run with: `python -m benchmarks.response_file [entries]`
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from clipstick import parse
+from clipstick._lexer import lex
+from clipstick._streams import expand_response_files
+from pydantic import BaseModel
+
+DEFAULT_ENTRIES = 1_000_000
+
+
+class Files(BaseModel):
+    """Process files."""
+
+    files: list[Path] = []
+
+
+def _create_response_file(folder: Path, entries: int) -> Path:
+    response_file = folder / "files.txt"
+    with response_file.open("w", encoding="utf-8") as file:
+        for idx in range(entries):
+            file.write(f"--files\n/data/folder_{idx % 100}/file_{idx}.txt\n")
+    return response_file
+
+
+def _timed(name: str, func) -> None:
+    start = time.perf_counter()
+    func()
+    print(f"{name:<30}{time.perf_counter() - start:>8.3f}s")
+
+
+def main(entries: int = DEFAULT_ENTRIES) -> None:
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as folder:
+        response_file = _create_response_file(Path(folder), entries)
+        args = [f"@{response_file}"]
+        print(f"{entries} entries ({response_file.stat().st_size / 1e6:.1f} MB)")
+
+        _timed("read", lambda: sum(1 for _ in expand_response_files(args, "@")))
+        _timed("read + lex", lambda: lex(expand_response_files(args, "@")))
+        _timed("parse", lambda: parse(Files, args, fromfile_prefix="@"))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ENTRIES)
@@ -0,0 +1,64 @@
+"""Benchmark parsing throughput with a growing number of threads.
+
+Parsing is pure python, so with the GIL enabled throughput does not increase with more
+threads. On a free-threaded build (like python 3.13t) it should scale with the number
+of cores.
+
+Run with: `python -m benchmarks.threads [parses]`
+"""
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated
+
+from clipstick import parse, short
+from pydantic import BaseModel
+
+DEFAULT_PARSES = 20_000
+THREADS = (1, 2, 4, 8, 16)
+
+ARGS = ["-v", "--remotes", "a", "--remotes", "b", "clone", "my_repo", "--depth=10"]
+
+
+class Clone(BaseModel):
+    """Clone a repo."""
+
+    repo: str
+    depth: int = 1
+
+
+class Info(BaseModel):
+    """Show repo info."""
+
+    verbose: bool = False
+
+
+class MyGit(BaseModel):
+    """My git cli."""
+
+    verbose: Annotated[bool, short("v")] = False
+    remotes: list[str] = []
+    sub_command: Clone | Info
+
+
+def _parse(_: int) -> MyGit:
+    return parse(MyGit, ARGS)
+
+
+def main(parses: int = DEFAULT_PARSES) -> None:
+    """Run the benchmark."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]}, GIL enabled: {is_gil_enabled}")
+    _parse(0)  # compile the model once.
+
+    for threads in THREADS:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            start = time.perf_counter()
+            for _ in executor.map(_parse, range(parses)):
+                pass
+            elapsed = time.perf_counter() - start
+        print(f"{threads:>3} threads{parses / elapsed:>12.0f} parses/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PARSES)
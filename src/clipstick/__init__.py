@@ -2,9 +2,49 @@
 
 Create your cli using Pydantic models.
 """
+from __future__ import annotations
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from clipstick._annotations import short  # noqa
-from clipstick._clipstick import parse  # noqa
+from clipstick._annotations import plugins, short, uncached, variadic  # noqa
 
-__all__ = ["short", "parse"]
+if TYPE_CHECKING:  # pragma: no cover
+    from clipstick._clipstick import parse  # noqa
+    from clipstick._dispatch import dispatch  # noqa
+    from clipstick._docs import render_help  # noqa
+    from clipstick._invoke import invoke  # noqa
+    from clipstick._manifest import manifest  # noqa
+    from clipstick._parse_cache import ParseCache  # noqa
+
+# Imported on first use, so models only using the annotation markers (like the
+# models of a generated parser) do not load the parser and rich.
+_LAZY = {
+    "parse": "clipstick._clipstick",
+    "invoke": "clipstick._invoke",
+    "dispatch": "clipstick._dispatch",
+    "ParseCache": "clipstick._parse_cache",
+    "manifest": "clipstick._manifest",
+    "render_help": "clipstick._docs",
+}
+
+__all__ = [
+    "short",
+    "variadic",
+    "uncached",
+    "plugins",
+    "parse",
+    "invoke",
+    "dispatch",
+    "ParseCache",
+    "manifest",
+    "render_help",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,268 @@
+"""Clipstick command line tooling.
+
+Run `python -m clipstick -h` for usage.
+"""
+import json
+import sys
+from inspect import cleandoc
+from pathlib import Path
+from typing import Annotated, Iterator, Literal, NoReturn
+
+from pydantic import BaseModel, PositiveInt
+from rich.text import Text
+from rich.tree import Tree
+
+from clipstick import _help, manifest, parse, variadic
+from clipstick._codegen import generate
+from clipstick._exceptions import ClipStickError, InvalidModelErrors
+from clipstick._imports import import_object
+from clipstick._parse import PluginSubcommand, compile_model
+from clipstick._profile import PhaseTiming, profile
+from clipstick._style import ARGUMENTS_STYLE
+from clipstick._synthetic import synthetic_args, synthetic_model, synthetic_source
+from clipstick._tokens import Command, Subcommand
+
+
+def _import_model(path: str) -> type[BaseModel]:
+    model = import_object(path)
+    if not (isinstance(model, type) and issubclass(model, BaseModel)):
+        raise ClipStickError(f"{path!r} is not a pydantic model.")
+    return model
+
+
+def _prog(model: type[BaseModel], prog: str | None) -> str:
+    return prog or model.__module__.split(".")[0].replace("_", "-")
+
+
+def _fail(err: ClipStickError) -> NoReturn:
+    _help.error(err)
+    sys.exit(1)
+
+
+def _write(text: str, output: Path | None) -> None:
+    if output is None:
+        print(text)
+    else:
+        output.write_text(text, encoding="utf-8")
+
+
+def _tree(command: Command | Subcommand, tree: Tree) -> None:
+    for token in command.tokens.values():
+        help_info = token.help()
+        tree.add(
+            Text.assemble(
+                (help_info["arguments"], ARGUMENTS_STYLE), " ", help_info["type"]
+            )
+        )
+    for sub_command in command.sub_commands:
+        summary = cleandoc(sub_command.help()["description"]).split("\n")[0]
+        _tree(
+            sub_command,
+            tree.add(
+                Text.assemble((sub_command.user_keys[0], ARGUMENTS_STYLE), " ", summary)
+            ),
+        )
+
+
+def _lint_plugins(command: Command | Subcommand) -> Iterator[ClipStickError]:
+    """Load all plugin subcommands, which checks them."""
+    for sub_command in command.sub_commands:
+        if isinstance(sub_command, PluginSubcommand):
+            try:
+                sub_command.load()
+            except InvalidModelErrors as err:
+                yield from err.errors
+                continue
+            except ClipStickError as err:
+                yield err
+                continue
+        yield from _lint_plugins(sub_command)
+
+
+def _print_timings(timings: list[PhaseTiming]) -> None:
+    print(f"{'phase':<10}{'first (µs)':>14}{'median (µs)':>14}")
+    for timing in timings:
+        print(
+            f"{timing.phase:<10}{timing.first * 1e6:>14.1f}{timing.median * 1e6:>14.1f}"
+        )
+
+
+class Inspect(BaseModel):
+    """Print the command tree of a model."""
+
+    model: str
+    """Import path of the model. For example `my_package.cli:MyModel`."""
+
+    format: Literal["tree", "manifest"] = "tree"
+    """Print a tree or the JSON manifest of the model."""
+
+    prog: str | None = None
+    """Entrypoint name used in help output. Defaults to the package name."""
+
+    def main(self) -> None:
+        """Print the command tree."""
+        try:
+            model = _import_model(self.model)
+            prog = _prog(model, self.prog)
+            if self.format == "manifest":
+                print(json.dumps(manifest(model, prog), indent=2))
+                return
+            root = compile_model(model, prog)
+            tree = Tree(Text(prog, ARGUMENTS_STYLE))
+            _tree(root, tree)
+        except ClipStickError as err:
+            _fail(err)
+        _help.console.print(tree)
+
+
+class Lint(BaseModel):
+    """Check a model and its plugins for problems.
+
+    Exits with 1 when problems are found.
+    """
+
+    model: str
+    """Import path of the model. For example `my_package.cli:MyModel`."""
+
+    def main(self) -> None:
+        """Check the model."""
+        problems: list[ClipStickError] = []
+        try:
+            model = _import_model(self.model)
+            root = compile_model(model, _prog(model, None))
+        except InvalidModelErrors as err:
+            problems.extend(err.errors)
+        except ClipStickError as err:
+            problems.append(err)
+        else:
+            problems.extend(_lint_plugins(root))
+        if problems:
+            _fail(
+                ClipStickError(
+                    *(line for problem in problems for line in problem.message)
+                )
+            )
+        _help.console.print("No problems found.")
+
+
+class Profile(BaseModel):
+    """Time the phases of parsing arguments into a model.
+
+    Provide the arguments to parse after `--`. For example:
+    `python -m clipstick profile my_package.cli:MyModel --args -- clone my_repo --depth 2`
+    """
+
+    model: str
+    """Import path of the model. For example `my_package.cli:MyModel`."""
+
+    args: Annotated[list[str], variadic()] = []
+    """The arguments to parse."""
+
+    repeat: PositiveInt = 100
+    """The number of times every phase is run."""
+
+    allow_abbrev: bool = False
+    """Allow unambiguous abbreviations of long keys."""
+
+    def main(self) -> None:
+        """Time the parse."""
+        try:
+            model = _import_model(self.model)
+            timings = profile(
+                model,
+                self.args,
+                _prog(model, None),
+                repeat=self.repeat,
+                allow_abbrev=self.allow_abbrev,
+            )
+        except ClipStickError as err:
+            _fail(err)
+        _print_timings(timings)
+
+
+class Benchmark(BaseModel):
+    """Compile and parse a synthetic model of a given size.
+
+    Every command has a positional, a number of options and (up to the depth)
+    a number of subcommands.
+    """
+
+    options: int = 10
+    """The number of options of every command."""
+
+    subcommands: int = 3
+    """The number of subcommands of every command. 0 or at least 2."""
+
+    depth: int = 2
+    """The number of nested subcommand levels."""
+
+    parses: PositiveInt = 1000
+    """The number of times the arguments are parsed."""
+
+    source: bool = False
+    """Print the source of the synthetic model instead."""
+
+    def main(self) -> None:
+        """Run the benchmark."""
+        size = (self.options, self.subcommands, self.depth)
+        try:
+            if self.source:
+                print(synthetic_source(*size))
+                return
+            model = synthetic_model(*size)
+            args = synthetic_args(*size)
+        except ValueError as err:
+            _fail(ClipStickError(str(err)))
+        timings = profile(model, args, "synthetic", repeat=self.parses)
+        commands = sum(self.subcommands**level for level in range(self.depth + 1))
+        print(
+            f"{commands} commands, {commands * (self.options + 1)} tokens, "
+            f"{len(args)} arguments, {self.parses} parses"
+        )
+        _print_timings(timings)
+
+
+class Precompile(BaseModel):
+    """Write a standalone parser module or a JSON manifest of a model.
+
+    The generated module contains pre-computed lookup tables and help output
+    for the model, and parses arguments without tokenizing the model at runtime.
+    """
+
+    model: str
+    """Import path of the model. For example `my_package.cli:MyModel`."""
+
+    format: Literal["parser", "manifest"] = "parser"
+    """Write a parser module or the JSON manifest of the model."""
+
+    output: Path | None = None
+    """File to write to. Printed to stdout if omitted."""
+
+    prog: str | None = None
+    """Entrypoint name used in help output. Defaults to the package name."""
+
+    allow_abbrev: bool = False
+    """Allow unambiguous abbreviations of long keys. Only used by the parser module."""
+
+    def main(self) -> None:
+        """Write the parser module or manifest."""
+        try:
+            model = _import_model(self.model)
+            prog = _prog(model, self.prog)
+            if self.format == "manifest":
+                text = json.dumps(manifest(model, prog), indent=2)
+            else:
+                text = generate(model, prog=prog, allow_abbrev=self.allow_abbrev)
+        except ClipStickError as err:
+            _fail(err)
+        _write(text, self.output)
+
+
+class Clipstick(BaseModel):
+    """Clipstick developer tooling."""
+
+    sub_command: Inspect | Lint | Profile | Benchmark | Precompile
+
+
+if __name__ == "__main__":
+    parse(Clipstick, prog="python -m clipstick").sub_command.main()
@@ -1,4 +1,8 @@
 from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel, GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
 
 
 @dataclass(frozen=True)
@@ -16,3 +20,62 @@ def short(name: str) -> Short:
         A `Short` marker inside a type annotation.
     """
     return Short(name)
+
+
+@dataclass(frozen=True)
+class Variadic:
+    pass
+
+
+def variadic() -> Variadic:
+    """Consume all values following the key of a collection.
+
+    For example `--items a b c` instead of `--items a --items b --items c`.
+
+    Returns:
+        A `Variadic` marker inside a collection type annotation.
+    """
+    return Variadic()
+
+
+@dataclass(frozen=True)
+class Uncached:
+    pass
+
+
+def uncached() -> Uncached:
+    """Never take the value of this field from a parse cache.
+
+    Use it for fields whose validation depends on external state. Fields validating
+    paths (like `FilePath`) are never cached without this marker too.
+
+    Returns:
+        An `Uncached` marker inside a type annotation.
+    """
+    return Uncached()
+
+
+@dataclass(frozen=True)
+class Plugins:
+    group: str
+
+    def __get_pydantic_core_schema__(
+        self, source: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        # Next to the subcommands defined in the union, accept any
+        # (already validated) model provided by a plugin.
+        return core_schema.union_schema(
+            [handler(source), core_schema.is_instance_schema(BaseModel)]
+        )
+
+
+def plugins(group: str) -> Plugins:
+    """Extend a subcommand with subcommands provided by other installed packages.
+
+    Args:
+        group: The entry point group in which plugins register their subcommand models.
+
+    Returns:
+        A `Plugins` marker inside a subcommand type annotation.
+    """
+    return Plugins(group)
@@ -0,0 +1,43 @@
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+
+def cache_dir() -> Path:
+    """Return the folder in which clipstick stores its on-disk caches.
+
+    Set the `CLIPSTICK_CACHE_DIR` env variable to use a different folder.
+    """
+    if custom_dir := os.getenv("CLIPSTICK_CACHE_DIR"):
+        return Path(custom_dir)
+    base_dir = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base_dir) / "clipstick"
+
+
+def read_json(name: str) -> Any:
+    """Read a json cache file.
+
+    Returns:
+        The cached data or None when not available.
+    """
+    try:
+        return json.loads((cache_dir() / name).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def write_json(name: str, data: Any) -> None:
+    """Write a json cache file.
+
+    The file is replaced atomically so concurrent cli invocations never read a
+    partially written cache. A cache that cannot be written is silently ignored.
+    """
+    target = cache_dir() / name
+    temp_file = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_file.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(temp_file, target)
+    except OSError:
+        temp_file.unlink(missing_ok=True)
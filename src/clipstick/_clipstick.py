@@ -1,15 +1,46 @@
 import sys
-from typing import Final
+from pathlib import Path
+from typing import BinaryIO, Final, NoReturn, Sequence
 
-from clipstick import _help
-from clipstick._exceptions import ClipStickError
-from clipstick._parse import tokenize, validate_model
-from clipstick._tokens import Command, TPydanticModel
+from rich.console import Console
+
+from clipstick import _diagnostics, _help
+from clipstick._defaults import LayeredDefaults
+from clipstick._diagnostics import TDiagnostics
+from clipstick._exceptions import (
+    ClipStickError,
+    MissingSubcommand,
+    ParseErrors,
+    UnmatchedArgument,
+)
+from clipstick._lexer import lex
+from clipstick._parse import compile_model
+from clipstick._parse_cache import ParseCache, cache_key, is_cacheable
+from clipstick._streams import expand_response_files
+from clipstick._tokens import ParseOptions, ParseState, TPydanticModel
 
 DUMMY_ENTRY_POINT: Final[str] = "my-cli-app"
 
+# Errors caused by arguments that do not fit the cli at all. Help output is suggested for these.
+UNMATCHED_ERRORS = (UnmatchedArgument, MissingSubcommand)
+
 
-def parse(model: type[TPydanticModel], args: list[str] | None = None) -> TPydanticModel:
+def parse(
+    model: type[TPydanticModel],
+    args: list[str] | None = None,
+    *,
+    allow_abbrev: bool = False,
+    fromfile_prefix: str | None = None,
+    validation_workers: int | None = None,
+    env_prefix: str | None = None,
+    config_files: Sequence[str | Path] = (),
+    output: Console | None = None,
+    cache: ParseCache | None = None,
+    diagnostics: TDiagnostics = "text",
+    error_output: Console | None = None,
+    stdin: BinaryIO | None = None,
+    prog: str | None = None,
+) -> TPydanticModel:
     """Create an instance of the provided model.
 
     Leave `args` to None in production. Only use it for testing.
@@ -19,42 +50,112 @@ def parse(model: type[TPydanticModel], args: list[str] | None = None) -> TPydant
         args: The list of arguments. This is useful for testing.
             Provide a list and check if your model is parsed correctly.
             If not provided clipstick will evaluate the arguments from `sys.argv`.
+        allow_abbrev: Allow users to abbreviate long keys as long as the abbreviation
+            is unambiguous. For example `--verb` for `--verbose`.
+        fromfile_prefix: Arguments starting with this prefix (like `@`) are replaced
+            by the lines of the file they reference. Useful for (very) long argument lists.
+        validation_workers: Validate items of path-like collections (like `list[FilePath]`)
+            concurrently using this number of threads. Useful on slow (network) filesystems.
+        env_prefix: Take defaults from environment variables starting with this prefix.
+            For example `MY_CLI_` to populate a `--verbose` argument using `MY_CLI_VERBOSE`.
+        config_files: Take defaults from these TOML or JSON files. Values in later files take
+            precedence. Environment variables take precedence over config files.
+        output: The console to print help and errors to. Useful to capture the output of
+            a single parse when parsing from multiple threads.
+        cache: Return a copy of an earlier result for identical arguments.
+            Useful in long-lived processes parsing the same arguments over and over.
+        diagnostics: Print help and errors as rich `text` or as a `json` document.
+            Exits with code 0 after help output and 1 after errors.
+        error_output: The console to print errors to. Defaults to `output`.
+        stdin: The stream to read collection values from when provided as `-`.
+            Defaults to stdin.
+        prog: The name of the cli in help output. Defaults to the name of the
+            invoked script.
 
     Returns:
         An instance of the pydantic class we provided as argument populated with the provided args.
     """
-    try:
-        validate_model(model)
-    except ClipStickError as err:
-        _help.error(err)
-        sys.exit(1)
     if args is None:
         entry_point, args = sys.argv[0], sys.argv[1:]
     else:
         # Normally the first item in your sys.argv is the command/entrypoint you've entered.
         # During testing you don't provide that (only the actual arguments you enter after that).
         entry_point = DUMMY_ENTRY_POINT
+    if prog is not None:
+        entry_point = prog
+
+    key = None
+    if cache is not None:
+        key = cache_key(
+            model,
+            entry_point,
+            args,
+            allow_abbrev=allow_abbrev,
+            fromfile_prefix=fromfile_prefix,
+            env_prefix=env_prefix,
+            config_files=config_files,
+        )
+        if key is not None and (cached := cache.get(key)) is not None:
+            return cached  # type: ignore[return-value]
 
-    root_node = Command(field=entry_point, cls=model, parent=None)
     try:
-        tokenize(model=model, sub_command=root_node)
+        root_node = compile_model(model, entry_point)
+        defaults = (
+            LayeredDefaults(env_prefix, config_files)
+            if env_prefix is not None or config_files
+            else None
+        )
     except ClipStickError as err:
-        _help.error(err)
-        sys.exit(1)
+        _exit_with_errors([err], error_output or output, diagnostics)
+
+    options = ParseOptions(
+        allow_abbrev=allow_abbrev,
+        validation_workers=validation_workers,
+        defaults=defaults,
+        output=output,
+        diagnostics=diagnostics,
+        stdin=stdin,
+    )
     try:
-        success, idx = root_node.match(0, args)
+        if fromfile_prefix:
+            arguments = lex(expand_response_files(args, fromfile_prefix))
+        else:
+            arguments = lex(args)
     except ClipStickError as err:
-        _help.error(err)
-        sys.exit(1)
-    if not idx == len(args) or not success:
-        _help.error("Unable to consume all provided arguments.")
-        _help.suggest_help()
-        sys.exit(1)
+        _exit_with_errors([err], error_output or output, diagnostics)
 
+    state = ParseState(root_node, arguments, options)
     try:
-        parsed = root_node.parse()
+        root_node.match(0, state)
     except ClipStickError as err:
-        _help.error(err)
-        sys.exit(1)
+        # a plugin subcommand that cannot be loaded.
+        _exit_with_errors([err], error_output or output, diagnostics)
+    # Validate even when matching has failed, to report all problems at once.
+    errors = state.errors
+    try:
+        parsed = root_node.parse(state)
+    except ParseErrors as err:
+        # may hold the errors found while matching, when nothing else failed.
+        reported = {id(error) for error in errors}
+        errors.extend(error for error in err.errors if id(error) not in reported)
+        _exit_with_errors(errors, error_output or output, diagnostics)
+    except ClipStickError as err:
+        _exit_with_errors([*errors, err], error_output or output, diagnostics)
+    if errors:
+        _exit_with_errors(errors, error_output or output, diagnostics)
 
+    if cache is not None and key is not None and is_cacheable(state):
+        cache.put(key, parsed)
     return parsed
+
+
+def _exit_with_errors(
+    errors: list[ClipStickError], output: Console | None, diagnostics: TDiagnostics
+) -> NoReturn:
+    if diagnostics == "json":
+        _diagnostics.write_errors(errors, output=output)
+    else:
+        _help.error(ParseErrors(errors), output=output)
+        if any(isinstance(error, UNMATCHED_ERRORS) for error in errors):
+            _help.suggest_help(output=output)
+    sys.exit(_diagnostics.EXIT_ERROR)
@@ -0,0 +1,318 @@
+"""Ahead-of-time generation of a standalone parser module.
+
+The generated module holds literal lookup tables for a single (compiled) model
+and a small driver to match arguments against those tables. At runtime it does not
+need clipstick: no tokenizing, no type inspection and no help rendering. Importing
+the annotation markers (like `short`) of the model does not load the parser either.
+The pydantic model stays the source of truth; re-generate the module whenever the
+model changes.
+"""
+from __future__ import annotations
+
+import io
+from typing import Iterator
+
+from pydantic import BaseModel
+from rich.console import Console
+
+from clipstick import _help
+from clipstick._exceptions import ClipStickError
+from clipstick._parse import PluginSubcommand, compile_model
+from clipstick._tokens import (
+    Boolean,
+    Collection,
+    Command,
+    Optional,
+    Positional,
+    Subcommand,
+)
+
+DEFAULT_HELP_WIDTH = 80
+
+_HEADER = '''"""Parser for {import_path}.
+
+Generated by clipstick. Do not edit.
+Re-generate using: python -m clipstick precompile {import_path} --output <this file>
+"""
+from __future__ import annotations
+
+import sys
+from typing import Any, Iterator, NoReturn
+
+from pydantic import ValidationError
+
+{imports}
+'''
+
+_DRIVER = '''
+_HELP_KEYS = ("-h", "--help")
+
+
+def _exit_with_error(*lines: str) -> NoReturn:
+    print("ERROR:", *lines, sep="\\n")
+    sys.exit(1)
+
+
+def _unable_to_consume() -> NoReturn:
+    _exit_with_error(
+        "Unable to consume all provided arguments.", "Use the -h argument to help"
+    )
+
+
+_VALUE, _ATTACHED, _KEY, _HELP = range(4)
+
+
+def _iter_stdin() -> Iterator[str]:
+    separator = None
+    pending = b""
+    while chunk := sys.stdin.buffer.read(2**16):
+        if separator is None:
+            separator = b"\\0" if b"\\0" in chunk else b"\\n"
+        *items, pending = (pending + chunk).split(separator)
+        for item in items:
+            yield item.removesuffix(b"\\r").decode()
+    if pending:
+        yield pending.removesuffix(b"\\r").decode()
+
+
+def _lex(args: list[str]) -> tuple[list[str], list[int]]:
+    values: list[str] = []
+    kinds: list[int] = []
+    for idx, arg in enumerate(args):
+        if arg == "--":
+            values.extend(args[idx + 1 :])
+            kinds.extend([_VALUE] * (len(args) - idx - 1))
+            break
+        if arg in _HELP_KEYS:
+            kinds.append(_HELP)
+        elif arg.startswith("--") and "=" in arg:
+            key, _, value = arg.partition("=")
+            values.extend((key, value))
+            kinds.extend((_KEY, _ATTACHED))
+            continue
+        elif arg.startswith("-") and arg != "-":
+            kinds.append(_KEY)
+        else:
+            kinds.append(_VALUE)
+        values.append(arg)
+    return values, kinds
+
+
+def _match(
+    node_idx: int, idx: int, arguments: tuple[list[str], list[int]]
+) -> tuple[tuple, int]:
+    node = _NODES[node_idx]
+    keys = node["keys"]
+    positionals = node["positionals"]
+    values: dict[str, Any] = {}
+    used: dict[str, str] = {}
+    next_positional = 0
+    args, kinds = arguments
+    count = len(args)
+    while idx < count:
+        arg, kind = args[idx], kinds[idx]
+        if kind == _HELP:
+            sys.stdout.write(node["help"])
+            sys.exit(0)
+        if kind == _KEY and arg not in keys and arg in node["abbreviations"]:
+            candidates = node["abbreviations"][arg]
+            if len(candidates) > 1:
+                _exit_with_error(
+                    f"Ambiguous argument {arg!r}. Could be any of: {', '.join(candidates)}"
+                )
+            arg = args[idx] = candidates[0]
+        if kind == _KEY and arg in keys:
+            field, kind, flag = keys[arg]
+            used[field] = arg
+            if kind == "flag":
+                values[field] = flag
+                idx += 1
+                continue
+            if idx + 1 == count:
+                _exit_with_error(f"Missing a value for {arg!r}.")
+            if kind == "option":
+                values[field] = args[idx + 1]
+                idx += 2
+                continue
+            items = values.setdefault(field, [])
+            if args[idx + 1] == "-" and kinds[idx + 1] == _VALUE:
+                items.extend(_iter_stdin())
+                idx += 2
+                continue
+            items.append(args[idx + 1])
+            idx += 2
+            while kind == "variadic" and idx < count and kinds[idx] == _VALUE:
+                items.append(args[idx])
+                idx += 1
+        elif kind == _VALUE and next_positional < len(positionals):
+            field, used[field] = positionals[next_positional]
+            values[field] = arg
+            next_positional += 1
+            idx += 1
+        else:
+            break
+
+    for field, key in node["required"]:
+        if field not in values:
+            _exit_with_error(f"Missing a value for positional argument {key!r}")
+
+    child = None
+    if node["sub_commands"]:
+        child_idx = None
+        if idx < count and kinds[idx] == _VALUE:
+            child_idx = node["sub_commands"].get(args[idx])
+        if child_idx is None:
+            _unable_to_consume()
+        child, idx = _match(child_idx, idx + 1, arguments)
+    return (node, values, used, child), idx
+
+
+def _validate(matched: tuple) -> Any:
+    node, values, used, child = matched
+    if child is not None:
+        values[node["sub_field"]] = _validate(child)
+    try:
+        return node["cls"].model_validate(values)
+    except ValidationError as err:
+        errors = []
+        for error in err.errors():
+            if not error["loc"]:
+                # a model validator failed. There is no specific argument to blame.
+                text = "Invalid arguments"
+                if node["name"]:
+                    text += f" for {node['name']}"
+                errors.append(f"{text}. {error['msg']}")
+                continue
+            field = error["loc"][0]
+            text = f"Incorrect value for {used.get(field, field)}"
+            if node["name"]:
+                text += f" in {node['name']} "
+            errors.append(f"{text} ({error['input']!r}). {error['msg']}")
+        _exit_with_error(*errors)
+
+
+def parse(args: list[str] | None = None) -> {model}:
+    """Create an instance of {model} from the provided arguments.
+
+    Args:
+        args: The list of arguments. Defaults to `sys.argv`.
+    """
+    if args is None:
+        args = sys.argv[1:]
+    arguments = _lex(args)
+    matched, idx = _match(0, 0, arguments)
+    if idx != len(arguments[0]):
+        _unable_to_consume()
+    return _validate(matched)
+'''
+
+
+def generate(
+    model: type[BaseModel],
+    prog: str,
+    help_width: int = DEFAULT_HELP_WIDTH,
+    allow_abbrev: bool = False,
+) -> str:
+    """Generate the source code of a standalone parser module for a model.
+
+    Args:
+        model: The pydantic class the generated module parses arguments into.
+        prog: The name of the entrypoint as used in the (pre-rendered) help output.
+        help_width: The width used to pre-render help output.
+        allow_abbrev: Allow unambiguous abbreviations of long keys.
+
+    Returns:
+        Python source code.
+    """
+    root_node = compile_model(model, prog)
+
+    commands = list(_iter_commands(root_node))
+    node_indexes = {id(command): idx for idx, command in enumerate(commands)}
+
+    modules = sorted({command.cls.__module__ for command in commands})
+    header = _HEADER.format(
+        import_path=f"{model.__module__}:{model.__qualname__}",
+        imports="\n".join(f"import {module}" for module in modules),
+    )
+    nodes = "\n".join(
+        _node_source(command, node_indexes, help_width, allow_abbrev)
+        for command in commands
+    )
+    driver = _DRIVER.replace("{model}", _class_reference(model))
+    return f"{header}\n_NODES: list[dict[str, Any]] = [\n{nodes}\n]\n{driver}"
+
+
+def _iter_commands(command: Command | Subcommand) -> Iterator[Command | Subcommand]:
+    if isinstance(command, PluginSubcommand):
+        raise ClipStickError(
+            f"Plugin subcommand {command.name!r} cannot be part of a generated parser."
+        )
+    yield command
+    for sub_command in command.sub_commands:
+        yield from _iter_commands(sub_command)
+
+
+def _class_reference(cls: type[BaseModel]) -> str:
+    if "<locals>" in cls.__qualname__ or cls.__module__ == "__main__":
+        raise ClipStickError(
+            f"Model {cls.__qualname__!r} must be importable to generate a parser for it."
+        )
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _render_help(command: Command | Subcommand, width: int) -> str:
+    output = Console(file=io.StringIO(), width=width, record=True)
+    _help.help(command, output=output)
+    return "\n".join(line.rstrip() for line in output.export_text().split("\n"))
+
+
+def _node_source(
+    command: Command | Subcommand,
+    node_indexes: dict[int, int],
+    help_width: int,
+    allow_abbrev: bool,
+) -> str:
+    keys: dict[str, tuple[str, str, bool | None]] = {}
+    positionals: list[tuple[str, str]] = []
+    required: list[tuple[str, str]] = []
+
+    for token in command.tokens.values():
+        if isinstance(token, Positional):
+            positionals.append((token.field, token.user_keys[0]))
+        elif isinstance(token, Boolean):
+            for key in token.user_keys:
+                keys[key] = (
+                    token.field,
+                    "flag",
+                    key in token._true_keys + token._short_true_keys,
+                )
+        elif isinstance(token, Collection):
+            kind = "variadic" if token.variadic else "collection"
+            keys.update({key: (token.field, kind, None) for key in token.user_keys})
+        elif isinstance(token, Optional):
+            keys.update({key: (token.field, "option", None) for key in token.user_keys})
+
+        if token.required:
+            required.append((token.field, "/".join(token.user_keys)))
+
+    sub_commands = {
+        sub_command.user_keys[0]: node_indexes[id(sub_command)]
+        for sub_command in command.sub_commands
+    }
+    sub_field = command.sub_commands[0].field if command.sub_commands else None
+    name = command.user_keys[0] if isinstance(command, Subcommand) else None
+    abbreviations = command.abbreviations if allow_abbrev else {}
+
+    return (
+        "    {\n"
+        f'        "cls": {_class_reference(command.cls)},\n'
+        f'        "name": {name!r},\n'
+        f'        "keys": {keys!r},\n'
+        f'        "positionals": {tuple(positionals)!r},\n'
+        f'        "required": {tuple(required)!r},\n'
+        f'        "sub_field": {sub_field!r},\n'
+        f'        "sub_commands": {sub_commands!r},\n'
+        f'        "abbreviations": {abbreviations!r},\n'
+        f'        "help": {_render_help(command, help_width)!r},\n'
+        "    },"
+    )
@@ -0,0 +1,116 @@
+"""Concurrent validation of I/O bound collection items.
+
+Validating a `FilePath` or `DirectoryPath` requires a filesystem lookup per item.
+Items of these collections are validated on a thread pool first. The remainder of the
+model is validated by pydantic, skipping the already validated collections.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from typing import Annotated, Any, TypeVar, get_args, get_origin
+
+from pydantic import (
+    BaseModel,
+    SkipValidation,
+    TypeAdapter,
+    ValidationError,
+    create_model,
+)
+from pydantic.types import PathType
+from pydantic_core import InitErrorDetails
+
+from clipstick._validation import (
+    by_validation_key,
+    prefixed_errors,
+    supports_field_validation,
+    validate_fields,
+)
+
+TModel = TypeVar("TModel", bound=BaseModel)
+
+
+def _is_io_bound(annotation: Any) -> bool:
+    return get_origin(annotation) is Annotated and any(
+        isinstance(metadata, PathType) for metadata in annotation.__metadata__
+    )
+
+
+@cache
+def io_bound_fields(model: type[BaseModel]) -> tuple[str, ...]:
+    """Return all list and set fields of a model with I/O bound items."""
+    return tuple(
+        field
+        for field, field_info in model.model_fields.items()
+        if get_origin(field_info.annotation) in (list, set)
+        and _is_io_bound(get_args(field_info.annotation)[0])
+    )
+
+
+@cache
+def _item_adapter(model: type[BaseModel], field: str) -> TypeAdapter:
+    return TypeAdapter(get_args(model.model_fields[field].annotation)[0])
+
+
+@cache
+def _relaxed_model(model: type[BaseModel], fields: tuple[str, ...]) -> type[BaseModel]:
+    """Return a subclass of the model skipping validation of the provided fields."""
+    relaxed_fields: dict[str, Any] = {
+        field: (
+            Annotated[model.model_fields[field].annotation, SkipValidation],
+            model.model_fields[field],
+        )
+        for field in fields
+    }
+    return create_model(
+        model.__name__, __base__=model, __module__=model.__module__, **relaxed_fields
+    )
+
+
+def validate_concurrently(
+    model: type[TModel], values: dict[str, Any], workers: int
+) -> TModel:
+    """Validate the provided values into a model.
+
+    Args:
+        model: The model to validate.
+        values: The (raw) values to validate.
+        workers: The maximum number of threads validating collection items.
+
+    Raises:
+        ValidationError: when validation of one of the items or fields fails.
+    """
+    fields = tuple(field for field in io_bound_fields(model) if field in values)
+    values = dict(values)
+    errors: list[InitErrorDetails] = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for field in fields:
+            adapter = _item_adapter(model, field)
+            results = executor.map(
+                lambda item: _validate_item(adapter, item), values[field]
+            )
+            items = []
+            for idx, (item, item_error) in enumerate(results):
+                items.append(item)
+                if item_error is not None:
+                    errors.extend(prefixed_errors(item_error, field, idx))
+            is_set = get_origin(model.model_fields[field].annotation) is set
+            values[field] = set(items) if is_set else items
+    if errors:
+        raise ValidationError.from_exception_data(model.__name__, errors)
+
+    if supports_field_validation(model):
+        return validate_fields(model, values, validated=fields)
+    relaxed = _relaxed_model(model, fields).model_validate(
+        by_validation_key(model, values)
+    )
+    return model.model_construct(_fields_set=relaxed.model_fields_set, **dict(relaxed))
+
+
+def _validate_item(
+    adapter: TypeAdapter, item: Any
+) -> tuple[Any, ValidationError | None]:
+    try:
+        return adapter.validate_python(item), None
+    except ValidationError as err:
+        return item, err
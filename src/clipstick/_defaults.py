@@ -0,0 +1,128 @@
+"""Default values taken from environment variables and config files.
+
+Precedence is: provided arguments > environment variables > config files > model defaults.
+"""
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+
+from clipstick import _exceptions
+from clipstick._cache import read_json, write_json
+
+
+class LayeredDefaults:
+    """Default values of the tokens of all (nested) commands.
+
+    Values are looked up by the path of subcommand names leading to a command and
+    the field name. For example `("clone",), "depth"` looks up:
+
+    - environment variable `MY_CLI_CLONE_DEPTH` (with `MY_CLI_` as env prefix)
+    - key `depth` inside the `[clone]` table of a config file.
+    """
+
+    def __init__(
+        self, env_prefix: str | None = None, config_files: Iterable[str | Path] = ()
+    ) -> None:
+        """Init.
+
+        Args:
+            env_prefix: Prefix of the environment variables to take defaults from.
+                None to not use environment variables.
+            config_files: TOML or JSON config files. Values in later files take
+                precedence over values in earlier ones. Missing files are skipped.
+        """
+        self.env_prefix = env_prefix
+        self._config: dict[str, tuple[Any, str]] = {}
+        for config_file in config_files:
+            path = Path(config_file).expanduser()
+            for key, value in load_config(path).items():
+                self._config[key] = (value, f"{key} in {path}")
+
+    def get(self, path: tuple[str, ...], field: str) -> tuple[Any, str] | None:
+        """Return the default value of a field and a description of its source.
+
+        Args:
+            path: Names of the subcommands leading to the command holding the field.
+            field: The field name.
+
+        Returns:
+            The value and its source, or None when no default is available.
+        """
+        names = [_normalize(name) for name in (*path, field)]
+        if self.env_prefix is not None:
+            env_name = self.env_prefix + "_".join(names).upper()
+            if env_name in os.environ:
+                return os.environ[env_name], env_name
+        return self._config.get(".".join(names))
+
+
+def _normalize(name: str) -> str:
+    return name.replace("-", "_")
+
+
+def load_config(path: Path) -> dict[str, Any]:
+    """Return the flattened content of a config file.
+
+    Nested tables are flattened to dotted keys, like `clone.depth`.
+    Parsing is cached on disk, invalidated as soon as the file is modified.
+
+    Returns:
+        The flattened values. Empty when the file does not exist.
+
+    Raises:
+        InvalidConfigFile: when the file cannot be parsed.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return {}
+    resolved = str(path.resolve())
+    key = [resolved, stat.st_mtime_ns, stat.st_size]
+    cache_name = f"config-{hashlib.sha1(resolved.encode()).hexdigest()}.json"
+    cache = read_json(cache_name)
+    if isinstance(cache, dict) and cache.get("key") == key:
+        return cache["values"]
+
+    values = dict(_flatten(_read_config(path)))
+    write_json(cache_name, {"key": key, "values": values})
+    return values
+
+
+def _read_config(path: Path) -> Mapping[str, Any]:
+    try:
+        if path.suffix == ".toml":
+            # tomllib is only part of the standard library as of python 3.11.
+            try:
+                import tomllib
+            except ModuleNotFoundError:  # pragma: no cover
+                import tomli as tomllib  # type: ignore[no-redef, import-not-found]
+
+            with path.open("rb") as config_file:
+                return tomllib.load(config_file)
+        content = json.loads(path.read_text(encoding="utf-8"))
+    except ModuleNotFoundError as err:  # pragma: no cover
+        raise _exceptions.InvalidConfigFile(
+            str(path), "Install tomli to read toml files."
+        ) from err
+    except (OSError, ValueError) as err:
+        raise _exceptions.InvalidConfigFile(str(path), str(err)) from err
+    if not isinstance(content, dict):
+        raise _exceptions.InvalidConfigFile(str(path), "Expecting an object of values.")
+    return content
+
+
+def _flatten(content: Mapping[str, Any], prefix: str = "") -> Iterable[tuple[str, Any]]:
+    for key, value in content.items():
+        key = prefix + _normalize(key)
+        if isinstance(value, dict):
+            yield from _flatten(value, f"{key}.")
+        elif isinstance(value, (datetime.date, datetime.time)):
+            # keep the cache json serializable. Pydantic parses these just fine.
+            yield key, value.isoformat()
+        else:
+            yield key, value
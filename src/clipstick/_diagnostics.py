@@ -0,0 +1,137 @@
+"""Machine readable (JSON) help and error output.
+
+For tools wrapped by other programs. Help and errors are written as a single JSON
+document, built from the help data of the tokens and the errors, without rendering
+any rich output.
+"""
+from __future__ import annotations
+
+import json
+from inspect import cleandoc
+from typing import TYPE_CHECKING, Any, Final, Literal, Sequence
+
+from pydantic.alias_generators import to_snake
+
+from clipstick import _exceptions, _help
+
+if TYPE_CHECKING:  # pragma: no cover
+    from rich.console import Console
+
+    from clipstick._search import SearchEntry
+    from clipstick._tokens import Command, Subcommand
+
+TDiagnostics = Literal["text", "json"]
+
+DIAGNOSTICS_VERSION: Final[int] = 1
+"""Version of the JSON documents. Incremented on incompatible changes."""
+
+EXIT_HELP: Final[int] = 0
+"""Exit code after printing help output."""
+
+EXIT_ERROR: Final[int] = 1
+"""Exit code after printing errors, both for invalid arguments and invalid models."""
+
+
+def help_data(command: Command | Subcommand) -> dict[str, Any]:
+    """Return the help of a (sub)command as plain data."""
+    call_stack = reversed(list(_help.call_stack_from_tokens(command)))
+    tokens = command.tokens.values()
+    return {
+        "usage": " ".join("/".join(token.user_keys) for token in call_stack),
+        "description": cleandoc(command.cls.__doc__ or ""),
+        "arguments": [token.help() for token in tokens if token.required],
+        "options": [token.help() for token in tokens if not token.required],
+        "subcommands": [sub_command.help() for sub_command in command.sub_commands],
+    }
+
+
+def error_data(error: _exceptions.ClipStickError) -> list[dict[str, Any]]:
+    """Return an error as plain data.
+
+    A `FieldError` holding multiple validation errors results in one item per
+    validation error. A `ParseErrors` results in the items of all its errors.
+    """
+    if isinstance(error, _exceptions.ParseErrors):
+        return [item for nested in error.errors for item in error_data(nested)]
+    if isinstance(error, _exceptions.FieldError):
+        return [
+            {
+                "type": "field_error",
+                "message": str(message),
+                "argument_index": argument_index,
+                "command": list(error.command_path),
+                "loc": list(details["loc"]),
+                "input": details["input"],
+                "error_type": details["type"],
+            }
+            for message, argument_index, details in zip(
+                error.message, error.argument_indexes, error.details
+            )
+        ]
+    item = {
+        "type": to_snake(type(error).__name__),
+        "message": "\n".join(str(line) for line in error.message),
+        "argument_index": getattr(error, "argument_index", None),
+    }
+    if isinstance(error, _exceptions.UnknownArgument):
+        item["suggestions"] = error.suggestions
+    return [item]
+
+
+def write_help(command: Command | Subcommand, output: Console | None = None) -> None:
+    """Write the help of a (sub)command as a JSON document."""
+    _write(
+        {
+            "version": DIAGNOSTICS_VERSION,
+            "exit_code": EXIT_HELP,
+            "help": help_data(command),
+        },
+        output,
+    )
+
+
+def write_errors(
+    errors: Sequence[_exceptions.ClipStickError], output: Console | None = None
+) -> None:
+    """Write errors as a JSON document."""
+    _write(
+        {
+            "version": DIAGNOSTICS_VERSION,
+            "exit_code": EXIT_ERROR,
+            "errors": [item for error in errors for item in error_data(error)],
+        },
+        output,
+    )
+
+
+def write_search(
+    term: str, results: Sequence[SearchEntry], output: Console | None = None
+) -> None:
+    """Write the help entries matching a search term as a JSON document."""
+    _write(
+        {
+            "version": DIAGNOSTICS_VERSION,
+            "exit_code": EXIT_HELP,
+            "search": {
+                "term": term,
+                "results": [
+                    {
+                        "path": list(result.path),
+                        "usage": result.usage,
+                        "description": result.description,
+                    }
+                    for result in results
+                ],
+            },
+        },
+        output,
+    )
+
+
+def _write(document: dict[str, Any], output: Console | None) -> None:
+    # Write to the file of the console directly. Nothing is rendered by rich.
+    file = (output or _help.console).file
+    # Invalid input values are not necessarily json serializable.
+    file.write(json.dumps(document, default=repr))
+    file.write("\n")
+    file.flush()
@@ -0,0 +1,55 @@
+from typing import Any, Callable, Iterator, Mapping
+
+from pydantic import BaseModel
+
+from clipstick._exceptions import InvalidHandler, NoHandlerFound
+from clipstick._imports import import_object
+
+THandler = Callable[[Any], Any]
+
+
+def dispatch(
+    model: BaseModel, handlers: Mapping[type[BaseModel], str | THandler]
+) -> Any:
+    """Call the handler bound to the subcommand selected by the user.
+
+    Handlers referenced by an import path are only imported when their
+    subcommand is selected. A cli with many subcommands only imports the
+    code it actually runs.
+
+    Example:
+        >>> handlers = {Clone: "my_git.clone:run", Merge: "my_git.merge:run"}
+        >>> dispatch(parse(MyGit), handlers)
+
+    Args:
+        model: The parsed model (the result of a `parse` call).
+        handlers: Subcommand models bound to a handler. A handler is either
+            a callable or the import path to a callable (`package.module:function`).
+            The handler is called with the selected (sub)model as argument.
+
+    Returns:
+        The return value of the handler.
+
+    Raises:
+        NoHandlerFound: when no handler is bound to any model in the selected branch.
+        InvalidImportPath: when the import path of the selected handler cannot be resolved.
+        InvalidHandler: when the selected handler is not callable.
+    """
+    # the deepest selected subcommand wins.
+    for selected in reversed(list(_selected_branch(model))):
+        if (bound := handlers.get(type(selected))) is None:
+            continue
+        handler = import_object(bound) if isinstance(bound, str) else bound
+        if not callable(handler):
+            raise InvalidHandler(type(selected), bound)
+        return handler(selected)
+    raise NoHandlerFound(type(model))
+
+
+def _selected_branch(model: BaseModel) -> Iterator[BaseModel]:
+    """Return the provided model and all of its selected (nested) subcommands."""
+    yield model
+    for field in type(model).model_fields:
+        if isinstance(value := getattr(model, field), BaseModel):
+            yield from _selected_branch(value)
+            return
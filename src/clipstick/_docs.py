@@ -0,0 +1,189 @@
+"""Render the help of all (nested) commands of a cli in a single process.
+
+Useful to generate reference documentation or man pages, instead of running
+the cli with `-h` for every subcommand.
+"""
+from __future__ import annotations
+
+import io
+from inspect import cleandoc
+from typing import Any, Callable, Iterator, Literal
+
+from pydantic import BaseModel
+from rich.console import Console
+
+from clipstick import _help
+from clipstick._diagnostics import help_data
+from clipstick._parse import PluginSubcommand, compile_model
+from clipstick._tokens import Command, Subcommand, THelp
+
+TFormat = Literal["text", "ansi", "markdown", "roff"]
+
+
+def render_help(
+    model: type[BaseModel], prog: str, format: TFormat = "text", width: int = 80
+) -> dict[tuple[str, ...], str]:
+    """Render the help of every (sub)command of a model.
+
+    Args:
+        model: The pydantic model of the main command.
+        prog: The name of the cli as shown in help output.
+        format: `text` and `ansi` render the help output as printed with `-h`, without
+            or with colors. `markdown` renders a markdown page, `roff` a man page.
+        width: The width of `text` and `ansi` output.
+
+    Returns:
+        The help of every command, by the names of the subcommands leading to it.
+        The help of the main command is stored under `()`.
+
+    Raises:
+        ClipStickError: when the model cannot be used as a cli.
+    """
+    root = compile_model(model, prog)
+    if format in ("text", "ansi"):
+        render = _console_renderer(width, ansi=format == "ansi")
+    else:
+        render = _RENDERERS[format]
+    return {command.path: render(command) for command in _iter_commands(root)}
+
+
+def _iter_commands(command: Command | Subcommand) -> Iterator[Command | Subcommand]:
+    if isinstance(command, PluginSubcommand):
+        command.load()
+    yield command
+    for sub_command in command.sub_commands:
+        yield from _iter_commands(sub_command)
+
+
+def _console_renderer(width: int, ansi: bool) -> Callable[[Command | Subcommand], str]:
+    # A single console, reused for all commands.
+    file = io.StringIO()
+    console = Console(
+        file=file,
+        width=width,
+        force_terminal=ansi,
+        color_system="standard" if ansi else None,
+    )
+
+    def render(command: Command | Subcommand) -> str:
+        file.seek(0)
+        file.truncate()
+        _help.help(command, output=console)
+        return file.getvalue()
+
+    return render
+
+
+def _summary(description: str) -> str:
+    """Return the first line of a description."""
+    return cleandoc(description).split("\n")[0]
+
+
+def _markdown_cell(value: str) -> str:
+    return value.replace("|", "\\|").replace("\n", " ")
+
+
+def _markdown_table(header: str, rows: list[THelp]) -> list[str]:
+    lines = [
+        f"## {header}",
+        "",
+        f"| {header[:-1]} | Description | Type | Default |",
+        "| --- | --- | --- | --- |",
+    ]
+    for row in rows:
+        cells = (row["arguments"], row["description"], row["type"], row["default"])
+        lines.append("| " + " | ".join(_markdown_cell(cell) for cell in cells) + " |")
+    lines.append("")
+    return lines
+
+
+def _markdown(command: Command | Subcommand) -> str:
+    data = help_data(command)
+    lines = [f"# {data['usage']}", ""]
+    if data["description"]:
+        lines.extend((data["description"], ""))
+    if data["arguments"]:
+        lines.extend(_markdown_table("Arguments", data["arguments"]))
+    if data["options"]:
+        lines.extend(_markdown_table("Options", data["options"]))
+    if data["subcommands"]:
+        lines.extend(("## Subcommands", ""))
+        for sub_command in data["subcommands"]:
+            line = f"- `{sub_command['arguments']}`"
+            if summary := _summary(sub_command["description"]):
+                line = f"{line}: {summary}"
+            lines.append(line)
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _roff_escape(value: str) -> str:
+    escaped = value.replace("\\", "\\e").replace("-", "\\-")
+    # a leading dot or quote would be read as a roff request.
+    return "\n".join(
+        f"\\&{line}" if line.startswith((".", "'")) else line
+        for line in escaped.split("\n")
+    )
+
+
+def _roff_items(header: str, rows: list[THelp]) -> list[str]:
+    lines = [f".SH {header}"]
+    for row in rows:
+        details = " ".join(
+            f"[{value}]" for value in (row["type"], row["default"]) if value
+        )
+        description = " ".join(part for part in (row["description"], details) if part)
+        lines.extend(
+            (".TP", f".B {_roff_escape(row['arguments'])}", _roff_escape(description))
+        )
+    return lines
+
+
+def _roff(command: Command | Subcommand) -> str:
+    data: dict[str, Any] = help_data(command)
+    usage: str = data["usage"]
+    summary = _summary(data["description"])
+    lines = [
+        f'.TH "{_roff_escape(usage.replace(" ", "-").upper())}" 1',
+        ".SH NAME",
+        _roff_escape(f"{usage} - {summary}" if summary else usage),
+        ".SH SYNOPSIS",
+        f".B {_roff_escape(usage)}",
+    ]
+    synopsis = [
+        part
+        for part, present in (
+            ("[Arguments]", data["arguments"]),
+            ("[Options]", data["options"]),
+            ("[Subcommands]", data["subcommands"]),
+        )
+        if present
+    ]
+    if synopsis:
+        lines.append(" ".join(synopsis))
+    if data["description"]:
+        paragraphs = data["description"].split("\n\n")
+        lines.append(".SH DESCRIPTION")
+        lines.append("\n.PP\n".join(_roff_escape(text) for text in paragraphs))
+    if data["arguments"]:
+        lines.extend(_roff_items("ARGUMENTS", data["arguments"]))
+    if data["options"]:
+        lines.extend(_roff_items("OPTIONS", data["options"]))
+    if data["subcommands"]:
+        sub_commands = [
+            THelp(
+                arguments=sub_command["arguments"],
+                description=_summary(sub_command["description"]),
+                type="",
+                default="",
+            )
+            for sub_command in data["subcommands"]
+        ]
+        lines.extend(_roff_items("SUBCOMMANDS", sub_commands))
+    return "\n".join(lines) + "\n"
+
+
+_RENDERERS: dict[str, Callable[[Command | Subcommand], str]] = {
+    "markdown": _markdown,
+    "roff": _roff,
+}
@@ -1,20 +1,89 @@
 import ast
 import inspect
-import textwrap
+import linecache
+import os
+import sys
+from functools import cache
 
 from pydantic import BaseModel
 
 
-def set_undefined_field_descriptions_from_var_docstrings(
-    model: type[BaseModel],
-) -> None:
-    module = ast.parse(textwrap.dedent(inspect.getsource(model)))
-    assert isinstance(module, ast.Module)
-    class_def = module.body[0]
-    assert isinstance(class_def, ast.ClassDef)
-    if len(class_def.body) < 2:
-        return
+class _ClassCollector(ast.NodeVisitor):
+    """Collect all class definitions of a module by their qualified name.
 
+    Named like `inspect` does when looking up the source of a class, including
+    classes defined in functions (`function.<locals>.Class`).
+    """
+
+    def __init__(self) -> None:
+        self.stack: list[str] = []
+        self.classes: dict[str, ast.ClassDef] = {}
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        self.stack.extend((node.name, "<locals>"))
+        self.generic_visit(node)
+        del self.stack[-2:]
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.stack.append(node.name)
+        # the first definition wins, like it does for `inspect.getsource`.
+        self.classes.setdefault(".".join(self.stack), node)
+        self.generic_visit(node)
+        self.stack.pop()
+
+
+@cache
+def _class_definitions(
+    file: str, version: tuple[int, int] | None
+) -> dict[str, ast.ClassDef]:
+    """Return all class definitions in a source file.
+
+    Parsed once per version of a file. Looking up the source of every model
+    separately parses the complete module for each of them.
+    """
+    collector = _ClassCollector()
+    collector.visit(ast.parse("".join(linecache.getlines(file))))
+    return collector.classes
+
+
+def _class_definition(model: type[BaseModel]) -> ast.ClassDef | None:
+    try:
+        file = inspect.getsourcefile(model)
+    except TypeError:
+        return None
+    if file is None:
+        return None
+    module = sys.modules.get(model.__module__)
+    # like inspect does, so an edited source file is read again.
+    linecache.checkcache(file)
+    # populates the line cache, also for modules imported by a loader (like zipimport).
+    if not linecache.getlines(file, module.__dict__ if module else None):
+        return None
+    return _class_definitions(file, _file_version(file)).get(model.__qualname__)
+
+
+def _file_version(file: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(file)
+    except OSError:
+        # not a file on disk, like a module imported from a zip file.
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def field_docstrings(model: type[BaseModel]) -> dict[str, str]:
+    """Return the variable docstrings of all fields of a model.
+
+    A model without available source code (like a model created with `create_model`)
+    has no docstrings.
+    """
+    class_def = _class_definition(model)
+    if class_def is None:
+        return {}
+
+    docstrings: dict[str, str] = {}
     for last, node in zip(class_def.body, class_def.body[1:]):
         if not (
             isinstance(last, ast.AnnAssign)
@@ -23,14 +92,9 @@ def set_undefined_field_descriptions_from_var_docstrings(
         ):
             continue
 
-        info = model.model_fields[last.target.id]
-        if info.description is not None:
-            continue
-
         doc_node = node.value
         if isinstance(doc_node, ast.Constant):
-            docstring = doc_node.value  # 'regular' variable doc string
+            docstrings[last.target.id] = doc_node.value  # 'regular' variable doc string
         else:
             raise NotImplementedError(doc_node)  # pragma: nocover
-
-        info.description = docstring
+    return docstrings
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
+from pydantic_core import ErrorDetails
 from rich.console import Console, ConsoleOptions, RenderResult
 from rich.text import Text
 
 from clipstick import _tokens
 from clipstick._style import ARGUMENTS_STYLE
+from clipstick._validation import validated_fields
 
 
 class ClipStickError(Exception):
@@ -23,6 +25,18 @@ class ClipStickError(Exception):
         return str(self.message)
 
 
+class ParseErrors(ClipStickError):
+    """All problems found while parsing the provided arguments.
+
+    Attributes:
+        errors: The individual errors, in the order they were found.
+    """
+
+    def __init__(self, errors: list[ClipStickError]) -> None:
+        super().__init__(*(line for error in errors for line in error.message))
+        self.errors = errors
+
+
 class MissingPositional(ClipStickError):
     """Raised when an incorrect number of positionals is provided."""
 
@@ -35,6 +49,129 @@ class MissingPositional(ClipStickError):
         )
 
 
+class MissingOptionValue(ClipStickError):
+    """Raised when an option is provided as the last argument, without a value."""
+
+    def __init__(self, key: str, argument_index: int) -> None:
+        super().__init__(
+            Text.assemble(
+                "Missing a value for option ", Text(f"{key!r}", style=ARGUMENTS_STYLE)
+            )
+        )
+        self.argument_index = argument_index
+
+
+class MissingSubcommand(ClipStickError):
+    """Raised when a command requires a subcommand, but none is provided."""
+
+    def __init__(self, choices: list[str]) -> None:
+        super().__init__(
+            Text.assemble(
+                "Missing a subcommand. Choose from: ",
+                Text(", ".join(choices), style=ARGUMENTS_STYLE),
+            )
+        )
+
+
+class UnmatchedArgument(ClipStickError):
+    """Raised when a provided argument cannot be matched to any of the tokens.
+
+    Attributes:
+        argument_index: The index of the provided argument.
+    """
+
+    argument_index: int
+
+
+class UnknownArgument(UnmatchedArgument):
+    """Raised when a provided key or subcommand name does not exist."""
+
+    def __init__(
+        self, argument: str, argument_index: int, suggestions: list[str]
+    ) -> None:
+        text = Text.assemble(Text(argument, ARGUMENTS_STYLE), " is unknown.")
+        for idx, suggestion in enumerate(suggestions):
+            if not idx:
+                text.append(" Did you mean ")
+            else:
+                text.append(" or " if idx == len(suggestions) - 1 else ", ")
+            text.append(suggestion, ARGUMENTS_STYLE)
+        if suggestions:
+            text.append("?")
+        super().__init__(text)
+        self.argument_index = argument_index
+        self.suggestions = suggestions
+
+
+class UnexpectedArgument(UnmatchedArgument):
+    """Raised when a provided value is not expected by any of the tokens."""
+
+    def __init__(
+        self, argument: str, argument_index: int, key: str | None = None
+    ) -> None:
+        text = Text.assemble(
+            "Unexpected value ", Text(f"{argument!r}", ARGUMENTS_STYLE)
+        )
+        if key is not None:
+            text.append_text(Text.assemble(" for ", Text(key, ARGUMENTS_STYLE)))
+        super().__init__(text)
+        self.argument_index = argument_index
+
+
+def _argument_index(
+    state: _tokens.ParseState,
+    token: _tokens.Positional | _tokens.Optional | _tokens.Collection | _tokens.Boolean,
+    loc: tuple[int | str, ...],
+) -> int | None:
+    idx = token.value_index(loc, state)
+    if idx is None:
+        return None
+    return state.arguments.source_index(idx)
+
+
+class InvalidResponseFile(ClipStickError):
+    """Raised when a response file cannot be read."""
+
+    def __init__(self, path: str, reason: str) -> None:
+        super().__init__(
+            Text.assemble(
+                "Unable to read arguments from ",
+                Text(f"{path!r}", style=ARGUMENTS_STYLE),
+                f". {reason}",
+            )
+        )
+
+
+class InvalidConfigFile(ClipStickError):
+    """Raised when a config file cannot be parsed."""
+
+    def __init__(self, path: str, reason: str) -> None:
+        super().__init__(
+            Text.assemble(
+                "Unable to read config file ",
+                Text(f"{path!r}", style=ARGUMENTS_STYLE),
+                f". {reason}",
+            )
+        )
+
+
+class AmbiguousAbbreviation(UnmatchedArgument):
+    """Raised when an abbreviated key matches multiple keys."""
+
+    def __init__(
+        self, key: str, candidates: tuple[str, ...], argument_index: int = 0
+    ) -> None:
+        super().__init__(
+            Text.assemble(
+                "Ambiguous argument ",
+                Text(f"{key!r}", style=ARGUMENTS_STYLE),
+                ". Could be any of: ",
+                Text(", ".join(candidates), style=ARGUMENTS_STYLE),
+            )
+        )
+        self.argument_index = argument_index
+
+
 class InvalidModel(ClipStickError):
     """Raised when your clipstick model is invalid."""
 
@@ -61,6 +198,80 @@ class InvalidUnion(InvalidModel):
         )
 
 
+class InvalidModelErrors(InvalidModel):
+    """All problems found by the static analysis of a model.
+
+    Attributes:
+        errors: The individual problems, in the order of the command tree.
+    """
+
+    def __init__(self, errors: list[InvalidModel]) -> None:
+        super().__init__(*(line for error in errors for line in error.message))
+        self.errors = errors
+
+
+class NestedModelField(InvalidModel):
+    """Raised when a field is a model, but not a union of models (a subcommand)."""
+
+    def __init__(self, model: type, field: str) -> None:
+        super().__init__(
+            f"Field {field!r} of {model.__name__!r} is a model, but not a subcommand. "
+            "Use a union of models to define subcommands."
+        )
+
+
+class SubcommandNotLast(InvalidModel):
+    """Raised when a subcommand field is followed by other fields."""
+
+    def __init__(self, model: type, field: str) -> None:
+        super().__init__(
+            f"Subcommand {field!r} of {model.__name__!r} must be the last field."
+        )
+
+
+class DuplicateKey(InvalidModel):
+    """Raised when multiple fields of a model are provided using the same key.
+
+    Like a `no_verbose` field colliding with the negated key of a `verbose` flag.
+    """
+
+    def __init__(self, model: type, key: str, fields: list[str]) -> None:
+        super().__init__(
+            f"Key {key!r} of {model.__name__!r} is used by multiple fields: "
+            f"{', '.join(repr(field) for field in fields)}."
+        )
+
+
+class ReservedKey(InvalidModel):
+    """Raised when the key of a field is reserved for help output."""
+
+    def __init__(self, model: type, key: str, field: str) -> None:
+        super().__init__(
+            f"Key {key!r} of field {field!r} of {model.__name__!r} is reserved "
+            "for help output."
+        )
+
+
+class DuplicateSubcommand(InvalidModel):
+    """Raised when multiple subcommands of a command have the same name."""
+
+    def __init__(self, model: type, name: str) -> None:
+        super().__init__(
+            f"Subcommand {name!r} of {model.__name__!r} is defined multiple times."
+        )
+
+
+class UnreachableChoice(InvalidModel):
+    """Raised when choices of a positional can never be provided, as arguments are strings."""
+
+    def __init__(self, model: type, field: str, choices: list[object]) -> None:
+        super().__init__(
+            f"Choices {', '.join(repr(choice) for choice in choices)} of field "
+            f"{field!r} of {model.__name__!r} can never be provided as an argument. "
+            "Use string choices."
+        )
+
+
 class TooManyShortsException(ClipStickError):
     def __init__(self, model, shorts: list[str]) -> None:
         super().__init__("too many shorts defined inside model")
@@ -71,35 +282,122 @@ class TooManyShortsException(ClipStickError):
         return f"{self.message}, model={self._model}, shorts={self._shorts}"
 
 
+class InvalidImportPath(ClipStickError):
+    """Raised when an import path cannot be resolved."""
+
+    def __init__(self, path: str, reason: str = "") -> None:
+        message = f"Unable to import {path!r}. Use the form 'package.module:Object'."
+        if reason:
+            message = f"{message} ({reason})"
+        super().__init__(message)
+
+
+class InvalidPlugin(ClipStickError):
+    """Raised when a plugin entry point does not reference a pydantic model."""
+
+    def __init__(self, name: str, target: str) -> None:
+        super().__init__(
+            f"Plugin {name!r} ({target}) does not reference a pydantic model."
+        )
+
+
+class NoHandlerFound(ClipStickError):
+    """Raised when no handler is bound to the selected subcommand."""
+
+    def __init__(self, model: type) -> None:
+        super().__init__(
+            f"No handler found for the selected subcommand of {model.__name__!r}."
+        )
+
+
+class InvalidHandler(ClipStickError):
+    """Raised when the handler bound to the selected subcommand is not callable."""
+
+    def __init__(self, model: type, handler: object) -> None:
+        super().__init__(
+            f"Handler {handler!r} bound to {model.__name__!r} is not callable."
+        )
+
+
+class UnknownField(ClipStickError):
+    """Raised when a value is provided for a field none of the selected commands has."""
+
+    def __init__(self, field: str, fields: list[str]) -> None:
+        super().__init__(
+            f"None of the selected commands has a field {field!r}. "
+            f"Choose from: {', '.join(fields)}."
+        )
+
+
+class AmbiguousField(ClipStickError):
+    """Raised when multiple selected commands have a field with the provided name."""
+
+    def __init__(self, field: str, models: list[type]) -> None:
+        super().__init__(
+            f"Field {field!r} is ambiguous. It is a field of: "
+            f"{', '.join(model.__name__ for model in models)}."
+        )
+
+
 class FieldError(ClipStickError):
-    """A pydantic validation error wrapper."""
+    """A pydantic validation error wrapper.
+
+    Attributes:
+        argument_indexes: For each error, the index of the provided argument causing it.
+            None if the value was not provided as an argument.
+        details: For each error, the pydantic error details.
+        command_path: The names of the subcommands leading to the failing command.
+    """
 
     def __init__(
         self,
         exception: ValidationError,
         token: _tokens.Command | _tokens.Subcommand,
+        state: _tokens.ParseState,
     ) -> None:
         errors: list[str | Text] = []
+        self.argument_indexes: list[int | None] = []
+        self.details: list[ErrorDetails] = []
+        self.command_path = token.path
+        model: type[BaseModel] = token.cls
+        fields = validated_fields(model)
         for error in exception.errors():
-            input = error["input"]
-            error_msg = error["msg"]
-            # todo: most of times I need just the fist item.
-            # Have not encountered a situation where I need something else,
-            # but it will need some investigating though.
-            failing_field = error["loc"][0]
-            assert isinstance(failing_field, str)
+            loc = error["loc"]
+            # the field of an aliased value is validated by its alias.
+            failing_field = str(fields.get(str(loc[0]), loc[0])) if loc else ""
+            if error["type"] == "missing" and failing_field in state.missing:
+                # Missing arguments and subcommands are already reported while matching.
+                continue
+            if not loc:
+                # A model validator failed. There is no specific argument to blame.
+                error_text = Text("Invalid arguments")
+                if isinstance(token, _tokens.Subcommand):
+                    error_text.append(f" for {token.user_keys[0]}")
+                error_text.append(f". {error['msg']}")
+                errors.append(error_text)
+                self.argument_indexes.append(None)
+                self.details.append(error)
+                continue
+
             # find the token by using the input value (which is the key) that is causing the exception.
             error_text = Text("Incorrect value for ")
 
-            failing_token = token.tokens[failing_field]
+            failing_token = token.tokens.get(failing_field)
+            self.argument_indexes.append(
+                None
+                if failing_token is None
+                else _argument_index(state, failing_token, loc[1:])
+            )
 
-            error_text.append(Text(failing_token.used_arg, style=ARGUMENTS_STYLE))
+            used_arg = state.used_args.get(failing_field, failing_field)
+            error_text.append(Text(used_arg, style=ARGUMENTS_STYLE))
 
             # this token relates to a positional argument.
             if isinstance(token, _tokens.Subcommand):
                 error_text.append(f" in {token.user_keys[0]} ")
 
-            error_text.append(f" ({input!r}). {error_msg}")
+            error_text.append(f" ({error['input']!r}). {error['msg']}")
             errors.append(error_text)
+            self.details.append(error)
 
         super().__init__(*errors)
@@ -8,9 +8,7 @@ from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 
-from clipstick._exceptions import ClipStickError
 from clipstick._style import ARGUMENT_HEADER, ARGUMENTS_STYLE, DOCSTRING, ERROR
-from clipstick._tokens import THelp
 
 # If you want to capture console output and set a width to properly word-wrap it,
 # you can set this env variable.
@@ -20,19 +18,50 @@ record_width = os.getenv("CLIPSTICK_CONSOLE_WIDTH")
 console = Console(width=int(record_width) if record_width else None)
 
 if TYPE_CHECKING:  # pragma: no cover
-    from clipstick._tokens import Command, Subcommand
+    from clipstick._exceptions import ClipStickError
+    from clipstick._search import SearchEntry
+    from clipstick._tokens import Command, Subcommand, THelp
 
 
-def suggest_help():
+def suggest_help(output: Console | None = None):
     suggest_help = Text.assemble(
         "Use the", Text("-h", ARGUMENTS_STYLE), " argument to help"
     )
-    console.print(suggest_help)
+    (output or console).print(suggest_help)
 
 
-def error(message: Text | str | ClipStickError):
-    console.print("ERROR:", style=ERROR)
-    console.print(message)
+def error(message: Text | str | ClipStickError, output: Console | None = None):
+    output = output or console
+    output.print("ERROR:", style=ERROR)
+    output.print(message)
+
+
+def search_results(
+    term: str, results: list[SearchEntry], output: Console | None = None
+) -> None:
+    """Print the help entries matching a search term."""
+    output = output or console
+    output.print("")
+    if not results:
+        output.print(
+            Text.assemble("No help found for ", Text(repr(term), ARGUMENTS_STYLE))
+        )
+        return
+    output.print(
+        Text.assemble("Help matching ", Text(repr(term), ARGUMENTS_STYLE), ":"),
+        style=ARGUMENT_HEADER,
+    )
+    tbl = Table.grid(collapse_padding=True, padding=(0, 1))
+    tbl.add_column(width=2)  # empty column
+    tbl.add_column(min_width=20)  # usage
+    tbl.add_column()  # description
+    for result in results:
+        tbl.add_row(
+            "",
+            Text(result.usage, ARGUMENTS_STYLE),
+            Text(result.description.split("\n")[0]),
+        )
+    output.print(tbl)
 
 
 def _help_from_token(help_info: THelp, short=False) -> tuple[Text, Text]:
@@ -52,7 +81,14 @@ def _help_from_token(help_info: THelp, short=False) -> tuple[Text, Text]:
     return args, txt
 
 
-def help(command: Command | Subcommand) -> None:
+def help(command: Command | Subcommand, output: Console | None = None) -> None:
+    """Print help for a (sub)command.
+
+    Args:
+        command: The command to print the help for.
+        output: The console to print to. Defaults to the module console.
+    """
+    output = output or console
     indent = 2
     min_args_width = 20
     call_stack = list(call_stack_from_tokens(command))
@@ -63,7 +99,7 @@ def help(command: Command | Subcommand) -> None:
 
     # print the first usage line
     # example: dummy-entrypoint second-level-model-one [Options] [Subcommands]
-    console.print("")
+    output.print("")
     usage_line = Text.assemble(Text("Usage: ", style="bold"), entry_point)
 
     arguments = [token for token in command.tokens.values() if token.required]
@@ -74,16 +110,16 @@ def help(command: Command | Subcommand) -> None:
         usage_line.append(" [Options]")
     if command.sub_commands:
         usage_line.append(" [Subcommands]")
-    console.print(usage_line)
+    output.print(usage_line)
 
     # the class docstring as general help
     if command.cls.__doc__:
-        console.print("")
-        console.print(Text(cleandoc(command.cls.__doc__), style=DOCSTRING))
+        output.print("")
+        output.print(Text(cleandoc(command.cls.__doc__), style=DOCSTRING))
 
     if arguments:
-        console.print("")
-        console.print("Arguments:", style=ARGUMENT_HEADER)
+        output.print("")
+        output.print("Arguments:", style=ARGUMENT_HEADER)
         for arg in arguments:
             tbl = Table.grid(collapse_padding=True, padding=(0, 1))
             tbl.add_column(width=indent)  # empty column
@@ -91,20 +127,20 @@ def help(command: Command | Subcommand) -> None:
             tbl.add_column()
 
             tbl.add_row("", *_help_from_token(arg.help()))
-            console.print(tbl)
+            output.print(tbl)
     if options:
-        console.print("")
-        console.print("Options:", style=ARGUMENT_HEADER)
+        output.print("")
+        output.print("Options:", style=ARGUMENT_HEADER)
         for kwarg in options:
             tbl = Table.grid(collapse_padding=True, padding=(0, 1))
             tbl.add_column(width=indent)  # empty column
             tbl.add_column(min_width=min_args_width)  # keys
             tbl.add_column()  # description
             tbl.add_row("", *_help_from_token(kwarg.help()))
-            console.print(tbl)
+            output.print(tbl)
     if command.sub_commands:
-        console.print("")
-        console.print("Subcommands:", style=ARGUMENT_HEADER)
+        output.print("")
+        output.print("Subcommands:", style=ARGUMENT_HEADER)
 
         for sub_command in command.sub_commands:
             tbl = Table.grid(collapse_padding=True, padding=(0, 1))
@@ -113,7 +149,7 @@ def help(command: Command | Subcommand) -> None:
             tbl.add_column()  # description
 
             tbl.add_row("", *_help_from_token(sub_command.help(), short=True))
-            console.print(tbl)
+            output.print(tbl)
 
 
 def call_stack_from_tokens(
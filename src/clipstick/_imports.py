@@ -0,0 +1,28 @@
+from importlib import import_module
+
+from clipstick._exceptions import InvalidImportPath
+
+
+def import_object(path: str) -> object:
+    """Import an object referenced by an import path.
+
+    Args:
+        path: Import path in the form of `package.module:Object`.
+            Nested attributes are allowed: `package.module:Object.attribute`.
+
+    Returns:
+        The imported object.
+
+    Raises:
+        InvalidImportPath: when the path cannot be resolved.
+    """
+    module_name, _, attributes = path.partition(":")
+    if not module_name or not attributes:
+        raise InvalidImportPath(path)
+    try:
+        obj: object = import_module(module_name)
+        for attribute in attributes.split("."):
+            obj = getattr(obj, attribute)
+    except (ImportError, AttributeError) as err:
+        raise InvalidImportPath(path, str(err)) from err
+    return obj
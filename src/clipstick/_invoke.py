@@ -0,0 +1,87 @@
+"""Create a model from python values instead of arguments.
+
+For tools calling each other's subcommands in-process. Values are not converted to
+arguments and parsed back, but validated once, like when creating the models directly.
+"""
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+from pydantic import BaseModel
+
+from clipstick._clipstick import DUMMY_ENTRY_POINT
+from clipstick._exceptions import (
+    AmbiguousField,
+    MissingSubcommand,
+    UnknownArgument,
+    UnknownField,
+)
+from clipstick._parse import PluginSubcommand, compile_model
+from clipstick._tokens import Command, TPydanticModel
+
+
+def invoke(
+    model: type[TPydanticModel], path: str | Sequence[str] = (), /, **values: Any
+) -> TPydanticModel:
+    """Create an instance of the provided model from python values.
+
+    The equivalent of parsing arguments, using the selected subcommands and the
+    values of their fields directly. Fields without a value take their default.
+
+    Example:
+        >>> invoke(MyGit, "clone", repo="my_repo", depth=3)
+        MyGit(verbose=False, sub_command=Clone(repo='my_repo', depth=3))
+
+    Args:
+        model: The pydantic class we want to populate.
+        path: The names of the selected (nested) subcommands, like `("remote", "add")`.
+            A string is split on whitespace, like `"remote add"`.
+        values: The values of the fields of the main command and of the selected
+            subcommands, by field name.
+
+    Returns:
+        An instance of the provided model with the selected subcommands.
+
+    Raises:
+        ClipStickError: when the model cannot be used as a cli.
+        UnknownArgument: when a subcommand in the path does not exist.
+        MissingSubcommand: when the path ends at a command requiring a subcommand.
+        UnknownField: when none of the selected commands has a field with a provided name.
+        AmbiguousField: when multiple selected commands have a field with a provided name.
+        ValidationError: when any of the values is invalid or a required value is missing.
+    """
+    if isinstance(path, str):
+        path = path.split()
+    commands: list[Command] = [compile_model(model, DUMMY_ENTRY_POINT)]
+    for idx, name in enumerate(path):
+        command = commands[-1]
+        sub_command = command.sub_command_keys.get(name)
+        if sub_command is None:
+            raise UnknownArgument(name, idx, command.suggestions.suggest(name))
+        if isinstance(sub_command, PluginSubcommand):
+            sub_command.load()
+        commands.append(sub_command)
+    if commands[-1].sub_commands:
+        raise MissingSubcommand(list(commands[-1].sub_command_keys))
+
+    command_values: list[dict[str, Any]] = [{} for _ in commands]
+    for field, value in values.items():
+        owners = [
+            idx for idx, command in enumerate(commands) if field in command.tokens
+        ]
+        if not owners:
+            raise UnknownField(
+                field, [field for command in commands for field in command.tokens]
+            )
+        if len(owners) > 1:
+            raise AmbiguousField(field, [commands[idx].cls for idx in owners])
+        command_values[owners[0]][field] = value
+
+    # the deepest subcommand first, as it is the value of the subcommand field of its parent.
+    selected: BaseModel | None = None
+    for command, provided in zip(reversed(commands), reversed(command_values)):
+        if selected is not None:
+            provided[command.sub_commands[0].field] = selected
+        selected = command.cls.model_validate(provided)
+    assert isinstance(selected, model)
+    return selected
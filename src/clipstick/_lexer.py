@@ -0,0 +1,98 @@
+from enum import IntEnum
+from itertools import accumulate
+from typing import Iterable
+
+HELP_KEYS = ("-h", "--help")
+HELP_SEARCH_KEY = "--help-search"
+SEPARATOR = "--"
+
+
+class Kind(IntEnum):
+    """Classification of a provided argument."""
+
+    VALUE = 0
+    """A bare value. Like a positional or the value of an option."""
+
+    ATTACHED = 1
+    """A value attached to a long key. Like the `value` in `--key=value`."""
+
+    LONG = 2
+    """A long key. Like `--verbose`."""
+
+    SHORT = 3
+    """A short key. Like `-v`."""
+
+    HELP = 4
+    """The help flag."""
+
+    HELP_SEARCH = 5
+    """The help search flag. Followed by the term to search for."""
+
+
+class Arguments:
+    """Provided arguments, classified once before matching.
+
+    The `--` separator itself is dropped. All arguments after it are values.
+    A `--key=value` argument is split into a key and an attached value.
+    """
+
+    __slots__ = ("values", "kinds", "separator_idx", "_attached_counts")
+
+    def __init__(
+        self, values: list[str], kinds: list[Kind], separator_idx: int | None = None
+    ) -> None:
+        self.values = values
+        self.kinds = kinds
+        # The index of the first value following the (dropped) `--` separator.
+        self.separator_idx = separator_idx
+        # The number of attached values up to and including each argument.
+        # Only computed when needed, which is when reporting errors.
+        self._attached_counts: list[int] | None = None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def source_index(self, idx: int) -> int:
+        """Return the index of the provided argument the classified argument originates from.
+
+        Takes constant time, so reporting an error for every argument stays linear.
+        """
+        if self._attached_counts is None:
+            self._attached_counts = list(
+                accumulate(kind is Kind.ATTACHED for kind in self.kinds)
+            )
+        attached = self._attached_counts[idx]
+        separated = self.separator_idx is not None and idx >= self.separator_idx
+        return idx - attached + separated
+
+
+def lex(args: Iterable[str]) -> Arguments:
+    """Classify all provided arguments in a single pass."""
+    values: list[str] = []
+    kinds: list[Kind] = []
+    separator_idx = None
+    args = iter(args)
+    for arg in args:
+        arg = str(arg)
+        if arg == SEPARATOR:
+            separator_idx = len(values)
+            for arg in args:
+                values.append(str(arg))
+                kinds.append(Kind.VALUE)
+            break
+        if arg in HELP_KEYS:
+            kind = Kind.HELP
+        elif arg.startswith("--"):
+            key, is_attached, value = arg.partition("=")
+            kind = Kind.HELP_SEARCH if key == HELP_SEARCH_KEY else Kind.LONG
+            if is_attached:
+                values.extend((key, value))
+                kinds.extend((kind, Kind.ATTACHED))
+                continue
+        elif arg.startswith("-") and arg != "-":
+            kind = Kind.SHORT
+        else:
+            kind = Kind.VALUE
+        values.append(arg)
+        kinds.append(kind)
+    return Arguments(values, kinds, separator_idx)
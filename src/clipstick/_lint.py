@@ -0,0 +1,93 @@
+"""Static analysis of a tokenized model.
+
+Done once, when a model is compiled. Problems making arguments ambiguous or
+impossible to provide are found before any argument is parsed, instead of
+surfacing (or silently resolving) while matching arguments.
+"""
+from __future__ import annotations
+
+from inspect import isclass
+from typing import Any, Iterator, Literal, get_args, get_origin
+
+from pydantic import BaseModel
+
+from clipstick._exceptions import (
+    DuplicateKey,
+    DuplicateSubcommand,
+    InvalidModel,
+    NestedModelField,
+    ReservedKey,
+    SubcommandNotLast,
+    UnreachableChoice,
+)
+from clipstick._lexer import HELP_KEYS, HELP_SEARCH_KEY
+from clipstick._tokens import Command, Positional, Subcommand, is_union
+
+RESERVED_KEYS = frozenset((*HELP_KEYS, HELP_SEARCH_KEY))
+
+
+def lint(command: Command | Subcommand) -> list[InvalidModel]:
+    """Return all problems of a command and its (nested) subcommands.
+
+    Plugin subcommands are only checked once they are loaded.
+    """
+    problems: list[InvalidModel] = []
+    for current in _iter_commands(command):
+        problems.extend(_lint_command(current))
+    return problems
+
+
+def _iter_commands(command: Command | Subcommand) -> Iterator[Command | Subcommand]:
+    if command.cls is BaseModel:
+        # the placeholder of a plugin subcommand which is not loaded yet.
+        return
+    yield command
+    for sub_command in command.sub_commands:
+        yield from _iter_commands(sub_command)
+
+
+def _lint_command(command: Command | Subcommand) -> Iterator[InvalidModel]:
+    model = command.cls
+    for token in command.tokens.values():
+        annotation = _without_none(token.field_info.annotation)
+        if isclass(annotation) and issubclass(annotation, BaseModel):
+            yield NestedModelField(model, token.field)
+        elif isinstance(token, Positional) and get_origin(annotation) is Literal:
+            # an optional choice still has its default, a positional is unusable.
+            if unreachable := [
+                choice for choice in get_args(annotation) if not isinstance(choice, str)
+            ]:
+                yield UnreachableChoice(model, token.field, unreachable)
+
+    if command.sub_commands:
+        field = command.sub_commands[0].field
+        if list(model.model_fields)[-1] != field:
+            yield SubcommandNotLast(model, field)
+
+    key_fields: dict[str, list[str]] = {}
+    for token in command.tokens.values():
+        if isinstance(token, Positional):
+            continue
+        for key in token.user_keys:
+            if key in RESERVED_KEYS:
+                yield ReservedKey(model, key, token.field)
+            key_fields.setdefault(key, []).append(token.field)
+    for key, fields in key_fields.items():
+        if len(fields) > 1:
+            yield DuplicateKey(model, key, fields)
+
+    names: set[str] = set()
+    for sub_command in command.sub_commands:
+        for name in sub_command.user_keys:
+            if name in names:
+                yield DuplicateSubcommand(model, name)
+            names.add(name)
+
+
+def _without_none(annotation: Any) -> Any:
+    """Return the annotation of an optional (like `int | None`) without the None."""
+    if is_union(annotation):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
@@ -0,0 +1,99 @@
+"""A static JSON manifest of a tokenized model.
+
+External tooling (completion, documentation, wrapper generators) can read the
+manifest instead of importing the application and all of its dependencies.
+"""
+from __future__ import annotations
+
+from inspect import cleandoc, isclass
+from typing import Any, Final, Literal, get_args, get_origin
+
+from pydantic import BaseModel
+from pydantic.alias_generators import to_snake
+from pydantic_core import to_jsonable_python
+
+from clipstick._parse import PluginSubcommand, compile_model
+from clipstick._tokens import Collection, Command, Subcommand, is_union
+
+MANIFEST_VERSION: Final[int] = 1
+"""Version of the manifest format. Incremented on incompatible changes."""
+
+
+def manifest(model: type[BaseModel], prog: str) -> dict[str, Any]:
+    """Return the complete command tree of a model as json serializable data.
+
+    Plugin subcommands are imported to include them in the manifest.
+
+    Args:
+        model: The pydantic model of the main command.
+        prog: The name of the cli as shown in help output.
+
+    Returns:
+        The manifest. Write it using `json.dump`.
+
+    Raises:
+        ClipStickError: when the model cannot be used as a cli.
+    """
+    return {
+        "manifest_version": MANIFEST_VERSION,
+        "clipstick_version": _clipstick_version(),
+        "command": _command(compile_model(model, prog)),
+    }
+
+
+def _clipstick_version() -> str | None:
+    # only imported when needed. Importing it slows down the startup of every cli.
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("clipstick")
+    except PackageNotFoundError:
+        return None
+
+
+def _command(command: Command | Subcommand) -> dict[str, Any]:
+    if isinstance(command, PluginSubcommand):
+        command.load()
+    return {
+        "kind": to_snake(type(command).__name__),
+        "name": command.user_keys[0],
+        "path": list(command.path),
+        "model": f"{command.cls.__module__}:{command.cls.__qualname__}",
+        "plugin": command.target if isinstance(command, PluginSubcommand) else None,
+        "description": cleandoc(command.cls.__doc__ or ""),
+        "tokens": [_token(token) for token in command.tokens.values()],
+        "subcommands": [_command(sub_command) for sub_command in command.sub_commands],
+    }
+
+
+def _token(token: Any) -> dict[str, Any]:
+    field_info = token.field_info
+    annotation = field_info.annotation
+    if is_union(annotation):
+        # an optional, like `int | None`.
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+    required = field_info.is_required()
+    return {
+        "field": token.field,
+        "kind": to_snake(type(token).__name__),
+        "user_keys": token.user_keys,
+        "required": required,
+        "type": _type_name(annotation),
+        "choices": list(get_args(annotation))
+        if get_origin(annotation) is Literal
+        else None,
+        "default": None
+        if required
+        else to_jsonable_python(
+            field_info.get_default(call_default_factory=True), fallback=repr
+        ),
+        "variadic": token.variadic if isinstance(token, Collection) else False,
+        "description": field_info.description or "",
+        "help": token.help(),
+    }
+
+
+def _type_name(annotation: Any) -> str:
+    if isclass(annotation) and not get_args(annotation):
+        return annotation.__name__
+    return str(annotation).replace("typing.", "")
@@ -1,18 +1,28 @@
+import collections.abc
+from copy import copy
+from functools import cached_property, lru_cache
 from inspect import isclass
 from itertools import chain
+from threading import Lock
 from typing import Iterator, Literal, get_args
 
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
 
-from clipstick._annotations import Short
-from clipstick._docstring import set_undefined_field_descriptions_from_var_docstrings
+from clipstick._annotations import Plugins, Short
+from clipstick._docstring import field_docstrings
 from clipstick._exceptions import (
+    ClipStickError,
+    InvalidModelErrors,
+    InvalidPlugin,
     InvalidTypesInUnion,
     NoDefaultAllowedForSubcommand,
     TooManyShortsException,
     TooManySubcommands,
 )
+from clipstick._imports import import_object
+from clipstick._lint import lint
+from clipstick._plugins import entry_points
 from clipstick._tokens import (
     Boolean,
     Choice,
@@ -22,8 +32,10 @@ from clipstick._tokens import (
     OptionalBoolean,
     OptionalChoice,
     OptionalCollection,
+    ParseState,
     Positional,
     Subcommand,
+    THelp,
     is_union,
     one_from_union,
 )
@@ -51,7 +63,7 @@ def _is_boolean_type(annotation: type) -> bool:
 
 
 def _is_collection_type(annotation: type) -> bool:
-    if getattr(annotation, "__origin__", None) in (list, set):
+    if getattr(annotation, "__origin__", None) in (list, set, collections.abc.Iterable):
         return True
     return False
 
@@ -67,29 +79,67 @@ def _is_choice(annotation: type) -> bool:
     return _check_origin_type(annotation, Literal)
 
 
+@lru_cache(maxsize=128)
+def compile_model(model: type[BaseModel], entry_point: str) -> Command:
+    """Validate and tokenize a model once.
+
+    The resulting command is never changed by parsing arguments. It is safe
+    to parse arguments using the same command from multiple threads at once.
+
+    Args:
+        model: The pydantic model of the main command.
+        entry_point: The name of the cli as shown in help output.
+
+    Raises:
+        ClipStickError: when the model cannot be used as a cli.
+        InvalidModelErrors: with all problems found by the static analysis of the model.
+    """
+    validate_model(model)
+    root_node: Command = Command(field=entry_point, cls=model, parent=None)
+    tokenize(model=model, sub_command=root_node)
+    if problems := lint(root_node):
+        raise InvalidModelErrors(problems)
+    return root_node
+
+
 def tokenize(model: type[BaseModel], sub_command: Subcommand | Command) -> None:
-    # todo: move this somewhere else.
-    set_undefined_field_descriptions_from_var_docstrings(model)
+    docstrings = field_docstrings(model)
     _sub_command_found: bool = False
     for key, value in model.model_fields.items():
+        if value.description is None and key in docstrings:
+            # a copy, to leave the field of the model itself untouched.
+            value = copy(value)
+            value.description = docstrings[key]
         assert value.annotation is not None
-        if is_union(value.annotation):
-            if _is_subcommand(value):
-                if _sub_command_found:
-                    raise TooManySubcommands()
-                _sub_command_found = True
-                # each result of the get_args call is a type[BaseModel]
-                # which is processed as a subcommand.
-                for annotated_model in get_args(value.annotation):
-                    new_sub_command = Subcommand(
-                        field=key, cls=annotated_model, parent=sub_command
+        plugin_groups = [
+            marker.group for marker in value.metadata if isinstance(marker, Plugins)
+        ]
+        if plugin_groups or (is_union(value.annotation) and _is_subcommand(value)):
+            if _sub_command_found:
+                raise TooManySubcommands()
+            _sub_command_found = True
+            # each result of the get_args call is a type[BaseModel]
+            # which is processed as a subcommand.
+            for annotated_model in get_args(value.annotation) or (value.annotation,):
+                if annotated_model is BaseModel:
+                    # Only accepting plugins. Not a subcommand by itself.
+                    continue
+                new_sub_command = Subcommand(
+                    field=key, cls=annotated_model, parent=sub_command
+                )
+
+                sub_command.sub_commands.append(new_sub_command)
+                tokenize(annotated_model, new_sub_command)
+            for group in plugin_groups:
+                sub_command.sub_commands.extend(
+                    PluginSubcommand(
+                        field=key, name=name, target=target, parent=sub_command
                     )
-
-                    sub_command.sub_commands.append(new_sub_command)
-                    tokenize(annotated_model, new_sub_command)
-                continue
-            else:
-                annotation = one_from_union(get_args(value.annotation))
+                    for name, target in entry_points(group)
+                )
+            continue
+        elif is_union(value.annotation):
+            annotation = one_from_union(get_args(value.annotation))
         else:
             annotation = value.annotation
 
@@ -117,17 +167,93 @@ def tokenize(model: type[BaseModel], sub_command: Subcommand | Command) -> None:
             sub_command.tokens[key] = Optional(key, field_info=value)
 
 
-def validate_model(model: type[BaseModel]) -> None:
-    """Validate the input model to see it is useful for cli generation.
+# Cached properties of a command computed from its tokens.
+_DERIVED_PROPERTIES = (
+    "key_tokens",
+    "abbreviations",
+    "suggestions",
+    "positional_tokens",
+    "sub_command_keys",
+)
+
+
+class PluginSubcommand(Subcommand):
+    """A subcommand provided by a separately installed package.
 
-    Done before anything else.
+    Its model is only imported (and tokenized) when the subcommand is
+    selected by the user or when its help output is needed.
     """
-    # todo: validate only one subcommand.
 
-    # todo: a subcommand must always be the last one defined.
+    def __init__(
+        self, field: str, name: str, target: str, parent: Command | Subcommand
+    ):
+        # BaseModel is a placeholder until the actual model is loaded.
+        super().__init__(field=field, cls=BaseModel, parent=parent)
+        self.name = name
+        self.target = target
+        self._loaded = False
+        self._lock = Lock()
+
+    @cached_property
+    def user_keys(self) -> list[str]:
+        return [self.name]
+
+    def load(self) -> None:
+        """Import and tokenize the plugin model.
+
+        Only done once, even when multiple threads are parsing at once.
+        """
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            try:
+                model = import_object(self.target)
+                if not (isclass(model) and issubclass(model, BaseModel)):
+                    raise InvalidPlugin(self.name, self.target)
+                _validate_shorts(model)
+                self.cls = model
+                tokenize(model, self)
+                if problems := lint(self):
+                    raise InvalidModelErrors(problems)
+            except ClipStickError:
+                self._reset()
+                raise
+            self._loaded = True
+
+    def _reset(self) -> None:
+        """Forget a partially loaded model, so loading again starts from scratch."""
+        self.cls = BaseModel
+        self.tokens = {}
+        self.sub_commands = []
+        for name in _DERIVED_PROPERTIES:
+            self.__dict__.pop(name, None)
+
+    def match(self, idx: int, state: ParseState) -> tuple[bool, int]:
+        self.load()
+        return super().match(idx, state)
+
+    def help(self) -> THelp:
+        try:
+            self.load()
+        except ClipStickError:
+            # flagged, instead of breaking the help of the whole cli.
+            return {
+                "arguments": self.name,
+                "description": f"Unable to load plugin {self.target}.",
+                "type": "",
+                "default": "",
+            }
+        return super().help()
 
-    # todo: validate no pydantic model as field value.
 
+def validate_model(model: type[BaseModel]) -> None:
+    """Validate the input model to see it is useful for cli generation.
+
+    Done before anything else. A single subcommand per model is checked while
+    tokenizing, all other checks are done on the tokenized model (see `lint`).
+    """
     # check shorthands per model to be unique.
     _validate_shorts(model)
 
@@ -0,0 +1,207 @@
+"""An in-memory cache of parse results, for long-lived processes.
+
+Identical arguments parsed into the same model return a copy of the previously
+validated model instead of going through lexing, matching and validation again.
+"""
+from __future__ import annotations
+
+import collections.abc
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import cache
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Callable,
+    Hashable,
+    NamedTuple,
+    Sequence,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+from pydantic.types import PathType
+
+from clipstick._annotations import Uncached
+from clipstick._streams import STDIN
+
+if TYPE_CHECKING:  # pragma: no cover
+    from clipstick._tokens import ParseState
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ParseCache:
+    """A bounded, least recently used cache of parse results.
+
+    Pass it to `parse` to return a copy of an earlier result for identical arguments:
+
+    ```python
+    parse_cache = ParseCache(maxsize=256, ttl=60)
+    parse(MyModel, args, cache=parse_cache)
+    ```
+
+    A result is not cached when one of its (provided) fields validates against
+    external state, like the existence of a path. See `uncached`.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Init.
+
+        Args:
+            maxsize: The maximum number of cached results. The least recently used
+                result is evicted first.
+            ttl: The number of seconds a result is valid. None to keep results until evicted.
+            clock: Returns the current time in seconds. Useful for testing.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._results: OrderedDict[Hashable, tuple[float, BaseModel]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, key: Hashable) -> BaseModel | None:
+        """Return a copy of the cached result or None when not (or no longer) cached."""
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None and self._is_expired(cached[0]):
+                del self._results[key]
+                cached = None
+            if cached is None:
+                self._misses += 1
+                return None
+            self._results.move_to_end(key)
+            self._hits += 1
+        return cached[1].model_copy(deep=True)
+
+    def put(self, key: Hashable, result: BaseModel) -> None:
+        """Cache a copy of a result, evicting the least recently used one when full."""
+        copied = result.model_copy(deep=True)
+        with self._lock:
+            self._results[key] = (self._clock(), copied)
+            self._results.move_to_end(key)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all results and reset the counters."""
+        with self._lock:
+            self._results.clear()
+            self._hits = self._misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Return the hit and miss counters and the size of the cache."""
+        return CacheInfo(self._hits, self._misses, self.maxsize, len(self._results))
+
+    def _is_expired(self, stored: float) -> bool:
+        return self.ttl is not None and self._clock() - stored >= self.ttl
+
+
+def cache_key(
+    model: type[BaseModel],
+    entry_point: str,
+    args: Sequence[str],
+    *,
+    allow_abbrev: bool,
+    fromfile_prefix: str | None,
+    env_prefix: str | None,
+    config_files: Sequence[str | Path],
+) -> Hashable | None:
+    """Return the key of the parse result of the provided arguments.
+
+    Environment variables and config files used for defaults are part of the key,
+    so changing them invalidates the cached results.
+
+    Returns:
+        The key, or None when the arguments read from stdin or a response file.
+    """
+    args = tuple(args)
+    if STDIN in args:
+        return None
+    if fromfile_prefix and any(arg.startswith(fromfile_prefix) for arg in args):
+        return None
+    env: tuple[tuple[str, str], ...] = ()
+    if env_prefix is not None:
+        env = tuple(
+            sorted(
+                item for item in os.environ.items() if item[0].startswith(env_prefix)
+            )
+        )
+    return (
+        model,
+        entry_point,
+        args,
+        allow_abbrev,
+        env,
+        tuple(_file_version(config_file) for config_file in config_files),
+    )
+
+
+def _file_version(path: str | Path) -> tuple[str, int, int] | tuple[str]:
+    path = Path(path).expanduser()
+    try:
+        stat = path.stat()
+    except OSError:
+        return (str(path),)
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+_LAZY_ORIGINS = (
+    collections.abc.Iterable,
+    collections.abc.Iterator,
+    collections.abc.Generator,
+)
+
+
+def _is_uncached(annotation: Any, metadata: Sequence[Any] = ()) -> bool:
+    if get_origin(annotation) in _LAZY_ORIGINS:
+        # validated into an iterator, which is consumed and cannot be copied.
+        return True
+    if any(isinstance(item, (Uncached, PathType)) for item in metadata):
+        return True
+    if get_origin(annotation) is Annotated:
+        return _is_uncached(annotation.__origin__, annotation.__metadata__)
+    return any(_is_uncached(arg) for arg in get_args(annotation))
+
+
+@cache
+def uncached_fields(model: type[BaseModel]) -> frozenset[str]:
+    """Return all fields of a model whose value must never come from a cache."""
+    return frozenset(
+        field
+        for field, field_info in model.model_fields.items()
+        if _is_uncached(field_info.annotation, field_info.metadata)
+    )
+
+
+def is_cacheable(state: ParseState) -> bool:
+    """Check whether none of the provided values of a parse depend on external state."""
+    current: ParseState | None = state
+    while current is not None:
+        model: type[BaseModel] = current.command.cls
+        if not uncached_fields(model).isdisjoint(current.values):
+            return False
+        current = current.sub_state
+    return True
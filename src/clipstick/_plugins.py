@@ -0,0 +1,52 @@
+import os
+import sys
+
+from clipstick._cache import read_json, write_json
+
+CACHE_FILE = "entry_points.json"
+
+
+def entry_points(group: str) -> list[tuple[str, str]]:
+    """Return the name and value of all entry points inside a group.
+
+    Scanning the metadata of all installed distributions is slow. The result is
+    cached on disk and invalidated as soon as any folder on `sys.path` changes,
+    which happens when a package is installed or removed.
+
+    Args:
+        group: The entry point group. For example `my_cli.commands`.
+
+    Returns:
+        A list of (name, value) tuples. The value is an import path like
+        `package.module:Model`.
+    """
+    key = _environment_key()
+    cache = read_json(CACHE_FILE)
+    if not (isinstance(cache, dict) and cache.get("key") == key):
+        cache = {"key": key, "groups": {}}
+
+    found = cache["groups"].get(group)
+    if found is None:
+        # only imported when the cache is invalid.
+        from importlib.metadata import entry_points as _entry_points
+
+        names: dict[str, str] = {}
+        for entry_point in _entry_points(group=group):
+            # the same distribution can be found more than once on sys.path.
+            names.setdefault(entry_point.name, entry_point.value)
+        found = list(names.items())
+        cache["groups"][group] = found
+        write_json(CACHE_FILE, cache)
+
+    return [(name, value) for name, value in found]
+
+
+def _environment_key() -> list[list]:
+    """Return the modification time of every folder on `sys.path`."""
+    key: list[list] = []
+    for path in sys.path:
+        try:
+            key.append([path, os.stat(path or ".").st_mtime_ns])
+        except OSError:
+            continue
+    return key
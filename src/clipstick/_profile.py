@@ -0,0 +1,79 @@
+"""Time the phases of parsing arguments into a model.
+
+Used by `python -m clipstick profile` to find out where the time of a parse goes.
+"""
+from __future__ import annotations
+
+import time
+from statistics import median
+from typing import NamedTuple, Sequence
+
+from pydantic import BaseModel
+
+from clipstick._exceptions import ParseErrors
+from clipstick._lexer import lex
+from clipstick._parse import compile_model
+from clipstick._tokens import ParseOptions, ParseState
+
+PHASES = ("compile", "lex", "match", "validate")
+
+
+class PhaseTiming(NamedTuple):
+    phase: str
+    first: float
+    """Seconds taken by the first (cold) run of the phase."""
+
+    median: float
+    """Median seconds taken by all runs of the phase."""
+
+
+def profile(
+    model: type[BaseModel],
+    args: Sequence[str],
+    prog: str,
+    repeat: int = 100,
+    allow_abbrev: bool = False,
+) -> list[PhaseTiming]:
+    """Time compiling the model, lexing, matching and validating the arguments.
+
+    Compiling is timed without the compile cache, so every run tokenizes and
+    checks the complete model.
+
+    Args:
+        model: The pydantic model of the main command.
+        args: The arguments to parse.
+        prog: The name of the cli as shown in help output.
+        repeat: The number of times every phase is run.
+        allow_abbrev: Allow unambiguous abbreviations of long keys.
+
+    Raises:
+        ClipStickError: when the model cannot be used as a cli.
+        ParseErrors: when the arguments cannot be parsed into the model.
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1.")
+    options = ParseOptions(allow_abbrev=allow_abbrev)
+    timings: list[list[float]] = [[] for _ in PHASES]
+    clock = time.perf_counter
+    for _ in range(repeat):
+        start = clock()
+        root = compile_model.__wrapped__(model, prog)
+        compiled = clock()
+        arguments = lex(args)
+        lexed = clock()
+        state = ParseState(root, arguments, options)
+        root.match(0, state)
+        matched = clock()
+        if state.errors:
+            raise ParseErrors(state.errors)
+        root.parse(state)
+        validated = clock()
+        for phase_timings, elapsed in zip(
+            timings,
+            (compiled - start, lexed - compiled, matched - lexed, validated - matched),
+        ):
+            phase_timings.append(elapsed)
+    return [
+        PhaseTiming(phase, values[0], median(values))
+        for phase, values in zip(PHASES, timings)
+    ]
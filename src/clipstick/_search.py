@@ -0,0 +1,130 @@
+"""Search the help of all (nested) commands of a cli.
+
+Used by `--help-search <term>`. The index is built once per compiled model,
+the first time a search is done. A regular parse never builds it: building it
+imports all plugin subcommands, which compiling a model does not.
+"""
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from inspect import cleandoc
+from typing import TYPE_CHECKING, Final, Iterator
+
+from clipstick import _exceptions, _help
+
+if TYPE_CHECKING:  # pragma: no cover
+    from clipstick._tokens import Command, Subcommand
+
+MAX_RESULTS: Final[int] = 50
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def _words(text: str) -> set[str]:
+    return set(_WORD.findall(text.lower()))
+
+
+@dataclass(frozen=True)
+class SearchEntry:
+    """A (sub)command or a token of a (sub)command."""
+
+    path: tuple[str, ...]
+    """The names of the subcommands leading to the command holding this entry."""
+
+    usage: str
+    """The entry point, subcommands and keys to provide to use this entry."""
+
+    description: str
+
+
+class SearchIndex:
+    """An inverted index of the keys and descriptions of all commands in a tree.
+
+    Every word of a query must match (the start of) a word of an entry. Matches
+    on keys and names rank before matches on descriptions only.
+    """
+
+    def __init__(self, root: Command) -> None:
+        self.entries: list[SearchEntry] = []
+        # word -> the indexes of all entries with this word in their keys (or name).
+        self._key_index: dict[str, set[int]] = {}
+        # word -> the indexes of all entries with this word anywhere.
+        self._index: dict[str, set[int]] = {}
+        for command in _iter_commands(root):
+            self._add_command(command)
+        self._vocabulary = sorted(self._index)
+
+    def _add_command(self, command: Command | Subcommand) -> None:
+        prog = " ".join(
+            "/".join(token.user_keys)
+            for token in reversed(list(_help.call_stack_from_tokens(command)))
+        )
+        if command.parent is not None:
+            description = cleandoc(command.cls.__doc__ or "")
+            self._add(command.path, prog, description, command.user_keys[0])
+        for token in command.tokens.values():
+            help_info = token.help()
+            keys = help_info["arguments"]
+            description = " ".join(
+                part
+                for part in (
+                    help_info["description"],
+                    f"[{help_info['type']}]" if help_info["type"] else "",
+                    f"[{help_info['default']}]" if help_info["default"] else "",
+                )
+                if part
+            )
+            self._add(command.path, f"{prog} {keys}", description, keys)
+
+    def _add(
+        self, path: tuple[str, ...], usage: str, description: str, keys: str
+    ) -> None:
+        entry_idx = len(self.entries)
+        self.entries.append(SearchEntry(path, usage, description))
+        key_words = _words(keys)
+        for word in key_words:
+            self._key_index.setdefault(word, set()).add(entry_idx)
+        for word in key_words | _words(description):
+            self._index.setdefault(word, set()).add(entry_idx)
+
+    def _prefixed(self, prefix: str) -> Iterator[str]:
+        """Yield all indexed words starting with the prefix."""
+        idx = bisect_left(self._vocabulary, prefix)
+        while idx < len(self._vocabulary) and self._vocabulary[idx].startswith(prefix):
+            yield self._vocabulary[idx]
+            idx += 1
+
+    def search(self, term: str) -> list[SearchEntry]:
+        """Return the entries matching all words of the search term."""
+        query = _words(term)
+        if not query:
+            return []
+        matches: set[int] | None = None
+        key_matches: set[int] = set()
+        for query_word in query:
+            word_matches: set[int] = set()
+            for word in self._prefixed(query_word):
+                word_matches |= self._index[word]
+                key_matches |= self._key_index.get(word, set())
+            matches = word_matches if matches is None else matches & word_matches
+        assert matches is not None
+        ranked = sorted(
+            matches,
+            key=lambda idx: (idx not in key_matches, len(self.entries[idx].path), idx),
+        )
+        return [self.entries[idx] for idx in ranked[:MAX_RESULTS]]
+
+
+def _iter_commands(
+    command: Command | Subcommand,
+) -> Iterator[Command | Subcommand]:
+    yield command
+    for sub_command in command.sub_commands:
+        try:
+            sub_command.load()
+        except _exceptions.ClipStickError:
+            # a broken plugin is left out, instead of breaking the search.
+            continue
+        yield from _iter_commands(sub_command)
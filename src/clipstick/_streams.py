@@ -0,0 +1,68 @@
+import sys
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator
+
+from clipstick import _exceptions
+from clipstick._lexer import SEPARATOR
+
+STDIN = "-"
+CHUNK_SIZE = 2**16
+
+
+def iter_response_file(path: Path) -> Iterator[str]:
+    """Yield every line of a response file as a single argument.
+
+    The file is read using a buffered reader. It is never loaded into memory as a whole.
+    """
+    try:
+        with path.open(encoding="utf-8") as response_file:
+            for line in response_file:
+                yield line.rstrip("\n")
+    except (OSError, UnicodeDecodeError) as err:
+        raise _exceptions.InvalidResponseFile(str(path), str(err)) from err
+
+
+def expand_response_files(args: Iterable[str], prefix: str) -> Iterator[str]:
+    """Replace every argument starting with the prefix by the content of the referenced file.
+
+    For example `@arguments.txt` is replaced by the lines of the `arguments.txt` file.
+    Arguments following the `--` separator are not expanded.
+    """
+    args = iter(args)
+    for arg in args:
+        if arg == SEPARATOR:
+            yield arg
+            yield from args
+            return
+        if arg.startswith(prefix) and len(arg) > len(prefix):
+            yield from iter_response_file(Path(arg[len(prefix) :]))
+        else:
+            yield arg
+
+
+def iter_stdin(stream: BinaryIO | None = None) -> Iterator[str]:
+    """Yield all values provided through stdin.
+
+    Values are separated by newlines, or by NUL characters (like the output of `find -print0`)
+    when the first chunk of data contains one.
+
+    Args:
+        stream: The stream to read from. Defaults to stdin.
+    """
+    stream = stream or sys.stdin.buffer
+    separator: bytes | None = None
+    pending = b""
+    while chunk := stream.read(CHUNK_SIZE):
+        if separator is None:
+            separator = b"\0" if b"\0" in chunk else b"\n"
+        *items, pending = (pending + chunk).split(separator)
+        for item in items:
+            yield _decode(item, separator)
+    if pending:
+        yield _decode(pending, separator)
+
+
+def _decode(item: bytes, separator: bytes | None) -> str:
+    if separator == b"\n":
+        item = item.removesuffix(b"\r")
+    return item.decode()
@@ -0,0 +1,47 @@
+"""Suggestions for misspelled arguments.
+
+Only used when parsing has failed. A successful parse never builds an index.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from typing import Iterable
+
+MIN_SIMILARITY = 0.5
+MAX_SUGGESTIONS = 3
+
+
+def _bigrams(word: str) -> frozenset[str]:
+    # Leading dashes are not relevant for finding a close match.
+    padded = f" {word.lstrip('-')} "
+    return frozenset(padded[idx : idx + 2] for idx in range(len(padded) - 1))
+
+
+class SuggestionIndex:
+    """An n-gram index to find words similar to a (misspelled) word.
+
+    Only words sharing at least one n-gram with the misspelled word are scored,
+    so a lookup stays fast for thousands of indexed words.
+    """
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self._words = list(dict.fromkeys(words))
+        self._word_bigrams = [_bigrams(word) for word in self._words]
+        self._index: dict[str, list[int]] = {}
+        for word_idx, bigrams in enumerate(self._word_bigrams):
+            for bigram in bigrams:
+                self._index.setdefault(bigram, []).append(word_idx)
+
+    def suggest(self, word: str) -> list[str]:
+        """Return the indexed words most similar to the provided word."""
+        bigrams = _bigrams(word)
+        shared = Counter(
+            word_idx for bigram in bigrams for word_idx in self._index.get(bigram, ())
+        )
+        scored = []
+        for word_idx, count in shared.items():
+            # dice coefficient
+            similarity = 2 * count / (len(bigrams) + len(self._word_bigrams[word_idx]))
+            if similarity >= MIN_SIMILARITY:
+                scored.append((-similarity, self._words[word_idx]))
+        return [suggestion for _, suggestion in sorted(scored)[:MAX_SUGGESTIONS]]
@@ -0,0 +1,137 @@
+"""Synthetic models of any size, for benchmarks.
+
+The models are generated as python source, so they can be written to a file and
+imported (and timed) like any hand written model.
+"""
+from __future__ import annotations
+
+import sys
+from types import ModuleType
+from typing import Iterator
+
+from pydantic import BaseModel
+from pydantic.alias_generators import to_snake
+
+MAIN_MODEL = "Main"
+"""The name of the main model in the generated source."""
+
+# The annotation, default and provided arguments of each kind of option.
+_OPTION_KINDS: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    ("int", "0", ("1",)),
+    ("bool", "False", ()),
+    ("list[str]", "[]", ("a",)),
+    ('Literal["a", "b"]', '"a"', ("b",)),
+    ("str", '""', ("value",)),
+)
+
+
+def _class_name(path: tuple[int, ...]) -> str:
+    if not path:
+        return MAIN_MODEL
+    return "Cmd" + "_".join(str(idx) for idx in path)
+
+
+def _subcommand_name(path: tuple[int, ...]) -> str:
+    # the name of a subcommand, as derived from its class name by clipstick.
+    return to_snake(_class_name(path)).replace("_", "-")
+
+
+def _validate_size(options: int, subcommands: int, depth: int) -> None:
+    if options < 0 or depth < 0:
+        raise ValueError("options and depth cannot be negative.")
+    if subcommands == 1 or subcommands < 0:
+        raise ValueError("A command has no or at least 2 subcommands.")
+
+
+def _iter_classes(
+    path: tuple[int, ...], options: int, subcommands: int, depth: int
+) -> Iterator[str]:
+    children = [(*path, idx) for idx in range(subcommands if depth else 0)]
+    for child in children:
+        # subcommands are defined before the model referencing them.
+        yield from _iter_classes(child, options, subcommands, depth - 1)
+    lines = [
+        f"class {_class_name(path)}(BaseModel):",
+        f'    """Command {_class_name(path)}."""',
+        "",
+        "    name: str",
+        '    """A positional."""',
+        "",
+    ]
+    for idx in range(options):
+        annotation, default, _ = _OPTION_KINDS[idx % len(_OPTION_KINDS)]
+        lines.extend(
+            (
+                f"    option_{idx}: {annotation} = {default}",
+                f'    """Option {idx} of {_class_name(path)}."""',
+                "",
+            )
+        )
+    if children:
+        union = " | ".join(_class_name(child) for child in children)
+        lines.extend((f"    sub_command: {union}", ""))
+    yield "\n".join(lines)
+
+
+def synthetic_source(options: int = 10, subcommands: int = 3, depth: int = 2) -> str:
+    """Return the source of a module defining a synthetic model named `Main`.
+
+    Every command has a positional, a number of options of varying kinds and
+    (up to the depth) a number of subcommands.
+
+    Args:
+        options: The number of options of every command.
+        subcommands: The number of subcommands of every command. 0 or at least 2.
+        depth: The number of nested subcommand levels.
+
+    Raises:
+        ValueError: when the size is invalid.
+    """
+    _validate_size(options, subcommands, depth)
+    classes = "\n\n".join(_iter_classes((), options, subcommands, depth))
+    return (
+        '"""A synthetic clipstick model."""\n'
+        "from typing import Literal\n\n"
+        "from pydantic import BaseModel\n\n\n"
+        f"{classes}"
+    )
+
+
+def synthetic_model(
+    options: int = 10, subcommands: int = 3, depth: int = 2
+) -> type[BaseModel]:
+    """Return the main model of `synthetic_source`.
+
+    Created from source without a file, so fields have no docstrings.
+    """
+    module = ModuleType(f"clipstick_synthetic_{options}_{subcommands}_{depth}")
+    # not inheriting the future annotations of this module.
+    code = compile(
+        synthetic_source(options, subcommands, depth),
+        module.__name__,
+        "exec",
+        dont_inherit=True,
+    )
+    exec(code, module.__dict__)
+    sys.modules[module.__name__] = module
+    model = getattr(module, MAIN_MODEL)
+    assert isinstance(model, type) and issubclass(model, BaseModel)
+    return model
+
+
+def synthetic_args(
+    options: int = 10, subcommands: int = 3, depth: int = 2
+) -> list[str]:
+    """Return arguments providing every token along the deepest (last) subcommands."""
+    _validate_size(options, subcommands, depth)
+    args: list[str] = []
+    path: tuple[int, ...] = ()
+    while True:
+        args.append("value")
+        for idx in range(options):
+            _, _, values = _OPTION_KINDS[idx % len(_OPTION_KINDS)]
+            args.extend((f"--option-{idx}", *values))
+        if not (subcommands and len(path) < depth):
+            return args
+        path = (*path, subcommands - 1)
+        args.append(_subcommand_name(path))
@@ -1,25 +1,50 @@
 from __future__ import annotations
 
+import collections.abc
 import sys
+from dataclasses import dataclass
 from functools import cached_property
+from itertools import chain
 from types import NoneType, UnionType
 from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
     Final,
     Generic,
+    Iterator,
+    Mapping,
+    NoReturn,
     TypedDict,
     TypeVar,
     get_args,
+    get_origin,
 )
 
 from pydantic import BaseModel, ValidationError
 from pydantic.alias_generators import to_snake
 from pydantic.fields import FieldInfo
 
-from clipstick import _exceptions, _help
-from clipstick._annotations import Short
+from clipstick import _diagnostics, _exceptions, _help
+from clipstick._annotations import Short, Variadic
+from clipstick._concurrent import io_bound_fields, validate_concurrently
+from clipstick._defaults import LayeredDefaults
+from clipstick._lexer import Arguments, Kind
+from clipstick._search import SearchIndex
+from clipstick._streams import STDIN, iter_stdin
+from clipstick._suggest import SuggestionIndex
+from clipstick._validation import (
+    by_validation_key,
+    supports_field_validation,
+    validate_fields,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from rich.console import Console
+
+    from clipstick._diagnostics import TDiagnostics
 
 TPydanticModel = TypeVar("TPydanticModel", bound=BaseModel)
-_HELP_KEYS = ("-h", "--help")
 
 
 class THelp(TypedDict):
@@ -86,6 +111,70 @@ def one_from_union(args: tuple[type]) -> type:
     raise _exceptions.InvalidUnion()
 
 
+@dataclass(frozen=True)
+class ParseOptions:
+    """Options of a single parse."""
+
+    allow_abbrev: bool = False
+    """Allow unambiguous abbreviations of long keys (like `--verb` for `--verbose`)."""
+
+    validation_workers: int | None = None
+    """Validate path-like collection items concurrently using this number of threads."""
+
+    defaults: LayeredDefaults | None = None
+    """Defaults from environment variables and config files, taking precedence over model defaults."""
+
+    output: Console | None = None
+    """The console to print help to. Defaults to the module console."""
+
+    diagnostics: TDiagnostics = "text"
+    """Print help as rich text or as a JSON document."""
+
+    stdin: BinaryIO | None = None
+    """The stream to read collection values from, when provided as `-`. Defaults to stdin."""
+
+
+class ParseState:
+    """The state of a (sub)command while parsing provided arguments.
+
+    Commands and tokens are compiled once per model and never store anything
+    about a specific parse. All of that is stored here, one state per (sub)command,
+    so a model can be parsed by multiple threads at once.
+    """
+
+    def __init__(
+        self,
+        command: Command,
+        arguments: Arguments,
+        options: ParseOptions,
+        errors: list[_exceptions.ClipStickError] | None = None,
+    ) -> None:
+        self.command = command
+        self.arguments = arguments
+        self.options = options
+        # All problems found while matching. Shared by the states of all (sub)commands.
+        self.errors: list[_exceptions.ClipStickError] = [] if errors is None else errors
+        # The matched value of each token, by field.
+        self.values: dict[str, Any] = {}
+        # In case of an error we want to know which keyword was used (like --proceed or -p etc.)
+        # We store what used argument here.
+        self.used_args: dict[str, str] = {}
+        # The index of the (last) argument providing the value of a token.
+        self.used_idxs: dict[str, int] = {}
+        # The index of the argument providing each of the items of a collection.
+        self.item_idxs: dict[str, list[int]] = {}
+        # Values of lazy collections, read from stdin.
+        self.stdin: dict[str, Iterator[str]] = {}
+        # Fields reported missing while matching. Not reported again when validating.
+        self.missing: set[str] = set()
+        self.sub_command: Subcommand | None = None
+        self.sub_state: ParseState | None = None
+
+
+def _parsed(field: str, state: ParseState) -> dict[str, Any]:
+    return {field: state.values[field]} if field in state.values else {}
+
+
 class Positional:
     """Positional/required argument token.
 
@@ -104,10 +193,6 @@ class Positional:
         """
         self.field = field
         self.field_info = field_info
-        # In case of an error we want to know which keyword was used (like --proceed or -p etc.)
-        # We store what used argument here.
-        self.used_arg: str = field.replace("_", "-")
-        self._match: dict[str, str] | None = None
 
     @cached_property
     def user_keys(self) -> list[str]:
@@ -117,23 +202,30 @@ class Positional:
         """
         return [(self.field.replace("_", "-"))]
 
-    def match(self, idx: int, arguments: list[str]) -> tuple[bool, int]:
+    def match(self, idx: int, state: ParseState) -> tuple[bool, int]:
         """Check if this token is a match given the list of arguments."""
-        if arguments[idx].startswith("-"):
+        arguments = state.arguments
+        if arguments.kinds[idx] is not Kind.VALUE:
             return False, idx
-        if self._match:
+        if self.field in state.values:
             # this token was already a match.
             return False, idx
-        self._match = {self.field: arguments[idx]}
+        state.values[self.field] = arguments.values[idx]
+        state.used_args[self.field] = self.user_keys[0]
+        state.used_idxs[self.field] = idx
         return True, idx + 1
 
-    def parse(self) -> dict[str, str]:
+    def value_index(self, loc: tuple[int | str, ...], state: ParseState) -> int | None:
+        """Return the index of the argument providing the value at the (pydantic error) location."""
+        return state.used_idxs.get(self.field)
+
+    def parse(self, state: ParseState) -> dict[str, str]:
         """Return the token data in a parseable way.
 
         This mean returning a (partial) dict with a key, value pair
         which is to be consumed by pydantic.
         """
-        return self._match if self._match else {}
+        return _parsed(self.field, state)
 
     def help(self) -> THelp:
         """Help data based on field information.
@@ -170,11 +262,6 @@ class Optional:
         self.field = field
         self.field_info = field_info
 
-        # In case of an error we want to know which keyword was used (like --proceed or -p etc.)
-        # We store what used argument here.
-        self.used_arg: str = ""
-        self._match: dict[str, str] = {}
-
     @cached_property
     def short_keys(self) -> list[str]:
         return [
@@ -195,24 +282,36 @@ class Optional:
         """
         return self.keys + self.short_keys
 
-    def match(self, idx: int, values: list[str]) -> tuple[bool, int]:
-        try:
-            if values[idx] not in self.user_keys:
-                return False, idx
-        except IndexError:
-            return False, idx
-        self.used_arg = values[idx]
-        self._match[self.field] = values[idx + 1]
+    def match(self, idx: int, state: ParseState) -> tuple[bool, int]:
+        """Consume the value following the key at the provided index.
+
+        The command has already looked up this token by its key.
+        """
+        values = state.arguments.values
+        if idx + 1 == len(values):
+            state.errors.append(
+                _exceptions.MissingOptionValue(
+                    values[idx], state.arguments.source_index(idx)
+                )
+            )
+            return True, idx + 1
+        state.used_args[self.field] = values[idx]
+        state.values[self.field] = values[idx + 1]
+        state.used_idxs[self.field] = idx + 1
 
         return True, idx + 2
 
-    def parse(self) -> dict[str, str]:
+    def value_index(self, loc: tuple[int | str, ...], state: ParseState) -> int | None:
+        """Return the index of the argument providing the value at the (pydantic error) location."""
+        return state.used_idxs.get(self.field)
+
+    def parse(self, state: ParseState) -> dict[str, str]:
         """Return the token data in a parseable way.
 
         This mean returning a (partial) dict with a key, value pair
         which is to be consumed by pydantic.
         """
-        return self._match
+        return _parsed(self.field, state)
 
     def help(self) -> THelp:
         """Help data based on field information.
@@ -278,6 +377,10 @@ class Collection:
     For example : `my_cli --items item1 --items item2`
     will be parsed a models with an items collection containing item1 and item2
 
+    A `variadic` collection consumes all values following its key: `my_cli --items item1 item2`.
+
+    With `my_cli --items -` the values are read from stdin. A collection annotated as an
+    `Iterable` receives these values lazily.
     """
 
     def __init__(self, field: str, field_info: FieldInfo):
@@ -289,11 +392,7 @@ class Collection:
         """
         self.field = field
         self.field_info = field_info
-        # In case of an error we want to know which keyword was used (like --proceed or -p etc.)
-        # We store what used argument here.
-        self.used_arg: str = ""
         self.required: bool = True
-        self._match: dict[str, list] = {}
 
     @cached_property
     def short_keys(self) -> list[str]:
@@ -303,6 +402,16 @@ class Collection:
             if isinstance(short, Short)
         ]
 
+    @cached_property
+    def variadic(self) -> bool:
+        """Whether all values following the key are consumed."""
+        return any(isinstance(marker, Variadic) for marker in self.field_info.metadata)
+
+    @cached_property
+    def lazy(self) -> bool:
+        """Whether values read from stdin are provided as an iterator."""
+        return get_origin(self.field_info.annotation) is collections.abc.Iterable
+
     @cached_property
     def keys(self) -> list[str]:
         return [_to_key(self.field)]
@@ -315,21 +424,55 @@ class Collection:
         """
         return self.keys + self.short_keys
 
-    def match(self, idx: int, values: list[str]) -> tuple[bool, int]:
-        try:
-            if values[idx] not in self.user_keys:
-                return False, idx
-        except IndexError:
-            return False, idx
-        self.used_arg = values[idx]
+    def match(self, idx: int, state: ParseState) -> tuple[bool, int]:
+        """Consume the value following the key at the provided index.
+
+        The command has already looked up this token by its key.
+        """
+        values, kinds = state.arguments.values, state.arguments.kinds
+        if idx + 1 == len(values):
+            state.errors.append(
+                _exceptions.MissingOptionValue(
+                    values[idx], state.arguments.source_index(idx)
+                )
+            )
+            return True, idx + 1
+        state.used_args[self.field] = values[idx]
+
+        matches = state.values.setdefault(self.field, [])
+        # The index of the argument providing each of the items.
+        item_idxs = state.item_idxs.setdefault(self.field, [])
+        state.used_idxs[self.field] = idx + 1
+        if values[idx + 1] == STDIN and kinds[idx + 1] is Kind.VALUE:
+            if self.lazy:
+                state.stdin[self.field] = iter_stdin(state.options.stdin)
+            else:
+                matches.extend(iter_stdin(state.options.stdin))
+            return True, idx + 2
 
-        matches = self._match.setdefault(self.field, [])
         matches.append(values[idx + 1])
+        item_idxs.append(idx + 1)
+        idx += 2
+        if self.variadic:
+            values_count = len(values)
+            while idx < values_count and kinds[idx] is Kind.VALUE:
+                matches.append(values[idx])
+                item_idxs.append(idx)
+                idx += 1
+        state.used_idxs[self.field] = idx - 1
+        return True, idx
 
-        return True, idx + 2
+    def value_index(self, loc: tuple[int | str, ...], state: ParseState) -> int | None:
+        """Return the index of the argument providing the value at the (pydantic error) location."""
+        item_idxs = state.item_idxs.get(self.field, [])
+        if loc and isinstance(loc[0], int) and loc[0] < len(item_idxs):
+            return item_idxs[loc[0]]
+        return state.used_idxs.get(self.field)
 
-    def parse(self) -> dict[str, list]:
-        return self._match
+    def parse(self, state: ParseState) -> Mapping[str, list | Iterator]:
+        if (stdin := state.stdin.get(self.field)) is None:
+            return _parsed(self.field, state)
+        return {self.field: chain(state.values[self.field], stdin)}
 
     def help(self) -> THelp:
         """Help data based on field information.
@@ -374,11 +517,7 @@ class Boolean:
         """
         self.field = field
         self.field_info = field_info
-        # In case of an error we want to know which keyword was used (like --proceed or -p etc.)
-        # We store that used argument here.
-        self.used_arg: str = ""
         self.required: bool = True
-        self._match: dict[str, bool] = {}
 
     @cached_property
     def _short_true_keys(self) -> list[str]:
@@ -408,6 +547,10 @@ class Boolean:
         """Return a list of negated argument keys."""
         return [_to_false_key(self.field)]
 
+    @cached_property
+    def _true_user_keys(self) -> frozenset[str]:
+        return frozenset(self._true_keys + self._short_true_keys)
+
     @cached_property
     def short_keys(self) -> list[str]:
         return self._short_true_keys + self._short_false_keys
@@ -424,25 +567,28 @@ class Boolean:
         """
         return self.short_keys + self.keys
 
-    def match(self, idx: int, values: list[str]) -> tuple[bool, int]:
-        if len(values) <= idx:
-            return False, idx
+    def match(self, idx: int, state: ParseState) -> tuple[bool, int]:
+        """Set the flag based on the key at the provided index.
 
-        if values[idx] in self.user_keys:
-            self.used_arg = values[idx]
-            self._match[self.field] = (
-                values[idx] in self._true_keys + self._short_true_keys
-            )
-            return True, idx + 1
-        return False, idx
+        The command has already looked up this token by its key.
+        """
+        used_arg = state.arguments.values[idx]
+        state.used_args[self.field] = used_arg
+        state.values[self.field] = used_arg in self._true_user_keys
+        state.used_idxs[self.field] = idx
+        return True, idx + 1
 
-    def parse(self) -> dict[str, bool]:
+    def value_index(self, loc: tuple[int | str, ...], state: ParseState) -> int | None:
+        """Return the index of the argument providing the value at the (pydantic error) location."""
+        return state.used_idxs.get(self.field)
+
+    def parse(self, state: ParseState) -> dict[str, bool]:
         """Return the token data in a parseable way.
 
         This mean returning a (partial) dict with a key, value pair
         which is to be consumed by pydantic.
         """
-        return self._match
+        return _parsed(self.field, state)
 
     def help(self) -> THelp:
         """Help data based on field information.
@@ -509,10 +655,16 @@ class Command(Generic[TPydanticModel]):
         cls: type[TPydanticModel],
         parent: "Command" | "Subcommand" | None,
     ):
+        """Init.
+
+        Args:
+            field: The field name of a subcommand or the entrypoint of the main command.
+            cls: The pydantic model of this command.
+            parent: The parent command. None for the main command.
+        """
         self.field = field
         self.cls = cls
         self.parent = parent
-        self._match: dict[str, str | bool | list | None] = {}
 
         self.tokens: dict[
             str,
@@ -535,17 +687,92 @@ class Command(Generic[TPydanticModel]):
         keys = (self.field.split("/")[-1]).split("\\")[-1]
         return [keys]
 
-    def match(self, idx: int, arguments: list[str]) -> tuple[bool, int]:
-        """Check for token match.
+    @cached_property
+    def path(self) -> tuple[str, ...]:
+        """The names of all subcommands leading to this command."""
+        return ()
+
+    @cached_property
+    def key_tokens(
+        self,
+    ) -> dict[
+        str, Boolean | OptionalBoolean | Optional | Collection | OptionalCollection
+    ]:
+        """All keyworded tokens of this command, by each of their user keys."""
+        return {
+            key: token
+            for token in self.tokens.values()
+            if not isinstance(token, Positional)
+            for key in token.user_keys
+        }
+
+    @cached_property
+    def abbreviations(self) -> dict[str, tuple[str, ...]]:
+        """All possible abbreviations of the long keys of this command.
 
-        As a result the subcommand has been stripped down to a one-branch tree, meaning
-        all sub_commands collections in all (nested)
-        subcommands have only one or no children.
+        Each abbreviation maps to all keys it can be an abbreviation of.
+        Computed once, so both lookups and ambiguity checks are a single dict lookup.
+        """
+        abbreviations: dict[str, tuple[str, ...]] = {}
+        for key in self.key_tokens:
+            if not key.startswith("--"):
+                continue
+            for end in range(3, len(key)):
+                abbreviations[key[:end]] = abbreviations.get(key[:end], ()) + (key,)
+        return abbreviations
+
+    def _expand_abbreviation(self, idx: int, state: ParseState) -> bool:
+        """Replace an abbreviated long key by its full key.
+
+        An abbreviation matching multiple keys is reported as an `AmbiguousAbbreviation`.
+
+        Returns:
+            True if the argument was an abbreviation of (exactly) one of the keys.
+        """
+        arguments = state.arguments
+        candidates = self.abbreviations.get(arguments.values[idx], ())
+        if len(candidates) > 1:
+            state.errors.append(
+                _exceptions.AmbiguousAbbreviation(
+                    arguments.values[idx], candidates, arguments.source_index(idx)
+                )
+            )
+            return False
+        if candidates:
+            arguments.values[idx] = candidates[0]
+            return True
+        return False
 
+    @cached_property
+    def suggestions(self) -> SuggestionIndex:
+        """Index of all keys and subcommand names to suggest alternatives for misspelled arguments."""
+        return SuggestionIndex(chain(self.key_tokens, self.sub_command_keys))
+
+    @cached_property
+    def positional_tokens(self) -> list[Positional]:
+        """All positional tokens of this command in order of definition."""
+        return [
+            token for token in self.tokens.values() if isinstance(token, Positional)
+        ]
+
+    @cached_property
+    def sub_command_keys(self) -> dict[str, "Subcommand"]:
+        """All subcommands of this command by their name."""
+        return {
+            key: sub_command
+            for sub_command in self.sub_commands
+            for key in sub_command.user_keys
+        }
+
+    def match(self, idx: int, state: ParseState) -> tuple[bool, int]:
+        """Check for token match.
+
+        The selected subcommand (if any) and its state are stored in the provided state.
+        This command itself is never changed, so it can be matched by multiple threads at once.
 
         Args:
             idx: arguments index to start the matching from.
-            arguments: the list of provided arguments that need parsing
+            state: the state of this command. Holds the classified list of provided arguments that need parsing
 
         Returns:
             tuple of bool and int.
@@ -554,40 +781,91 @@ class Command(Generic[TPydanticModel]):
         """
         start_idx = idx
 
-        values_count = len(arguments)
-
-        def _check_arg_or_optional(_idx: int, values: list[str]) -> tuple[bool, int]:
-            """Every arg in the values list must match one of the tokens in the model."""
-            if values_count == _idx:
-                return False, _idx
-            if values[_idx] in _HELP_KEYS:
-                _help.help(self)
-                sys.exit(0)
-            for arg in self.tokens.values():
-                success, _idx = arg.match(_idx, values)
-                if success:
-                    break
+        arguments = state.arguments
+        values, kinds = arguments.values, arguments.kinds
+        values_count = len(values)
+        key_tokens = self.key_tokens
+        allow_abbrev = state.options.allow_abbrev
+
+        # Every arg in the values list must match one of the tokens in the model.
+        # Arguments that cannot be matched are reported and skipped, so all problems
+        # are found in a single pass.
+        while idx < values_count:
+            kind = kinds[idx]
+            if kind is Kind.HELP:
+                if state.options.diagnostics == "json":
+                    _diagnostics.write_help(self, output=state.options.output)
+                else:
+                    _help.help(self, output=state.options.output)
+                sys.exit(_diagnostics.EXIT_HELP)
+            if kind is Kind.HELP_SEARCH:
+                term = values[idx + 1] if idx + 1 < values_count else ""
+                self._help_search(term, state)
+            if kind is Kind.VALUE:
+                for positional in self.positional_tokens:
+                    success, idx = positional.match(idx, state)
+                    if success:
+                        break
+                else:
+                    if self.sub_commands:
+                        # this must be the name of a subcommand.
+                        break
+                    state.errors.append(
+                        _exceptions.UnexpectedArgument(
+                            values[idx], arguments.source_index(idx)
+                        )
+                    )
+                    idx += 1
+            elif kind is Kind.ATTACHED:
+                # a value attached to a key not expecting one. Like `--verbose=true`.
+                state.errors.append(
+                    _exceptions.UnexpectedArgument(
+                        values[idx], arguments.source_index(idx), key=values[idx - 1]
+                    )
+                )
+                idx += 1
+            elif values[idx] in key_tokens or (
+                kind is Kind.LONG
+                and allow_abbrev
+                and self._expand_abbreviation(idx, state)
+            ):
+                _, idx = key_tokens[values[idx]].match(idx, state)
             else:
-                return False, _idx
-            return True, _idx
+                suggestions = self.suggestions.suggest(values[idx])
+                if not (allow_abbrev and values[idx] in self.abbreviations):
+                    state.errors.append(
+                        _exceptions.UnknownArgument(
+                            values[idx], arguments.source_index(idx), suggestions
+                        )
+                    )
+                idx += 1
+                if idx < values_count and (
+                    kinds[idx] is Kind.ATTACHED
+                    or (
+                        kinds[idx] is Kind.VALUE
+                        and suggestions
+                        and isinstance(
+                            key_tokens.get(suggestions[0]), (Optional, Collection)
+                        )
+                    )
+                ):
+                    # skip the value of the unknown key too, when it most likely is
+                    # a misspelled key expecting a value.
+                    idx += 1
 
-        found_match = True
-        while found_match:
-            found_match, idx = _check_arg_or_optional(idx, arguments)
+        if state.options.defaults is not None:
+            self._apply_defaults(state.options.defaults, state)
 
         # no more match is found. Now we need to check whether all postional (required) arguments
-        # have been matched. If not, we have no match for this command.
-        non_matching_required_tokens = [
-            token
-            for token in self.tokens.values()
-            if token.required and not token._match
-        ]
-        if non_matching_required_tokens:
-            # only erroring on first token for now.
-            # todo: fix reporting on multiple missing positional arguments.
-            raise _exceptions.MissingPositional(
-                "/".join(non_matching_required_tokens[0].user_keys), idx, arguments
-            )
+        # have been matched.
+        for token in self.tokens.values():
+            if token.required and token.field not in state.values:
+                state.errors.append(
+                    _exceptions.MissingPositional(
+                        "/".join(token.user_keys), idx, values
+                    )
+                )
+                state.missing.add(token.field)
 
         # We now need to check whether this command has any subcommands.
         # If no subcommands are inside this command we have a match.
@@ -595,37 +873,105 @@ class Command(Generic[TPydanticModel]):
             return True, idx
 
         # This command has a subcommand.
-        # We now try and match each subcommand with the remainder of the provided arguments.
-
-        # We are going to parse all available subcommands. Only one can exist
-        subcommand: Subcommand | None = None
-        for sub_command in self.sub_commands:
-            success, idx = sub_command.match(idx, arguments)
-            if success:
-                if subcommand:
-                    raise ValueError(
-                        "more than one solution-tree is found. Don't know what to do now."
-                    )
-                subcommand = sub_command
-
-        if not subcommand:
+        # We now try and match the subcommand with the remainder of the provided arguments.
+        if idx == values_count:
+            state.errors.append(
+                _exceptions.MissingSubcommand(list(self.sub_command_keys))
+            )
+            state.missing.add(self.sub_commands[0].field)
+            return False, start_idx
+        subcommand = self.sub_command_keys.get(values[idx])
+        if subcommand is None:
+            state.errors.append(
+                _exceptions.UnknownArgument(
+                    values[idx],
+                    arguments.source_index(idx),
+                    self.suggestions.suggest(values[idx]),
+                )
+            )
+            # the unknown name is reported instead of the missing subcommand.
+            state.missing.add(self.sub_commands[0].field)
             return False, start_idx
 
-        self.sub_commands = [subcommand]
+        state.sub_command = subcommand
+        state.sub_state = ParseState(subcommand, arguments, state.options, state.errors)
+        success, idx = subcommand.match(idx, state.sub_state)
+        if not success:
+            return False, start_idx
 
         return True, idx
 
-    def parse(self) -> TPydanticModel:
-        """Populate all tokens with the provided arguments."""
-        [self._match.update(parsed.parse()) for parsed in self.tokens.values()]
-
-        if self.sub_commands:
-            subcommand = self.sub_commands[0]
-            self._match[subcommand.field] = subcommand.parse()
+    @cached_property
+    def search_index(self) -> SearchIndex:
+        """Index of the help of this command and all of its (nested) subcommands."""
+        return SearchIndex(self)
+
+    def _help_search(self, term: str, state: ParseState) -> NoReturn:
+        """Print all help entries of the whole cli matching the term and exit."""
+        root: Command = self
+        while root.parent is not None:
+            root = root.parent
+        results = root.search_index.search(term)
+        if state.options.diagnostics == "json":
+            _diagnostics.write_search(term, results, output=state.options.output)
+        else:
+            _help.search_results(term, results, output=state.options.output)
+        sys.exit(_diagnostics.EXIT_HELP)
+
+    def _apply_defaults(self, defaults: LayeredDefaults, state: ParseState) -> None:
+        """Populate all tokens without a provided argument using the layered defaults."""
+        for token in self.tokens.values():
+            if token.field in state.values:
+                continue
+            if (default := defaults.get(self.path, token.field)) is None:
+                continue
+            value, state.used_args[token.field] = default
+            if isinstance(token, Collection) and isinstance(value, str):
+                value = value.split(",")
+            state.values[token.field] = value
+
+    def parse(self, state: ParseState) -> TPydanticModel:
+        """Populate all tokens with the provided arguments.
+
+        Raises:
+            ParseErrors: with the validation errors of this command and its subcommand.
+        """
+        values: dict[str, Any] = {}
+        for token in self.tokens.values():
+            values.update(token.parse(state))
+
+        errors: list[_exceptions.ClipStickError] = []
+        sub_errors: list[_exceptions.ClipStickError] = []
+        if state.sub_command is not None:
+            assert state.sub_state is not None
+            try:
+                values[state.sub_command.field] = state.sub_command.parse(
+                    state.sub_state
+                )
+            except _exceptions.ParseErrors as err:
+                sub_errors = err.errors
+                # reported instead of the missing value of the subcommand field.
+                state.missing.add(state.sub_command.field)
+        workers = state.options.validation_workers
         try:
-            return self.cls.model_validate(self._match)
+            if workers and io_bound_fields(self.cls):
+                model = validate_concurrently(self.cls, values, workers)
+            elif supports_field_validation(self.cls):
+                model = validate_fields(self.cls, values)
+            else:
+                model = self.cls.model_validate(by_validation_key(self.cls, values))
         except ValidationError as err:
-            raise _exceptions.FieldError(err, token=self)
+            field_error = _exceptions.FieldError(err, token=self, state=state)
+            if field_error.message:
+                errors.append(field_error)
+            errors.extend(sub_errors)
+            # without errors left to report, the missing values causing them are
+            # reported while matching. Raised with those, never without any errors.
+            raise _exceptions.ParseErrors(errors or list(state.errors)) from err
+        errors.extend(sub_errors)
+        if errors:
+            raise _exceptions.ParseErrors(errors)
+        return model
 
 
 class Subcommand(Command):
@@ -634,30 +980,29 @@ class Subcommand(Command):
         snaked = to_snake(self.cls.__name__)
         return [snaked.replace("_", "-")]
 
-    def match(self, idx: int, values: list[str]) -> tuple[bool, int]:
-        """Check for token match.
+    @cached_property
+    def path(self) -> tuple[str, ...]:
+        """The names of all subcommands leading to this command."""
+        assert self.parent is not None
+        return (*self.parent.path, self.user_keys[0])
 
-        As a result the subcommand has been stripped down to a one-branch tree, meaning
-        all sub_commands collections in all (nested)
-        subcommands have only one or no children.
+    def load(self) -> None:
+        """Import the model of this subcommand. Only plugins are imported lazily."""
 
+    def match(self, idx: int, state: ParseState) -> tuple[bool, int]:
+        """Check for token match.
 
         Args:
-            idx: values index to start the matching from.
-            values: the list of provided arguments that need parsing
+            idx: arguments index pointing at the name of this subcommand.
+                The parent command has already looked up this subcommand by its name.
+            state: the state of this subcommand.
 
         Returns:
             tuple of bool and int.
                 bool indicates whether to continue matching
                 int indicates the new starting point for the next token to match.
         """
-        try:
-            if values[idx] not in self.user_keys:
-                return False, idx
-        except IndexError:
-            return False, idx
-
-        return super().match(idx + 1, values)
+        return super().match(idx + 1, state)
 
     def help(self) -> THelp:
         """Help data based on field information.
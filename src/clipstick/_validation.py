@@ -0,0 +1,125 @@
+"""Field-scoped validation of provided values.
+
+Every provided value is validated by a `TypeAdapter` of its field, compiled once per field.
+The model is created using `model_construct`, taking defaults for all other fields without
+validating them again. Models using validators or aliases are validated as a whole.
+"""
+from __future__ import annotations
+
+from functools import cache
+from typing import Annotated, Any, Collection, TypeVar
+
+from pydantic import AliasChoices, BaseModel, TypeAdapter, ValidationError
+from pydantic.fields import FieldInfo
+from pydantic_core import InitErrorDetails, PydanticCustomError
+
+TModel = TypeVar("TModel", bound=BaseModel)
+
+
+@cache
+def supports_field_validation(model: type[BaseModel]) -> bool:
+    """Check whether validating fields one by one is equal to validating the whole model."""
+    decorators = model.__pydantic_decorators__
+    if (
+        decorators.validators
+        or decorators.field_validators
+        or decorators.root_validators
+        or decorators.model_validators
+    ):
+        return False
+    if model.model_config.get("validate_default"):
+        return False
+    return not any(
+        field_info.alias or field_info.validation_alias or field_info.validate_default
+        for field_info in model.model_fields.values()
+    )
+
+
+def _validation_key(field: str, field_info: FieldInfo) -> str:
+    alias = field_info.validation_alias
+    if isinstance(alias, AliasChoices):
+        alias = next(
+            (choice for choice in alias.choices if isinstance(choice, str)), None
+        )
+    if isinstance(alias, str):
+        return alias
+    # an alias path cannot be provided as a single key.
+    return field_info.alias or field
+
+
+@cache
+def validation_keys(model: type[BaseModel]) -> dict[str, str]:
+    """Return the key pydantic validates each aliased field of a model by."""
+    keys = {
+        field: _validation_key(field, field_info)
+        for field, field_info in model.model_fields.items()
+    }
+    return {field: key for field, key in keys.items() if key != field}
+
+
+@cache
+def validated_fields(model: type[BaseModel]) -> dict[str, str]:
+    """Return the field of each validation key of the aliased fields of a model."""
+    return {key: field for field, key in validation_keys(model).items()}
+
+
+def by_validation_key(model: type[BaseModel], values: dict[str, Any]) -> dict[str, Any]:
+    """Return the values by field keyed the way pydantic validates them."""
+    if not (keys := validation_keys(model)):
+        return values
+    return {keys.get(field, field): value for field, value in values.items()}
+
+
+@cache
+def field_adapter(model: type[BaseModel], field: str) -> TypeAdapter:
+    """Return a type adapter validating a value of a model field."""
+    field_info = model.model_fields[field]
+    return TypeAdapter(
+        Annotated[field_info.annotation, field_info], config=model.model_config or None
+    )
+
+
+def prefixed_errors(err: ValidationError, *loc: int | str) -> list[InitErrorDetails]:
+    """Return the errors of a validation error with their location prefixed."""
+    return [
+        InitErrorDetails(
+            type=PydanticCustomError(error["type"], error["msg"]),
+            loc=(*loc, *error["loc"]),
+            input=error["input"],
+        )
+        for error in err.errors()
+    ]
+
+
+def validate_fields(
+    model: type[TModel], values: dict[str, Any], validated: Collection[str] = ()
+) -> TModel:
+    """Validate all provided values field by field into a model.
+
+    Only use this for models for which `supports_field_validation` is True.
+    Values which are models themselves (subcommands) are already validated.
+
+    Args:
+        model: The model to create.
+        values: The provided values by field.
+        validated: Fields of which the values are already validated.
+
+    Raises:
+        ValidationError: when validation of any of the values fails.
+    """
+    fields: dict[str, Any] = {}
+    errors: list[InitErrorDetails] = []
+    for field in model.model_fields:
+        if field not in values:
+            continue
+        value = values[field]
+        if field in validated or isinstance(value, BaseModel):
+            fields[field] = value
+            continue
+        try:
+            fields[field] = field_adapter(model, field).validate_python(value)
+        except ValidationError as err:
+            errors.extend(prefixed_errors(err, field))
+    if errors:
+        raise ValidationError.from_exception_data(model.__name__, errors)
+    return model.model_construct(_fields_set=set(fields), **fields)
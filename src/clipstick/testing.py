@@ -0,0 +1,110 @@
+"""Invoke a clipstick cli in-process, for testing.
+
+```python
+from clipstick.testing import CliRunner
+
+runner = CliRunner(MyModel)
+
+result = runner.invoke(["clone", "my_repo"])
+assert result.exit_code == 0
+assert result.model == MyModel(...)
+```
+
+Every invocation captures its output in its own buffers. Nothing global is changed,
+so a runner can be used from multiple threads and by parallel test runs.
+"""
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass
+from typing import Any, Generic, Sequence
+
+from rich.console import Console
+
+from clipstick._clipstick import DUMMY_ENTRY_POINT, parse
+from clipstick._parse import compile_model
+from clipstick._tokens import TPydanticModel
+
+
+@dataclass(frozen=True)
+class Result(Generic[TPydanticModel]):
+    """The outcome of a single invocation."""
+
+    exit_code: int
+    """0 when parsing succeeded or help was printed."""
+
+    stdout: str
+    """Printed help output."""
+
+    stderr: str
+    """Printed errors."""
+
+    model: TPydanticModel | None
+    """The parsed model. None when parsing exited."""
+
+
+class CliRunner(Generic[TPydanticModel]):
+    """Invokes a model with provided arguments and captures the results."""
+
+    def __init__(
+        self,
+        model: type[TPydanticModel],
+        *,
+        width: int = 80,
+        **options: Any,
+    ) -> None:
+        """Init.
+
+        Args:
+            model: The model to invoke.
+            width: The width of the captured output.
+            options: Additional options passed to `parse`, like `allow_abbrev=True`.
+        """
+        self.model = model
+        self.width = width
+        self.options = options
+        # compile once, validating the model. Reused by all invocations.
+        compile_model(model, DUMMY_ENTRY_POINT)
+
+    def invoke(
+        self, args: Sequence[str], input: str | bytes | None = None
+    ) -> Result[TPydanticModel]:
+        """Parse the provided arguments.
+
+        Args:
+            args: The arguments to parse. Without the entrypoint.
+            input: Data read by collections provided as `-` (stdin).
+
+        Returns:
+            The exit code, the captured output and the parsed model.
+        """
+        stdout = self._console()
+        stderr = self._console()
+        if isinstance(input, str):
+            input = input.encode()
+        try:
+            model = parse(
+                self.model,
+                list(args),
+                output=stdout,
+                error_output=stderr,
+                stdin=io.BytesIO(input or b""),
+                **self.options,
+            )
+        except SystemExit as err:
+            return Result(_exit_code(err), _text(stdout), _text(stderr), None)
+        return Result(0, _text(stdout), _text(stderr), model)
+
+    def _console(self) -> Console:
+        return Console(file=io.StringIO(), width=self.width, color_system=None)
+
+
+def _exit_code(err: SystemExit) -> int:
+    if err.code is None:
+        return 0
+    return err.code if isinstance(err.code, int) else 1
+
+
+def _text(console: Console) -> str:
+    assert isinstance(console.file, io.StringIO)
+    return console.file.getvalue()
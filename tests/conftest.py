@@ -1,4 +1,5 @@
 from pathlib import Path
+from urllib.parse import quote
 
 import cairosvg
 import pytest
@@ -36,18 +37,13 @@ class CapturedOutput:
 
             output.mkdir(exist_ok=True, parents=True)
 
-            target_base_file = output / self._fixture_request.function.__name__
-            raw_text_file = target_base_file.with_suffix(".txt")
+            # the test name includes the id of its parameters, if any. Each parameter
+            # gets a snapshot of its own, instead of overwriting a single one.
+            name = quote(self._fixture_request.node.name, safe="[]-_.")
+            raw_text_file = output / f"{name}.txt"
             raw_text_file.write_text(self.captured_output, encoding="utf-8")
 
-            cairosvg.svg2png(
-                svg,
-                write_to=str(
-                    (output / self._fixture_request.function.__name__).with_suffix(
-                        ".png"
-                    )
-                ),
-            )
+            cairosvg.svg2png(svg, write_to=str(output / f"{name}.png"))
 
 
 @pytest.fixture(scope="function")
@@ -0,0 +1,49 @@
+import pytest
+from clipstick import parse
+from pydantic import BaseModel
+
+
+class Clone(BaseModel):
+    depth: int = 1
+
+
+class Info(BaseModel):
+    pass
+
+
+class MyModel(BaseModel):
+    verbose: bool = False
+    version: str = "1.0"
+    name: str = "John"
+
+    sub_command: Clone | Info
+
+
+@pytest.mark.parametrize(
+    "args,expected",
+    [
+        (["--verb", "clone"], MyModel(verbose=True, sub_command=Clone())),
+        (["--vers", "2.0", "clone"], MyModel(version="2.0", sub_command=Clone())),
+        (["--n=Jane", "clone"], MyModel(name="Jane", sub_command=Clone())),
+        (["clone", "--dep", "3"], MyModel(sub_command=Clone(depth=3))),
+    ],
+)
+def test_abbreviations(args, expected):
+    assert parse(MyModel, args, allow_abbrev=True) == expected
+
+
+def test_abbreviations_not_allowed_by_default():
+    with pytest.raises(SystemExit) as err:
+        parse(MyModel, ["--verb", "clone"])
+    assert err.value.code == 1
+
+
+def test_ambiguous_abbreviation_message(capsys):
+    with pytest.raises(SystemExit) as err:
+        parse(MyModel, ["--ver", "clone"], allow_abbrev=True)
+
+    assert err.value.code == 1
+    assert (
+        "Ambiguous argument '--ver'. Could be any of: --verbose, --version"
+        in capsys.readouterr().out
+    )
@@ -0,0 +1,175 @@
+import importlib.util
+import subprocess
+import sys
+from typing import Annotated, Literal
+
+import pytest
+from clipstick import parse, short, variadic
+from clipstick._codegen import generate
+from pydantic import BaseModel, PositiveInt, model_validator
+
+
+class Clone(BaseModel):
+    """Clone a repo."""
+
+    repo: str
+    """Repository to clone."""
+
+    depth: PositiveInt = 1
+
+
+class Merge(BaseModel):
+    """Merge a branch."""
+
+    branch: str
+    strategy: Literal["ours", "theirs"] = "ours"
+
+
+class MyGit(BaseModel):
+    """My git cli."""
+
+    verbose: Annotated[bool, short("v")] = False
+    remotes: list[str] = []
+
+    sub_command: Clone | Merge
+
+
+class Files(BaseModel):
+    files: Annotated[list[str], variadic()] = []
+    verbose: bool = False
+
+
+class Range(BaseModel):
+    low: int
+    high: int
+
+    @model_validator(mode="after")
+    def ordered(self) -> "Range":
+        if self.low > self.high:
+            raise ValueError("low must not exceed high")
+        return self
+
+
+@pytest.fixture(scope="module")
+def generated():
+    source = generate(MyGit, prog="my-cli-app")
+    spec = importlib.util.spec_from_loader("generated_parser", loader=None)
+    module = importlib.util.module_from_spec(spec)
+    exec(compile(source, "generated_parser.py", "exec"), module.__dict__)
+    return module
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["clone", "my_repo"],
+        ["-v", "clone", "my_repo", "--depth", "10"],
+        ["--remotes", "a", "--remotes", "b", "merge", "dev"],
+        ["merge", "--strategy", "theirs", "dev"],
+        ["merge", "--strategy=theirs", "--", "-dev"],
+    ],
+)
+def test_generated_parser_equals_parse(generated, args):
+    assert generated.parse(args) == parse(MyGit, args)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        [],
+        ["clone"],
+        ["clone", "my_repo", "--depth", "-1"],
+        ["merge", "dev", "unknown"],
+        ["merge", "dev", "--strategy"],
+        ["-v=true", "merge", "dev"],
+    ],
+)
+def test_generated_parser_errors(generated, capsys, args):
+    with pytest.raises(SystemExit) as err:
+        generated.parse(args)
+
+    assert err.value.code == 1
+    assert capsys.readouterr().out.startswith("ERROR:")
+
+
+def test_generated_parser_field_error(generated, capsys):
+    with pytest.raises(SystemExit):
+        generated.parse(["clone", "my_repo", "--depth", "-1"])
+
+    assert (
+        "Incorrect value for --depth in clone  ('-1'). Input should be greater than 0"
+        in capsys.readouterr().out
+    )
+
+
+def test_generated_parser_model_validator_error(capsys):
+    source = generate(Range, prog="my-cli-app")
+    namespace: dict = {}
+    exec(compile(source, "generated_parser.py", "exec"), namespace)
+
+    with pytest.raises(SystemExit) as err:
+        namespace["parse"](["2", "1"])
+
+    assert err.value.code == 1
+    assert (
+        "Invalid arguments. Value error, low must not exceed high"
+        in capsys.readouterr().out
+    )
+
+
+def test_annotation_markers_do_not_load_the_parser():
+    code = (
+        "import sys; from clipstick import short, variadic; "
+        "print(sorted(name for name in sys.modules if name.startswith(('clipstick', 'rich'))))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "['clipstick', 'clipstick._annotations']"
+
+
+def test_generated_parser_help(generated, capsys):
+    with pytest.raises(SystemExit) as err:
+        generated.parse(["merge", "-h"])
+
+    assert err.value.code == 0
+    assert capsys.readouterr().out == (
+        """
+Usage: my-cli-app merge [Arguments] [Options]
+
+Merge a branch.
+
+Arguments:
+    branch                [str]
+
+Options:
+    --strategy            [allowed values: ours, theirs] [default = ours]
+"""
+    )
+
+
+def test_generated_parser_abbreviations():
+    source = generate(MyGit, prog="my-cli-app", allow_abbrev=True)
+    namespace: dict = {}
+    exec(compile(source, "generated_parser.py", "exec"), namespace)
+
+    args = ["--verb", "--rem", "a", "clone", "my_repo", "--dep=3"]
+    assert namespace["parse"](args) == parse(MyGit, args, allow_abbrev=True)
+
+
+def test_generated_parser_variadic():
+    source = generate(Files, prog="my-cli-app")
+    namespace: dict = {}
+    exec(compile(source, "generated_parser.py", "exec"), namespace)
+
+    args = ["--files", "a", "b", "--verbose", "--files", "c"]
+    assert namespace["parse"](args) == parse(Files, args)
+
+
+def test_generate_local_model_raises():
+    class LocalModel(BaseModel):
+        value: int
+
+    with pytest.raises(Exception, match="must be importable"):
+        generate(LocalModel, prog="my-cli-app")
@@ -0,0 +1,74 @@
+import io
+import sys
+from pathlib import Path
+from typing import Annotated, Iterable
+
+import pytest
+from clipstick import _streams, parse, short, variadic
+from clipstick._streams import iter_stdin
+from pydantic import BaseModel
+
+
+class MyModel(BaseModel):
+    name: str
+    my_list: Annotated[list[int], short("m"), variadic()] = []
+    verbose: bool = False
+
+
+class MyLazyModel(BaseModel):
+    files: Iterable[Path]
+
+
+@pytest.fixture
+def stdin(monkeypatch):
+    def _set_stdin(data: bytes):
+        monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(data)))
+
+    return _set_stdin
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["my_name", "--my-list", "1", "2", "3", "--verbose"],
+        ["my_name", "-m", "1", "2", "-m", "3", "--verbose"],
+        ["my_name", "--my-list=1", "2", "3", "--verbose"],
+        ["--my-list", "1", "2", "3", "--verbose", "my_name"],
+    ],
+)
+def test_variadic_collection(args):
+    model = parse(MyModel, args)
+    assert model == MyModel(name="my_name", my_list=[1, 2, 3], verbose=True)
+
+
+def test_collection_from_stdin(stdin):
+    stdin(b"1\n2\n3\n")
+    model = parse(MyModel, ["my_name", "--my-list", "-", "--verbose"])
+    assert model == MyModel(name="my_name", my_list=[1, 2, 3], verbose=True)
+
+
+def test_collection_from_stdin_is_lazy(stdin):
+    stdin(b"a.txt\0b.txt\0")
+    model = parse(MyLazyModel, ["--files", "-"])
+
+    assert sys.stdin.buffer.tell() == 0
+    assert list(model.files) == [Path("a.txt"), Path("b.txt")]
+
+
+def test_lazy_collection_without_stdin():
+    model = parse(MyLazyModel, ["--files", "a.txt"])
+    assert list(model.files) == [Path("a.txt")]
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (b"", []),
+        (b"a\nb\n", ["a", "b"]),
+        (b"a\r\nb", ["a", "b"]),
+        (b"a\0b c\nd\0", ["a", "b c\nd"]),
+    ],
+)
+def test_iter_stdin(monkeypatch, data, expected):
+    monkeypatch.setattr(_streams, "CHUNK_SIZE", 3)
+    assert list(iter_stdin(io.BytesIO(data))) == expected
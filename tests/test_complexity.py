@@ -0,0 +1,122 @@
+"""Parsing adversarial arguments takes time linear in the number of arguments.
+
+Every case parses (and reports the errors of) arguments of a small and a large size.
+The number of function calls of a complete parse is counted, which is exact but
+misses work done inside builtins (like slicing a list). A parse doing work
+proportional to the number of arguments for every argument makes many more calls
+for the large size. Timing the same cases is left to `benchmarks.complexity`, as
+wall-clock time is too noisy to assert on.
+"""
+import json
+import sys
+from typing import Annotated, Callable
+
+import pytest
+from clipstick import variadic
+from clipstick.testing import CliRunner
+from pydantic import BaseModel, create_model
+
+SIZE = 100
+"""The small size of counted parses."""
+
+SCALE = 8
+"""The large size is this many times the small size."""
+
+
+class Main(BaseModel):
+    name: str = ""
+    numbers: list[int] = []
+    items: list[str] = []
+    rest: Annotated[list[str], variadic()] = []
+    verbose: bool = False
+
+
+def _chain(depth: int) -> type[BaseModel]:
+    """Return a model with subcommands nested depth levels deep."""
+    model = create_model("Leaf", value=(str, ...))
+    for level in reversed(range(depth)):
+        model = create_model(
+            f"Level{level}",
+            sub_command=(model | create_model(f"Other{level}"), ...),
+        )
+    return model
+
+
+def _deep_subcommands(size: int) -> tuple[type[BaseModel], list[str]]:
+    # a model deeper than the recursion limit is not a realistic cli.
+    depth = size // 25
+    args = [f"level-{level}" for level in range(1, depth)]
+    return _chain(depth), [*args, "leaf", "value"]
+
+
+CASES: dict[str, Callable[[int], tuple[type[BaseModel], list[str]]]] = {
+    "repeated collection keys": lambda size: (Main, ["--items", "a"] * size),
+    "variadic collection": lambda size: (Main, ["--rest", *["a"] * size]),
+    "values after separator": lambda size: (Main, ["--rest", "--", *["-a"] * size]),
+    "repeated flags": lambda size: (Main, ["--verbose"] * size),
+    "repeated options": lambda size: (Main, ["--name", "a"] * size),
+    "near-miss keys": lambda size: (Main, ["--itmes", "a"] * size),
+    "unexpected values": lambda size: (Main, ["a"] * size),
+    "attached values": lambda size: (Main, ["--verbose=yes"] * size),
+    "invalid collection items": lambda size: (Main, ["--numbers", "a"] * size),
+    "long unknown key": lambda size: (Main, ["--" + "x" * size]),
+    "deep subcommands": _deep_subcommands,
+}
+
+ABBREVIATION_CASES: dict[str, Callable[[int], tuple[type[BaseModel], list[str]]]] = {
+    "repeated abbreviations": lambda size: (Main, ["--ite", "a"] * size),
+    "ambiguous abbreviations": lambda size: (Main, ["--n"] * size),
+}
+
+
+def _calls(func: Callable[[], object]) -> int:
+    """Return the number of (python and builtin) function calls made by func."""
+    count = 0
+
+    def count_call(frame, event, arg):
+        nonlocal count
+        count += 1
+
+    sys.setprofile(count_call)
+    try:
+        func()
+    finally:
+        sys.setprofile(None)
+    return count
+
+
+def _assert_linear(
+    make: Callable[[int], tuple[type[BaseModel], list[str]]], **options
+) -> None:
+    calls = []
+    for size in (SIZE, SIZE * SCALE):
+        model, args = make(size)
+        runner = CliRunner(model, **options)
+        # a first parse populates all caches.
+        runner.invoke(args)
+        calls.append(_calls(lambda: runner.invoke(args)))
+    small, large = calls
+    assert large <= small * SCALE * 1.1
+
+
+@pytest.mark.parametrize("make", CASES.values(), ids=CASES.keys())
+def test_parse_is_linear(make):
+    _assert_linear(make)
+
+
+@pytest.mark.parametrize(
+    "make", ABBREVIATION_CASES.values(), ids=ABBREVIATION_CASES.keys()
+)
+def test_parse_with_abbreviations_is_linear(make):
+    _assert_linear(make, allow_abbrev=True)
+
+
+def test_argument_indexes_of_many_errors():
+    args = ["--verbose=yes", "--itmes", "a"] * SIZE
+
+    result = CliRunner(Main, diagnostics="json").invoke(args)
+
+    errors = json.loads(result.stderr)["errors"]
+    assert [error["argument_index"] for error in errors] == [
+        idx for idx in range(len(args)) if idx % 3 != 2
+    ]
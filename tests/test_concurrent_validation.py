@@ -0,0 +1,57 @@
+from typing import Annotated
+
+import pytest
+from clipstick import parse, short
+from pydantic import BaseModel, DirectoryPath, FilePath, PositiveInt, model_validator
+
+
+class Files(BaseModel):
+    files: Annotated[list[FilePath], short("f")] = []
+    folders: set[DirectoryPath] = set()
+    count: PositiveInt = 1
+
+    @model_validator(mode="after")
+    def check_count(self) -> "Files":
+        if self.count > 1 and not self.files:
+            raise ValueError("count requires files")
+        return self
+
+
+@pytest.fixture
+def files(tmp_path):
+    files = [tmp_path / f"file_{idx}.txt" for idx in range(20)]
+    for file in files:
+        file.touch()
+    return files
+
+
+def test_concurrent_validation_equals_serial(files, tmp_path):
+    args = [arg for file in files for arg in ("-f", str(file))]
+    args += ["--folders", str(tmp_path), "--count", "3"]
+
+    model = parse(Files, args, validation_workers=4)
+
+    assert model == parse(Files, args)
+    assert type(model) is Files
+    assert model.model_fields_set == {"files", "folders", "count"}
+
+
+def test_concurrent_validation_defaults(files):
+    model = parse(Files, ["--files", str(files[0])], validation_workers=4)
+    assert model == Files(files=[files[0]])
+    assert model.model_fields_set == {"files"}
+
+
+def test_concurrent_validation_item_error(files, capsys):
+    with pytest.raises(SystemExit) as err:
+        parse(
+            Files,
+            ["--files", str(files[0]), "-f", "missing.txt"],
+            validation_workers=4,
+        )
+
+    assert err.value.code == 1
+    assert (
+        "Incorrect value for -f ('missing.txt'). Path does not point to a file"
+        in capsys.readouterr().out
+    )
@@ -0,0 +1,110 @@
+import json
+
+import pytest
+from clipstick import parse
+from clipstick._defaults import load_config
+from pydantic import BaseModel
+
+
+class Clone(BaseModel):
+    repo: str
+    depth: int = 1
+
+
+class Info(BaseModel):
+    verbose: bool = False
+
+
+class MyGit(BaseModel):
+    user: str = "me"
+    remotes: list[str] = []
+    sub_command: Clone | Info
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("CLIPSTICK_CACHE_DIR", str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    config_file = tmp_path / "config.toml"
+    config_file.write_text('user = "config"\n\n[clone]\ndepth = 5\nrepo = "my_repo"\n')
+    return config_file
+
+
+def test_defaults_from_config(config_file):
+    model = parse(MyGit, ["clone"], config_files=[config_file])
+    assert model == MyGit(user="config", sub_command=Clone(repo="my_repo", depth=5))
+
+
+def test_later_config_file_takes_precedence(config_file, tmp_path):
+    json_file = tmp_path / "config.json"
+    json_file.write_text(json.dumps({"clone": {"depth": 3}}))
+
+    model = parse(
+        MyGit,
+        ["clone"],
+        config_files=[config_file, json_file, tmp_path / "missing.toml"],
+    )
+    assert model == MyGit(user="config", sub_command=Clone(repo="my_repo", depth=3))
+
+
+def test_env_takes_precedence_over_config(config_file, monkeypatch):
+    monkeypatch.setenv("MY_GIT_CLONE_DEPTH", "8")
+    monkeypatch.setenv("MY_GIT_REMOTES", "a,b")
+
+    model = parse(MyGit, ["clone"], env_prefix="MY_GIT_", config_files=[config_file])
+    assert model == MyGit(
+        user="config", remotes=["a", "b"], sub_command=Clone(repo="my_repo", depth=8)
+    )
+
+
+def test_arguments_take_precedence(config_file, monkeypatch):
+    monkeypatch.setenv("MY_GIT_USER", "env")
+
+    model = parse(
+        MyGit,
+        ["--user", "arg", "clone", "other_repo", "--depth", "2"],
+        env_prefix="MY_GIT_",
+        config_files=[config_file],
+    )
+    assert model == MyGit(user="arg", sub_command=Clone(repo="other_repo", depth=2))
+
+
+def test_invalid_env_value(monkeypatch, capsys):
+    monkeypatch.setenv("MY_GIT_CLONE_DEPTH", "deep")
+
+    with pytest.raises(SystemExit):
+        parse(MyGit, ["clone", "my_repo"], env_prefix="MY_GIT_")
+
+    assert "Incorrect value for MY_GIT_CLONE_DEPTH" in capsys.readouterr().out
+
+
+def test_invalid_config_file(tmp_path, capsys):
+    config_file = tmp_path / "config.json"
+    config_file.write_text("[1, 2]")
+
+    with pytest.raises(SystemExit) as err:
+        parse(MyGit, ["clone", "my_repo"], config_files=[config_file])
+
+    assert err.value.code == 1
+    assert "Unable to read config file" in capsys.readouterr().out
+
+
+def test_parsed_config_is_cached(config_file, monkeypatch):
+    assert load_config(config_file) == {
+        "user": "config",
+        "clone.depth": 5,
+        "clone.repo": "my_repo",
+    }
+
+    def _fail(path):
+        raise AssertionError("config should be read from cache.")
+
+    with monkeypatch.context() as patch:
+        patch.setattr("clipstick._defaults._read_config", _fail)
+        assert load_config(config_file)["clone.depth"] == 5
+
+    config_file.write_text("user = 'changed'\n")
+    assert load_config(config_file) == {"user": "changed"}
@@ -0,0 +1,110 @@
+import io
+import json
+
+import pytest
+from clipstick import parse
+from pydantic import BaseModel, PositiveInt
+from rich.console import Console
+
+
+class Clone(BaseModel):
+    """Clone a repo."""
+
+    repo: str
+    """Repository to clone."""
+
+    depth: PositiveInt = 1
+
+
+class Info(BaseModel):
+    """Show info."""
+
+
+class MyGit(BaseModel):
+    """My git cli."""
+
+    verbose: bool = False
+    sub_command: Clone | Info
+
+
+class InvalidModel(BaseModel):
+    sub_command: Clone | Info = Info()
+
+
+def _parse_json(model: type[BaseModel], args: list[str]) -> tuple[int, dict]:
+    output = Console(file=io.StringIO())
+    with pytest.raises(SystemExit) as err:
+        parse(model, args, output=output, diagnostics="json")
+    assert isinstance(err.value.code, int)
+    return err.value.code, json.loads(output.file.getvalue())
+
+
+def test_help():
+    code, document = _parse_json(MyGit, ["clone", "-h"])
+
+    assert code == 0
+    assert document == {
+        "version": 1,
+        "exit_code": 0,
+        "help": {
+            "usage": "my-cli-app clone",
+            "description": "Clone a repo.",
+            "arguments": [
+                {
+                    "arguments": "repo",
+                    "description": "Repository to clone.",
+                    "type": "str",
+                    "default": "",
+                }
+            ],
+            "options": [
+                {
+                    "arguments": "--depth",
+                    "description": "",
+                    "type": "int",
+                    "default": "default = 1",
+                }
+            ],
+            "subcommands": [],
+        },
+    }
+
+
+def test_errors():
+    code, document = _parse_json(MyGit, ["--verbos", "clone", "--depth", "0"])
+
+    assert code == 1
+    assert document == {
+        "version": 1,
+        "exit_code": 1,
+        "errors": [
+            {
+                "type": "unknown_argument",
+                "message": "--verbos is unknown. Did you mean --verbose?",
+                "argument_index": 0,
+                "suggestions": ["--verbose"],
+            },
+            {
+                "type": "missing_positional",
+                "message": "Missing a value for positional argument 'repo'",
+                "argument_index": None,
+            },
+            {
+                "type": "field_error",
+                "message": "Incorrect value for --depth in clone  ('0'). "
+                "Input should be greater than 0",
+                "argument_index": 3,
+                "command": ["clone"],
+                "loc": ["depth"],
+                "input": "0",
+                "error_type": "greater_than",
+            },
+        ],
+    }
+
+
+def test_invalid_model():
+    code, document = _parse_json(InvalidModel, [])
+
+    assert code == 1
+    assert document["errors"][0]["type"] == "no_default_allowed_for_subcommand"
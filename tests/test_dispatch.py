@@ -0,0 +1,82 @@
+import pytest
+from clipstick import dispatch, parse
+from clipstick._exceptions import InvalidHandler, InvalidImportPath, NoHandlerFound
+from pydantic import BaseModel
+
+
+class Info(BaseModel):
+    verbose: bool = False
+
+
+class Clone(BaseModel):
+    depth: int
+
+
+class Remote(BaseModel):
+    url: str = "https://mysuperrepo"
+
+    sub_command: Clone | Info
+
+
+class Merge(BaseModel):
+    branch: str
+
+
+class MyGitModel(BaseModel):
+    sub_command: Remote | Merge
+
+
+def clone_handler(model: Clone) -> str:
+    return f"cloning with depth {model.depth}"
+
+
+def remote_handler(model: Remote) -> str:
+    return f"remote {model.url}"
+
+
+NOT_A_HANDLER = "not callable"
+
+
+def test_dispatch_to_handler_by_import_path():
+    model = parse(MyGitModel, ["remote", "clone", "10"])
+    result = dispatch(
+        model,
+        {
+            Clone: "tests.test_dispatch:clone_handler",
+            # never imported as this subcommand is not selected.
+            Merge: "non_existing_package.handlers:merge",
+        },
+    )
+    assert result == "cloning with depth 10"
+
+
+def test_dispatch_to_callable():
+    model = parse(MyGitModel, ["remote", "clone", "10"])
+    assert dispatch(model, {Clone: clone_handler}) == "cloning with depth 10"
+
+
+def test_dispatch_falls_back_to_parent_handler():
+    model = parse(MyGitModel, ["remote", "--url", "my_url", "info"])
+    result = dispatch(model, {Remote: "tests.test_dispatch:remote_handler"})
+    assert result == "remote my_url"
+
+
+def test_no_handler_found_raises():
+    model = parse(MyGitModel, ["merge", "my_branch"])
+    with pytest.raises(NoHandlerFound):
+        dispatch(model, {Clone: clone_handler})
+
+
+@pytest.mark.parametrize(
+    "path", ["tests.test_dispatch", "tests.test_dispatch:non_existing"]
+)
+def test_invalid_handler_path_raises(path):
+    model = parse(MyGitModel, ["merge", "my_branch"])
+    with pytest.raises(InvalidImportPath):
+        dispatch(model, {Merge: path})
+
+
+def test_not_callable_handler_raises():
+    model = parse(MyGitModel, ["merge", "my_branch"])
+    with pytest.raises(InvalidHandler, match="tests.test_dispatch:NOT_A_HANDLER"):
+        dispatch(model, {Merge: "tests.test_dispatch:NOT_A_HANDLER"})
@@ -0,0 +1,326 @@
+"""Parse random arguments into random models and compare with a reference.
+
+Models are generated as source with random fields and (nested) subcommands. Valid
+arguments are generated together with the model instance they should result in.
+Random (mostly invalid) arguments are compared with the standalone parser generated
+for the same model, which matches arguments independently of the tokens.
+Seeded, so every failure can be reproduced.
+"""
+from __future__ import annotations
+
+import contextlib
+import io
+import random
+import sys
+from types import ModuleType
+from typing import Any, Callable, NamedTuple
+
+import pytest
+from clipstick._codegen import generate
+from clipstick.testing import CliRunner
+from pydantic import BaseModel
+
+SEEDS = range(60)
+
+COMMAND_NAMES = (
+    "Alpha", "Bravo", "Charlie", "Delta", "Echo", "Foxtrot", "Golf", "Hotel",
+    "India", "Juliett", "Kilo", "Lima", "Mike", "November", "Oscar", "Papa",
+    "Quebec", "Romeo", "Sierra", "Tango", "Uniform", "Victor", "Whiskey", "Xray",
+    "Yankee", "Zulu",
+)  # fmt: skip
+FIELD_NAMES = (
+    "name", "count", "level", "mode", "tags", "paths", "verbose", "quiet",
+    "depth", "color", "size_limit", "items", "target", "force", "dry_run", "extra",
+)  # fmt: skip
+WORDS = ("apple", "pear", "plum", "red", "green", "alpha", "leaf", "value")
+CHOICES = ("red", "green")
+
+# Never provided, as they print help or read from stdin.
+EXCLUDED = {"-h", "--help", "--help-search", "-"}
+
+
+def _word(rng: random.Random) -> str:
+    return f"{rng.choice(WORDS)}{rng.randrange(10)}"
+
+
+class FieldKind(NamedTuple):
+    annotation: str
+    default: str | None
+    """The default in the model source. None for a required field."""
+
+    role: str
+    """How the field is provided: positional, option, flag, collection or variadic."""
+
+    value: Callable[[random.Random], Any]
+
+
+FIELD_KINDS = (
+    FieldKind("str", None, "positional", _word),
+    FieldKind("int", None, "positional", lambda rng: rng.randrange(1000)),
+    FieldKind(
+        'Literal["red", "green"]', None, "positional", lambda rng: rng.choice(CHOICES)
+    ),
+    FieldKind("str", '"default"', "option", _word),
+    FieldKind("int", "0", "option", lambda rng: rng.randrange(1000)),
+    FieldKind('Literal["red", "green"]', '"red"', "option", lambda rng: "green"),
+    FieldKind("int | None", "None", "option", lambda rng: rng.randrange(1000)),
+    FieldKind("bool", "False", "flag", lambda rng: True),
+    FieldKind("bool", "True", "flag", lambda rng: False),
+    FieldKind("bool", None, "flag", lambda rng: rng.random() < 0.5),
+    FieldKind(
+        "list[str]",
+        "[]",
+        "collection",
+        lambda rng: [_word(rng) for _ in range(rng.randint(1, 3))],
+    ),
+    FieldKind(
+        "list[int]",
+        None,
+        "collection",
+        lambda rng: [rng.randrange(1000) for _ in range(rng.randint(1, 3))],
+    ),
+)
+VARIADIC = FieldKind(
+    "Annotated[list[str], variadic()]",
+    "[]",
+    "variadic",
+    lambda rng: [_word(rng) for _ in range(rng.randint(1, 4))],
+)
+
+
+class Node(NamedTuple):
+    """A randomly generated command."""
+
+    name: str
+    fields: list[tuple[str, FieldKind]]
+    children: list[Node]
+
+
+def _random_tree(rng: random.Random, name: str, depth: int, names: list[str]) -> Node:
+    children = []
+    if depth and len(names) >= 3 and rng.random() < 0.7:
+        child_names = [names.pop() for _ in range(rng.randint(2, 3))]
+        children = [
+            _random_tree(rng, child_name, depth - 1, names)
+            for child_name in child_names
+        ]
+    kinds = list(FIELD_KINDS)
+    if not children:
+        # consumes all values following it, so only a command without subcommands
+        # can have one.
+        kinds.append(VARIADIC)
+    fields = [
+        (field, rng.choice(kinds))
+        for field in rng.sample(FIELD_NAMES, rng.randint(0, 6))
+    ]
+    return Node(name, fields, children)
+
+
+def _class_source(node: Node) -> str:
+    lines = [f"class {node.name}(BaseModel):", "    pass"]
+    for field, kind in node.fields:
+        default = "" if kind.default is None else f" = {kind.default}"
+        lines.append(f"    {field}: {kind.annotation}{default}")
+    if node.children:
+        union = " | ".join(child.name for child in node.children)
+        lines.append(f"    sub_command: {union}")
+    return "\n".join(lines)
+
+
+def _iter_nodes(node: Node):
+    for child in node.children:
+        # subcommands are defined before the model referencing them.
+        yield from _iter_nodes(child)
+    yield node
+
+
+def _random_model(
+    seed: int, monkeypatch: pytest.MonkeyPatch
+) -> tuple[Node, ModuleType]:
+    """Return a random command tree and a module defining its models."""
+    rng = random.Random(seed)
+    root = _random_tree(rng, "Main", rng.randint(0, 3), list(COMMAND_NAMES))
+    source = "\n\n\n".join(
+        (
+            "from typing import Annotated, Literal\n\n"
+            "from clipstick import variadic\n"
+            "from pydantic import BaseModel",
+            *(_class_source(node) for node in _iter_nodes(root)),
+        )
+    )
+    # importable (until the end of the test), so a parser can be generated for it.
+    module = ModuleType(f"tests_fuzz_model_{seed}")
+    exec(compile(source, module.__name__, "exec", dont_inherit=True), module.__dict__)
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    return root, module
+
+
+def _key(field: str) -> str:
+    return f"--{field.replace('_', '-')}"
+
+
+def _keyed(rng: random.Random, key: str, value: object) -> list[str]:
+    if rng.random() < 0.3:
+        return [f"{key}={value}"]
+    return [key, str(value)]
+
+
+def _random_invocation(
+    rng: random.Random, node: Node, module: ModuleType
+) -> tuple[list[str], BaseModel]:
+    """Return valid arguments for a command and the model they should result in."""
+    values: dict[str, Any] = {}
+    # the arguments of each field, in order. Positionals are in order of definition.
+    positionals: list[list[str]] = []
+    streams: list[list[list[str]]] = [positionals]
+    variadic: list[str] = []
+    for field, kind in node.fields:
+        if kind.role != "positional" and kind.default is not None:
+            if rng.random() < 0.5:
+                continue
+        value = values[field] = kind.value(rng)
+        if kind.role == "positional":
+            positionals.append([str(value)])
+        elif kind.role == "option":
+            streams.append([_keyed(rng, _key(field), value)])
+        elif kind.role == "flag":
+            streams.append([[_key(field) if value else _key(f"no_{field}")]])
+        elif kind.role == "collection":
+            streams.append([_keyed(rng, _key(field), item) for item in value])
+        else:
+            # last, as it consumes all values following it.
+            variadic.extend((_key(field), *value))
+
+    # randomly interleaved, keeping the order of the arguments of each field.
+    args: list[str] = []
+    streams = [stream for stream in streams if stream]
+    while streams:
+        stream = rng.choice(streams)
+        args.extend(stream.pop(0))
+        if not stream:
+            streams.remove(stream)
+    args.extend(variadic)
+
+    if node.children:
+        child = rng.choice(node.children)
+        child_args, values["sub_command"] = _random_invocation(rng, child, module)
+        args.extend((child.name.lower(), *child_args))
+    return args, getattr(module, node.name)(**values)
+
+
+def _near_miss(rng: random.Random, key: str) -> str:
+    chars = list(key)
+    idx = rng.randrange(2, len(chars))
+    edit = rng.randrange(4)
+    if edit == 0:
+        del chars[idx]
+    elif edit == 1:
+        chars.insert(idx, chars[idx])
+    elif edit == 2:
+        chars[idx - 1], chars[idx] = chars[idx], chars[idx - 1]
+    else:
+        chars[idx] = rng.choice("abcdefghijklmnopqrstuvwxyz-_")
+    return "".join(chars)
+
+
+def _vocabulary(node: Node) -> list[str]:
+    """All keys, subcommand names and choices of the tree."""
+    words = list(CHOICES)
+    for command in _iter_nodes(node):
+        words.append(command.name.lower())
+        for field, kind in command.fields:
+            words.append(_key(field))
+            if kind.role == "flag":
+                words.append(_key(f"no_{field}"))
+    return words
+
+
+def _random_arg(rng: random.Random, vocabulary: list[str]) -> str:
+    pick = rng.random()
+    if pick < 0.35:
+        return rng.choice(vocabulary)
+    if pick < 0.5:
+        return _near_miss(rng, rng.choice(vocabulary))
+    if pick < 0.6:
+        # an abbreviation (or a misspelled short key).
+        word = rng.choice(vocabulary)
+        return word[: rng.randint(2, len(word))]
+    if pick < 0.7:
+        return f"{rng.choice(vocabulary)}={rng.choice((_word(rng), '1', ''))}"
+    if pick < 0.75:
+        return "--"
+    return rng.choice((_word(rng), str(rng.randrange(100)), "-1"))
+
+
+def _random_args(rng: random.Random, vocabulary: list[str]) -> list[str]:
+    args = [_random_arg(rng, vocabulary) for _ in range(rng.randint(0, 12))]
+    return [arg for arg in args if arg not in EXCLUDED]
+
+
+def _mutated(rng: random.Random, args: list[str], vocabulary: list[str]) -> list[str]:
+    """Return valid arguments with a few random edits. Mostly invalid."""
+    args = list(args)
+    for _ in range(rng.randint(1, 3)):
+        idx = rng.randint(0, len(args))
+        edit = rng.randrange(3)
+        if edit == 0 and idx < len(args):
+            del args[idx]
+        elif edit == 1 and idx + 1 < len(args):
+            args[idx], args[idx + 1] = args[idx + 1], args[idx]
+        else:
+            args.insert(idx, _random_arg(rng, vocabulary))
+    return [arg for arg in args if arg not in EXCLUDED]
+
+
+def _generated_parser(module: ModuleType, allow_abbrev: bool) -> Callable:
+    source = generate(module.Main, prog="fuzz", allow_abbrev=allow_abbrev)
+    namespace: dict[str, Any] = {}
+    exec(compile(source, "generated_parser.py", "exec"), namespace)
+    return namespace["parse"]
+
+
+def _reference(parser: Callable, args: list[str]) -> BaseModel | None:
+    """Return the model parsed by the generated parser. None if parsing fails."""
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return parser(list(args))
+    except SystemExit as err:
+        assert err.code == 1
+        return None
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_valid_arguments(seed, monkeypatch):
+    rng = random.Random(seed)
+    root, module = _random_model(seed, monkeypatch)
+    runner = CliRunner(module.Main)
+    parser = _generated_parser(module, allow_abbrev=False)
+
+    for _ in range(10):
+        args, expected = _random_invocation(rng, root, module)
+
+        result = runner.invoke(args)
+
+        assert result.model == expected, (args, result.stderr)
+        assert _reference(parser, args) == expected, args
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_random_arguments(seed, monkeypatch):
+    rng = random.Random(seed)
+    root, module = _random_model(seed, monkeypatch)
+    allow_abbrev = rng.random() < 0.5
+    runner = CliRunner(module.Main, allow_abbrev=allow_abbrev)
+    parser = _generated_parser(module, allow_abbrev=allow_abbrev)
+    vocabulary = _vocabulary(root)
+
+    for _ in range(30):
+        if rng.random() < 0.5:
+            args = _random_args(rng, vocabulary)
+        else:
+            args = _mutated(rng, _random_invocation(rng, root, module)[0], vocabulary)
+
+        result = runner.invoke(args)
+
+        assert result.exit_code == (1 if result.model is None else 0)
+        assert result.model == _reference(parser, args), (args, result.stderr)
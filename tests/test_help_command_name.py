@@ -10,7 +10,11 @@ class SimpleModel(BaseModel):
     """A snake cased argument."""
 
 
-@pytest.mark.parametrize("entrypoint", ["/test/my-app", "\\test\\my-app", "my-app"])
+@pytest.mark.parametrize(
+    "entrypoint",
+    ["/test/my-app", "\\test\\my-app", "my-app"],
+    ids=["posix-path", "windows-path", "name"],
+)
 def test_command_name(entrypoint, monkeypatch, capture_output):
     monkeypatch.setattr(_clipstick, "DUMMY_ENTRY_POINT", entrypoint)
 
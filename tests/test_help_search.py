@@ -0,0 +1,95 @@
+import pytest
+from clipstick import parse
+from clipstick._parse import compile_model
+from pydantic import BaseModel
+
+
+class Clone(BaseModel):
+    """Clone a repo."""
+
+    repo: str
+    """Repository to clone."""
+
+    depth: int = 1
+    """Depth of the history to clone."""
+
+
+class Info(BaseModel):
+    """Show repository info."""
+
+    verbose: bool = False
+    """Show detailed info."""
+
+
+class MyGit(BaseModel):
+    """My git cli."""
+
+    verbose: bool = False
+    """More output."""
+
+    sub_command: Clone | Info
+
+
+def _search(term: str) -> list[str]:
+    index = compile_model(MyGit, "my-cli-app").search_index
+    return [entry.usage for entry in index.search(term)]
+
+
+@pytest.mark.parametrize(
+    "term,usages",
+    [
+        ("depth", ["my-cli-app clone --depth"]),
+        ("hist", ["my-cli-app clone --depth"]),
+        (
+            "verbose",
+            ["my-cli-app --verbose", "my-cli-app info --verbose"],
+        ),
+        # matches on keys rank before matches on descriptions.
+        (
+            "repo",
+            ["my-cli-app clone repo", "my-cli-app clone", "my-cli-app info"],
+        ),
+        ("clone history", ["my-cli-app clone --depth"]),
+        ("unknown", []),
+        ("--", []),
+    ],
+)
+def test_search_index(term, usages):
+    assert _search(term) == usages
+
+
+def test_help_search(capture_output):
+    with pytest.raises(SystemExit) as err:
+        capture_output(MyGit, ["--help-search", "depth"])
+
+    assert err.value.code == 0
+    assert (
+        """
+Help matching 'depth':
+    my-cli-app clone --depth Depth of the history to clone. [int] [default = 1]
+"""
+        == capture_output.captured_output
+    )
+
+
+def test_help_search_at_any_level(capture_output):
+    with pytest.raises(SystemExit) as err:
+        capture_output(MyGit, ["info", "--help-search=clone"])
+
+    assert err.value.code == 0
+    assert "my-cli-app clone" in capture_output.captured_output
+
+
+def test_help_search_without_results(capture_output):
+    with pytest.raises(SystemExit) as err:
+        capture_output(MyGit, ["--help-search", "unknown"])
+
+    assert err.value.code == 0
+    assert "No help found for 'unknown'" in capture_output.captured_output
+
+
+def test_help_search_does_not_build_index_when_parsing():
+    command = compile_model(Info, "my-cli-app")
+    parse(Info, ["--verbose"])
+
+    assert "search_index" not in vars(command)
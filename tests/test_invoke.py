@@ -0,0 +1,125 @@
+from typing import Annotated
+
+import pytest
+from clipstick import invoke, parse, short
+from clipstick._exceptions import (
+    AmbiguousField,
+    MissingSubcommand,
+    UnknownArgument,
+    UnknownField,
+)
+from pydantic import BaseModel, PositiveInt, ValidationError, field_validator
+
+
+class Clone(BaseModel):
+    """Clone a repository."""
+
+    repo: str
+    depth: PositiveInt = 1
+    tags: list[str] = []
+
+
+class Add(BaseModel):
+    """Add a remote."""
+
+    name: str
+    url: str
+
+
+class Remove(BaseModel):
+    """Remove a remote."""
+
+    name: str
+
+
+class Remote(BaseModel):
+    """Manage remotes."""
+
+    verbose: Annotated[bool, short("v")] = False
+    sub_command: Add | Remove
+
+
+class MyGit(BaseModel):
+    """My git."""
+
+    verbose: bool = False
+    sub_command: Clone | Remote
+
+
+class Validated(BaseModel):
+    name: str
+
+    @field_validator("name")
+    @classmethod
+    def upper(cls, value: str) -> str:
+        return value.upper()
+
+
+def test_invoke_equals_parse():
+    assert invoke(MyGit, "clone", repo="my_repo", depth=3, tags=["a", "b"]) == parse(
+        MyGit, ["clone", "my_repo", "--depth", "3", "--tags", "a", "--tags", "b"]
+    )
+
+
+def test_invoke_nested_subcommand():
+    model = invoke(MyGit, ["remote", "add"], name="origin", url="https://my_repo")
+    assert model == MyGit(
+        sub_command=Remote(sub_command=Add(name="origin", url="https://my_repo"))
+    )
+
+
+def test_invoke_path_string():
+    assert invoke(MyGit, "remote remove", name="origin") == invoke(
+        MyGit, ("remote", "remove"), name="origin"
+    )
+
+
+def test_invoke_defaults():
+    model = invoke(MyGit, "clone", repo="my_repo")
+    assert model.sub_command == Clone(repo="my_repo", depth=1, tags=[])
+    assert model.model_fields_set == {"sub_command"}
+
+
+def test_invoke_without_subcommands():
+    assert invoke(Validated, name="value") == Validated(name="VALUE")
+
+
+def test_invoke_validates_values():
+    with pytest.raises(ValidationError) as err:
+        invoke(MyGit, "clone", repo="my_repo", depth=-1)
+
+    assert [error["loc"] for error in err.value.errors()] == [("depth",)]
+
+
+def test_invoke_missing_value():
+    with pytest.raises(ValidationError) as err:
+        invoke(MyGit, "clone", depth="x")
+
+    assert sorted(error["type"] for error in err.value.errors()) == [
+        "int_parsing",
+        "missing",
+    ]
+
+
+def test_invoke_missing_subcommand():
+    with pytest.raises(MissingSubcommand):
+        invoke(MyGit, "remote", name="origin")
+
+
+def test_invoke_unknown_subcommand():
+    with pytest.raises(UnknownArgument) as err:
+        invoke(MyGit, "remote rmove", name="origin")
+
+    assert err.value.suggestions == ["remove"]
+    assert err.value.argument_index == 1
+
+
+def test_invoke_unknown_field():
+    with pytest.raises(UnknownField):
+        # url is a field of a subcommand which is not selected.
+        invoke(MyGit, "remote remove", name="origin", url="https://my_repo")
+
+
+def test_invoke_ambiguous_field():
+    with pytest.raises(AmbiguousField):
+        invoke(MyGit, "remote remove", name="origin", verbose=True)
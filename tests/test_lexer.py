@@ -0,0 +1,67 @@
+import pytest
+from clipstick import parse
+from clipstick._lexer import Kind, lex
+from pydantic import BaseModel
+
+
+@pytest.mark.parametrize(
+    "args,values,kinds",
+    [
+        (["value"], ["value"], [Kind.VALUE]),
+        (["-"], ["-"], [Kind.VALUE]),
+        (["--verbose"], ["--verbose"], [Kind.LONG]),
+        (["-v"], ["-v"], [Kind.SHORT]),
+        (["-h", "--help"], ["-h", "--help"], [Kind.HELP, Kind.HELP]),
+        (
+            ["--help-search", "term"],
+            ["--help-search", "term"],
+            [Kind.HELP_SEARCH, Kind.VALUE],
+        ),
+        (
+            ["--help-search=term"],
+            ["--help-search", "term"],
+            [Kind.HELP_SEARCH, Kind.ATTACHED],
+        ),
+        (["--key=value"], ["--key", "value"], [Kind.LONG, Kind.ATTACHED]),
+        (["--key=a=b"], ["--key", "a=b"], [Kind.LONG, Kind.ATTACHED]),
+        (["--", "-v", "-h"], ["-v", "-h"], [Kind.VALUE, Kind.VALUE]),
+        (["a", "--", "--"], ["a", "--"], [Kind.VALUE, Kind.VALUE]),
+    ],
+)
+def test_lex(args, values, kinds):
+    arguments = lex(args)
+    assert arguments.values == values
+    assert arguments.kinds == kinds
+
+
+class MyModel(BaseModel):
+    my_value: int
+    name: str = "John"
+    verbose: bool = False
+
+
+@pytest.mark.parametrize(
+    "args,expected",
+    [
+        (["10", "--name=Jane"], MyModel(my_value=10, name="Jane")),
+        (["--name=--verbose", "10"], MyModel(my_value=10, name="--verbose")),
+        (["--name=", "10"], MyModel(my_value=10, name="")),
+        (["--verbose", "--", "-10"], MyModel(my_value=-10, verbose=True)),
+    ],
+)
+def test_parse_lexed_arguments(args, expected):
+    assert parse(MyModel, args) == expected
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["10", "--verbose=true"],
+        ["--", "10", "--verbose"],
+        ["-10"],
+    ],
+)
+def test_parse_lexed_arguments_fails(args):
+    with pytest.raises(SystemExit) as err:
+        parse(MyModel, args)
+    assert err.value.code == 1
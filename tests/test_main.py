@@ -0,0 +1,158 @@
+import json
+import subprocess
+import sys
+
+import pytest
+from clipstick import parse
+from clipstick.__main__ import Clipstick
+from clipstick._profile import PHASES, profile
+from clipstick._synthetic import synthetic_args, synthetic_model
+from pydantic import BaseModel
+
+
+class Clone(BaseModel):
+    """Clone a repo."""
+
+    repo: str
+    depth: int = 1
+
+
+class Info(BaseModel):
+    """Show repo info."""
+
+
+class MyGit(BaseModel):
+    """My git cli."""
+
+    verbose: bool = False
+    sub_command: Clone | Info
+
+
+class Invalid(BaseModel):
+    help: bool = False
+
+
+MODEL = f"{__name__}:MyGit"
+
+
+def _main(args: list[str]) -> None:
+    parse(Clipstick, args).sub_command.main()
+
+
+@pytest.mark.parametrize(
+    "size", [(0, 0, 0), (1, 0, 3), (5, 2, 1), (12, 3, 2), (3, 4, 3)]
+)
+def test_synthetic_model(size):
+    model = synthetic_model(*size)
+    assert parse(model, synthetic_args(*size))
+
+
+@pytest.mark.parametrize("size", [(-1, 0, 0), (1, 1, 1), (1, 2, -1)])
+def test_synthetic_model_invalid_size(size):
+    with pytest.raises(ValueError):
+        synthetic_model(*size)
+
+
+def test_profile():
+    timings = profile(MyGit, ["clone", "my_repo"], "my-cli-app", repeat=3)
+
+    assert [timing.phase for timing in timings] == list(PHASES)
+    assert all(timing.first > 0 and timing.median > 0 for timing in timings)
+
+
+def test_inspect(capsys):
+    _main(["inspect", MODEL])
+
+    assert capsys.readouterr().out == (
+        "tests\n"
+        "├── --verbose bool\n"
+        "├── clone Clone a repo.\n"
+        "│   ├── repo str\n"
+        "│   └── --depth int\n"
+        "└── info Show repo info.\n"
+    )
+
+
+def test_inspect_manifest(capsys):
+    _main(["inspect", MODEL, "--format", "manifest", "--prog", "my-git"])
+
+    assert json.loads(capsys.readouterr().out)["command"]["name"] == "my-git"
+
+
+def test_lint(capsys):
+    _main(["lint", MODEL])
+
+    assert capsys.readouterr().out == "No problems found.\n"
+
+
+def test_lint_problems(capsys):
+    with pytest.raises(SystemExit) as err:
+        _main(["lint", f"{__name__}:Invalid"])
+
+    assert err.value.code == 1
+    # the output is wrapped to the width of the console.
+    assert "reserved for help output" in " ".join(capsys.readouterr().out.split())
+
+
+def test_profile_command(capsys):
+    _main(
+        [
+            "profile",
+            MODEL,
+            "--repeat",
+            "2",
+            "--args",
+            "--",
+            "clone",
+            "my_repo",
+            "--depth=2",
+        ]
+    )
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split()[0] for line in lines] == ["phase", *PHASES]
+
+
+def test_profile_command_invalid_args(capsys):
+    with pytest.raises(SystemExit) as err:
+        _main(["profile", MODEL, "--args", "--", "clone"])
+
+    assert err.value.code == 1
+    output = " ".join(capsys.readouterr().out.split())
+    assert "Missing a value for positional argument 'repo'" in output
+
+
+def test_benchmark(capsys):
+    _main(["benchmark", "--options", "3", "--subcommands", "2", "--parses", "2"])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "7 commands, 28 tokens, 20 arguments, 2 parses"
+
+
+def test_precompile(tmp_path):
+    output = tmp_path / "parser.py"
+
+    _main(["precompile", MODEL, "--output", str(output), "--prog", "my-git"])
+
+    source = output.read_text()
+    assert "my-git" in source
+    assert f"python -m clipstick precompile {MODEL} --output" in source
+
+
+def test_precompile_manifest(tmp_path):
+    output = tmp_path / "manifest.json"
+
+    _main(["precompile", MODEL, "--format", "manifest", "--output", str(output)])
+
+    assert json.loads(output.read_text())["manifest_version"] == 1
+
+
+def test_usage_names_the_module():
+    result = subprocess.run(
+        [sys.executable, "-m", "clipstick", "-h"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert "Usage: python -m clipstick [Subcommands]" in result.stdout
@@ -0,0 +1,120 @@
+import json
+from typing import Annotated, Literal
+
+from clipstick import manifest, short, variadic
+from pydantic import BaseModel, Field
+
+
+class Clone(BaseModel):
+    """Clone a repo."""
+
+    repo: str
+    """Repository to clone."""
+
+    depth: int = 1
+    mode: Literal["fast", "slow"] | None = None
+    tags: Annotated[list[str], variadic()] = Field(default_factory=list)
+
+
+class Info(BaseModel):
+    """Show info."""
+
+
+class MyGit(BaseModel):
+    """My git cli."""
+
+    verbose: Annotated[bool, short("v")] = False
+    sub_command: Clone | Info
+
+
+def test_manifest():
+    data = manifest(MyGit, prog="my-cli-app")
+
+    assert data["manifest_version"] == 1
+    root = data["command"]
+    assert root["kind"] == "command"
+    assert root["name"] == "my-cli-app"
+    assert root["description"] == "My git cli."
+    assert root["model"] == "tests.test_manifest:MyGit"
+    assert [token["field"] for token in root["tokens"]] == ["verbose"]
+    assert [sub["name"] for sub in root["subcommands"]] == ["clone", "info"]
+
+    clone = root["subcommands"][0]
+    assert clone["kind"] == "subcommand"
+    assert clone["path"] == ["clone"]
+    assert clone["tokens"] == [
+        {
+            "field": "repo",
+            "kind": "positional",
+            "user_keys": ["repo"],
+            "required": True,
+            "type": "str",
+            "choices": None,
+            "default": None,
+            "variadic": False,
+            "description": "Repository to clone.",
+            "help": {
+                "arguments": "repo",
+                "description": "Repository to clone.",
+                "type": "str",
+                "default": "",
+            },
+        },
+        {
+            "field": "depth",
+            "kind": "optional",
+            "user_keys": ["--depth"],
+            "required": False,
+            "type": "int",
+            "choices": None,
+            "default": 1,
+            "variadic": False,
+            "description": "",
+            "help": {
+                "arguments": "--depth",
+                "description": "",
+                "type": "int",
+                "default": "default = 1",
+            },
+        },
+        {
+            "field": "mode",
+            "kind": "optional_choice",
+            "user_keys": ["--mode"],
+            "required": False,
+            "type": "Literal['fast', 'slow']",
+            "choices": ["fast", "slow"],
+            "default": None,
+            "variadic": False,
+            "description": "",
+            "help": {
+                "arguments": "--mode",
+                "description": "",
+                "type": "allowed values: fast, slow",
+                "default": "default = None",
+            },
+        },
+        {
+            "field": "tags",
+            "kind": "optional_collection",
+            "user_keys": ["--tags"],
+            "required": False,
+            "type": "list[str]",
+            "choices": None,
+            "default": [],
+            "variadic": True,
+            "description": "",
+            "help": {
+                "arguments": "--tags",
+                "description": " Can be applied multiple times.",
+                "type": "list[str]",
+                "default": "default = PydanticUndefined",
+            },
+        },
+    ]
+
+
+def test_manifest_is_json_serializable():
+    data = manifest(MyGit, prog="my-cli-app")
+
+    assert json.loads(json.dumps(data)) == data
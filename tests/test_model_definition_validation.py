@@ -2,14 +2,21 @@
 
 Some constraints apply though. These constraints are tested here.
 """
-from typing import Annotated
+from typing import Annotated, Literal
 
 import pytest
 from clipstick._annotations import short
 from clipstick._exceptions import (
+    DuplicateKey,
+    DuplicateSubcommand,
+    InvalidModelErrors,
+    NestedModelField,
+    ReservedKey,
+    SubcommandNotLast,
     TooManyShortsException,
+    UnreachableChoice,
 )
-from clipstick._parse import _validate_shorts
+from clipstick._parse import _validate_shorts, compile_model
 from pydantic import BaseModel
 
 
@@ -86,3 +93,77 @@ def test_no_default_allowed(capture_output):
 
     assert err.value.code == 1
     assert "A subcommand cannot have a default value." in capture_output.captured_output
+
+
+class NestedField(BaseModel):
+    nested: Model_4
+
+
+class NegatedKeyCollision(BaseModel):
+    verbose: bool = True
+    no_verbose: str = "a"
+
+
+class HelpFlag(BaseModel):
+    help: bool = False
+
+
+class ShortHelp(BaseModel):
+    hidden: Annotated[bool, short("h")] = False
+
+
+class IntChoicePositional(BaseModel):
+    level: Literal[1, 2]
+
+
+class SubcommandFirst(BaseModel):
+    sub_command: Model_4 | Model_5
+    verbose: bool = False
+
+
+class Other:
+    class Model_4(BaseModel):
+        pass
+
+
+class DuplicateNames(BaseModel):
+    sub_command: Model_4 | Other.Model_4
+
+
+@pytest.mark.parametrize(
+    "model,error",
+    [
+        (NestedField, NestedModelField),
+        (NegatedKeyCollision, DuplicateKey),
+        (HelpFlag, ReservedKey),
+        (ShortHelp, ReservedKey),
+        (IntChoicePositional, UnreachableChoice),
+        (SubcommandFirst, SubcommandNotLast),
+        (DuplicateNames, DuplicateSubcommand),
+    ],
+)
+def test_static_analysis(model, error):
+    with pytest.raises(InvalidModelErrors) as err:
+        compile_model(model, "my-cli-app")
+
+    assert [type(problem) for problem in err.value.errors] == [error]
+
+
+class MultipleProblems(BaseModel):
+    help: bool = False
+    sub_command: NestedField | NegatedKeyCollision
+
+
+def test_static_analysis_reports_all_problems(capture_output):
+    with pytest.raises(SystemExit) as err:
+        capture_output(MultipleProblems, ["-h"])
+
+    assert err.value.code == 1
+    assert capture_output.captured_output == (
+        "ERROR:\n"
+        "Key '--help' of field 'help' of 'MultipleProblems' is reserved for help output.\n"
+        "Field 'nested' of 'NestedField' is a model, but not a subcommand. Use a union "
+        "of models to define subcommands.\n"
+        "Key '--no-verbose' of 'NegatedKeyCollision' is used by multiple fields: "
+        "'verbose', 'no_verbose'.\n"
+    )
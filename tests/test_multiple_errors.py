@@ -0,0 +1,126 @@
+import pytest
+from clipstick import parse
+from clipstick._exceptions import (
+    FieldError,
+    MissingOptionValue,
+    MissingPositional,
+    MissingSubcommand,
+    ParseErrors,
+    UnexpectedArgument,
+    UnknownArgument,
+)
+from clipstick._lexer import lex
+from clipstick._parse import compile_model
+from clipstick._tokens import ParseOptions, ParseState
+from pydantic import BaseModel, PositiveInt, model_validator
+
+
+class Clone(BaseModel):
+    """Clone a repo."""
+
+    repo: str
+    target: str
+    depth: PositiveInt = 1
+
+
+class Info(BaseModel):
+    verbose: bool = False
+
+
+class MyGit(BaseModel):
+    count: PositiveInt = 1
+    sub_command: Clone | Info
+
+
+class Range(BaseModel):
+    start: int
+    end: int
+
+    @model_validator(mode="after")
+    def check_range(self) -> "Range":
+        if self.start > self.end:
+            raise ValueError("start must not exceed end")
+        return self
+
+
+def _errors(model: type[BaseModel], args: list[str]) -> list:
+    root_node = compile_model(model, "my-cli-app")
+    state = ParseState(root_node, lex(args), ParseOptions())
+    root_node.match(0, state)
+    errors = list(state.errors)
+    try:
+        root_node.parse(state)
+    except ParseErrors as err:
+        errors.extend(err.errors)
+    return errors
+
+
+def test_all_errors_of_all_levels_are_reported():
+    errors = _errors(
+        MyGit, ["--count", "-1", "--unknown", "clone", "--depth", "0", "--depht"]
+    )
+
+    assert [type(error) for error in errors] == [
+        UnknownArgument,
+        UnknownArgument,
+        MissingPositional,
+        MissingPositional,
+        FieldError,
+        FieldError,
+    ]
+    assert [getattr(error, "argument_index", None) for error in errors[:2]] == [2, 6]
+    assert errors[4].argument_indexes == [1]
+    assert errors[5].argument_indexes == [5]
+
+
+def test_missing_option_value():
+    errors = _errors(MyGit, ["info", "--verbose", "--count"])
+
+    assert [type(error) for error in errors] == [UnknownArgument]
+
+    errors = _errors(MyGit, ["--count"])
+    assert [type(error) for error in errors] == [MissingOptionValue, MissingSubcommand]
+    assert errors[0].argument_index == 0
+
+
+def test_unexpected_values():
+    errors = _errors(Info, ["extra", "--verbose=yes", "more"])
+
+    assert [type(error) for error in errors] == [UnexpectedArgument] * 3
+    assert [error.argument_index for error in errors] == [0, 1, 2]
+
+
+def test_model_validator_error(capture_output):
+    with pytest.raises(SystemExit) as err:
+        capture_output(Range, ["10", "1"])
+
+    assert err.value.code == 1
+    assert (
+        """ERROR:
+Invalid arguments. Value error, start must not exceed end
+"""
+        == capture_output.captured_output
+    )
+
+
+def test_multiple_errors_output(capture_output):
+    with pytest.raises(SystemExit) as err:
+        capture_output(MyGit, ["--count", "0", "clone", "--dept", "2"])
+
+    assert err.value.code == 1
+    assert (
+        """ERROR:
+--dept is unknown. Did you mean --depth?
+Missing a value for positional argument 'repo'
+Missing a value for positional argument 'target'
+Incorrect value for --count ('0'). Input should be greater than 0
+Use the-h argument to help
+"""
+        == capture_output.captured_output
+    )
+
+
+def test_valid_arguments_still_parse():
+    assert parse(MyGit, ["clone", "a", "b"]) == MyGit(
+        sub_command=Clone(repo="a", target="b")
+    )
@@ -0,0 +1,171 @@
+from pathlib import Path
+from typing import Annotated, Iterable
+
+import pytest
+from clipstick import ParseCache, parse, uncached
+from pydantic import BaseModel, FilePath
+
+
+class Status(BaseModel):
+    """Show status."""
+
+    verbose: bool = False
+    """Verbose output."""
+
+    tags: list[str] = []
+
+
+class Check(BaseModel):
+    """Check a file."""
+
+    file: FilePath
+
+
+class Lookup(BaseModel):
+    """Lookup a host."""
+
+    host: Annotated[str, uncached()]
+
+
+class Stream(BaseModel):
+    """Stream items."""
+
+    items: Iterable[str] = ()
+
+
+class MyCli(BaseModel):
+    sub_command: Status | Check | Lookup | Stream
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_hit_returns_equal_copy():
+    parse_cache = ParseCache()
+
+    first = parse(MyCli, ["status", "--tags", "a"], cache=parse_cache)
+    second = parse(MyCli, ["status", "--tags", "a"], cache=parse_cache)
+
+    assert first == second
+    assert first is not second
+    assert parse_cache.cache_info() == (1, 1, 128, 1)
+
+
+def test_mutating_result_does_not_change_cache():
+    parse_cache = ParseCache()
+
+    first = parse(MyCli, ["status", "--tags", "a"], cache=parse_cache)
+    first.sub_command.tags.append("b")  # type: ignore[union-attr]
+
+    assert parse(MyCli, ["status", "--tags", "a"], cache=parse_cache) == MyCli(
+        sub_command=Status(tags=["a"])
+    )
+
+
+def test_different_arguments_miss():
+    parse_cache = ParseCache()
+
+    parse(MyCli, ["status"], cache=parse_cache)
+    result = parse(MyCli, ["status", "--verbose"], cache=parse_cache)
+
+    assert result == MyCli(sub_command=Status(verbose=True))
+    assert parse_cache.cache_info().misses == 2
+
+
+def test_least_recently_used_is_evicted():
+    parse_cache = ParseCache(maxsize=2)
+
+    parse(MyCli, ["status"], cache=parse_cache)
+    parse(MyCli, ["status", "--verbose"], cache=parse_cache)
+    parse(MyCli, ["status"], cache=parse_cache)
+    parse(MyCli, ["status", "--tags", "a"], cache=parse_cache)
+
+    assert len(parse_cache) == 2
+    parse(MyCli, ["status"], cache=parse_cache)
+    parse(MyCli, ["status", "--verbose"], cache=parse_cache)
+    assert parse_cache.cache_info() == (2, 4, 2, 2)
+
+
+def test_expired_result_is_parsed_again():
+    clock = Clock()
+    parse_cache = ParseCache(ttl=10, clock=clock)
+
+    parse(MyCli, ["status"], cache=parse_cache)
+    clock.now = 9
+    parse(MyCli, ["status"], cache=parse_cache)
+    clock.now = 10
+    parse(MyCli, ["status"], cache=parse_cache)
+
+    assert parse_cache.cache_info() == (1, 2, 128, 1)
+
+
+def test_path_fields_are_not_cached(tmp_path: Path):
+    file = tmp_path / "file.txt"
+    file.touch()
+    parse_cache = ParseCache()
+
+    parse(MyCli, ["check", str(file)], cache=parse_cache)
+    file.unlink()
+
+    with pytest.raises(SystemExit):
+        parse(MyCli, ["check", str(file)], cache=parse_cache)
+    assert len(parse_cache) == 0
+
+
+def test_uncached_fields_are_not_cached():
+    parse_cache = ParseCache()
+
+    parse(MyCli, ["lookup", "localhost"], cache=parse_cache)
+    parse(MyCli, ["lookup", "localhost"], cache=parse_cache)
+
+    assert parse_cache.cache_info() == (0, 2, 128, 0)
+
+
+def test_iterable_fields_are_not_cached():
+    parse_cache = ParseCache()
+
+    for _ in range(2):
+        result = parse(MyCli, ["stream", "--items", "a"], cache=parse_cache)
+        assert list(result.sub_command.items) == ["a"]  # type: ignore[union-attr]
+
+    assert parse_cache.cache_info() == (0, 2, 128, 0)
+
+
+def test_changed_env_variable_misses(monkeypatch):
+    parse_cache = ParseCache()
+
+    monkeypatch.setenv("MY_CLI_STATUS_VERBOSE", "false")
+    parse(MyCli, ["status"], env_prefix="MY_CLI_", cache=parse_cache)
+    monkeypatch.setenv("MY_CLI_STATUS_VERBOSE", "true")
+    result = parse(MyCli, ["status"], env_prefix="MY_CLI_", cache=parse_cache)
+
+    assert result == MyCli(sub_command=Status(verbose=True))
+    assert parse_cache.cache_info().hits == 0
+
+
+def test_failed_parse_is_not_cached():
+    parse_cache = ParseCache()
+
+    with pytest.raises(SystemExit):
+        parse(MyCli, ["status", "--unknown"], cache=parse_cache)
+
+    assert len(parse_cache) == 0
+
+
+def test_clear():
+    parse_cache = ParseCache()
+    parse(MyCli, ["status"], cache=parse_cache)
+
+    parse_cache.clear()
+
+    assert parse_cache.cache_info() == (0, 0, 128, 0)
+
+
+def test_invalid_maxsize_raises():
+    with pytest.raises(ValueError):
+        ParseCache(maxsize=0)
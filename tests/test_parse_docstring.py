@@ -1,6 +1,11 @@
+import importlib
+import os
+import sys
+from textwrap import dedent
 from typing import Annotated
+
 import pytest
-from clipstick._docstring import set_undefined_field_descriptions_from_var_docstrings
+from clipstick._docstring import field_docstrings
 from pydantic import BaseModel, Field
 
 
@@ -32,13 +37,38 @@ def some_function():
 @pytest.mark.parametrize(
     "model", [GlobalModel, SomeClass.ModelInClass, some_function()]
 )
-def test_set_field_descriptions_for_var_docstrings(model: type[BaseModel]):
-    set_undefined_field_descriptions_from_var_docstrings(model)
-    assert (
-        model.model_fields["my_value_docstring"].description
-        == "Docstring for my_value."
-    )
+def test_field_docstrings(model: type[BaseModel]):
+    assert field_docstrings(model) == {"my_value_docstring": "Docstring for my_value."}
+    # the model itself is left untouched.
+    assert model.model_fields["my_value_docstring"].description is None
     assert (
         model.model_fields["my_value_annotation"].description
         == "Description for my_value."
     )
+
+
+def test_edited_source_is_read_again(tmp_path, monkeypatch):
+    source = tmp_path / "edited_model.py"
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    docstrings = []
+    for version, docstring in enumerate(("First.", "Second.")):
+        source.write_text(
+            dedent(
+                f'''
+                from pydantic import BaseModel
+
+
+                class Edited(BaseModel):
+                    value: str
+                    """{docstring}"""
+                '''
+            )
+        )
+        # a different modification time, also on filesystems with a coarse resolution.
+        os.utime(source, ns=(version * 10**9, version * 10**9))
+        module = importlib.import_module("edited_model")
+        monkeypatch.setitem(sys.modules, "edited_model", importlib.reload(module))
+        docstrings.append(field_docstrings(sys.modules["edited_model"].Edited))
+
+    assert docstrings == [{"value": "First."}, {"value": "Second."}]
@@ -0,0 +1,175 @@
+import importlib.metadata
+import os
+from typing import Annotated
+
+import pytest
+from clipstick import manifest, parse, plugins
+from clipstick._clipstick import DUMMY_ENTRY_POINT
+from clipstick._exceptions import InvalidModelErrors
+from clipstick._parse import compile_model
+from clipstick._plugins import entry_points
+from clipstick.testing import CliRunner
+from pydantic import BaseModel
+
+ENTRY_POINTS = """[my_cli.commands]
+push = tests.test_plugins:Push
+
+[my_cli.broken]
+missing = tests.test_plugins:Missing
+invalid = tests.test_plugins:Invalid
+"""
+
+
+class Push(BaseModel):
+    """Push provided by a plugin."""
+
+    force: bool = False
+
+
+class Pull(BaseModel):
+    """Pull a branch."""
+
+    branch: str
+
+
+class MyCli(BaseModel):
+    sub_command: Annotated[Pull, plugins("my_cli.commands")]
+
+
+class Invalid(BaseModel):
+    """A plugin whose keys clash with the help keys."""
+
+    help: bool = False
+
+
+class BrokenCli(BaseModel):
+    sub_command: Annotated[Pull, plugins("my_cli.broken")]
+
+
+@pytest.fixture(autouse=True)
+def site_packages(tmp_path, monkeypatch):
+    monkeypatch.setenv("CLIPSTICK_CACHE_DIR", str(tmp_path / "cache"))
+
+    site_packages = tmp_path / "site-packages"
+    dist_info = site_packages / "my_plugin-1.0.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: my-plugin\nVersion: 1.0\n"
+    )
+    (dist_info / "entry_points.txt").write_text(ENTRY_POINTS)
+    monkeypatch.syspath_prepend(str(site_packages))
+    return site_packages
+
+
+def test_parse_plugin_subcommand():
+    model = parse(MyCli, ["push", "--force"])
+    assert model == MyCli(sub_command=Push(force=True))
+
+
+def test_parse_builtin_subcommand():
+    model = parse(MyCli, ["pull", "main"])
+    assert model == MyCli(sub_command=Pull(branch="main"))
+
+
+def test_entry_points_are_cached(monkeypatch):
+    assert entry_points("my_cli.commands") == [("push", "tests.test_plugins:Push")]
+
+    def _fail(**kwargs):
+        raise AssertionError("entry points should be read from cache.")
+
+    monkeypatch.setattr(importlib.metadata, "entry_points", _fail)
+    assert entry_points("my_cli.commands") == [("push", "tests.test_plugins:Push")]
+
+
+def test_cache_invalidated_on_site_packages_change(site_packages):
+    assert entry_points("my_cli.commands") == [("push", "tests.test_plugins:Push")]
+
+    # simulate installing a new version of the plugin.
+    (site_packages / "my_plugin-1.0.dist-info" / "entry_points.txt").write_text(
+        "[my_cli.commands]\nfetch = tests.test_plugins:Push\n"
+    )
+    stat = site_packages.stat()
+    os.utime(site_packages, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert entry_points("my_cli.commands") == [("fetch", "tests.test_plugins:Push")]
+
+
+def test_plugin_help(capture_output):
+    with pytest.raises(SystemExit) as err:
+        capture_output(MyCli, ["-h"])
+
+    assert err.value.code == 0
+    assert (
+        """
+Usage: my-cli-app [Subcommands]
+
+Subcommands:
+    pull                 Pull a branch.
+    push                 Push provided by a plugin.
+"""
+        == capture_output.captured_output
+    )
+
+
+def test_manifest_includes_plugin_subcommands():
+    data = manifest(MyCli, prog="my-plugin-cli")
+
+    pull, push = data["command"]["subcommands"]
+    assert pull["plugin"] is None
+    assert push["kind"] == "plugin_subcommand"
+    assert push["plugin"] == "tests.test_plugins:Push"
+    assert [token["field"] for token in push["tokens"]] == ["force"]
+
+
+@pytest.mark.parametrize(
+    "args,error",
+    [
+        (["missing"], "Unable to import 'tests.test_plugins:Missing'"),
+        (["invalid"], "is reserved for help output"),
+        (["missing", "-h"], "Unable to import 'tests.test_plugins:Missing'"),
+    ],
+)
+def test_broken_plugin_is_reported(args, error):
+    result = CliRunner(BrokenCli).invoke(args)
+
+    assert result.exit_code == 1
+    assert error in result.stderr
+
+
+def test_broken_plugins_do_not_break_other_subcommands():
+    assert CliRunner(BrokenCli).invoke(["pull", "main"]).model == BrokenCli(
+        sub_command=Pull(branch="main")
+    )
+
+
+def test_broken_plugins_are_flagged_in_help(capture_output):
+    with pytest.raises(SystemExit) as err:
+        capture_output(BrokenCli, ["-h"])
+
+    assert err.value.code == 0
+    assert "Unable to load plugin tests.test_plugins:Missing." in (
+        capture_output.captured_output
+    )
+    assert "Unable to load plugin tests.test_plugins:Invalid." in (
+        capture_output.captured_output
+    )
+
+
+def test_failed_load_starts_over():
+    plugin = compile_model(BrokenCli, DUMMY_ENTRY_POINT).sub_command_keys["invalid"]
+
+    for _ in range(2):
+        with pytest.raises(InvalidModelErrors):
+            plugin.load()  # type: ignore[attr-defined]
+        assert plugin.tokens == {}
+        assert plugin.cls is BaseModel
+
+
+def test_help_search_leaves_out_broken_plugins():
+    result = CliRunner(BrokenCli).invoke(["--help-search", "branch pydantic"])
+    assert result.exit_code == 0
+    assert "No help found for" in result.stdout
+
+    result = CliRunner(BrokenCli).invoke(["--help-search", "branch"])
+    assert result.exit_code == 0
+    assert "Pull a branch." in result.stdout
@@ -0,0 +1,104 @@
+import io
+
+import pytest
+from clipstick import parse, render_help
+from pydantic import BaseModel
+from rich.console import Console
+
+
+class Clone(BaseModel):
+    """Clone a repo.
+
+    Clones into the current folder.
+    """
+
+    repo: str
+    """Repository to clone."""
+
+    depth: int = 1
+
+
+class Info(BaseModel):
+    """Show info."""
+
+
+class MyGit(BaseModel):
+    """My git cli."""
+
+    verbose: bool = False
+    sub_command: Clone | Info
+
+
+def test_render_all_commands():
+    pages = render_help(MyGit, prog="my-cli-app")
+
+    assert list(pages) == [(), ("clone",), ("info",)]
+
+
+@pytest.mark.parametrize("path", [[], ["clone"], ["info"]])
+def test_text_equals_help_output(path):
+    output = Console(file=io.StringIO(), width=80)
+    with pytest.raises(SystemExit):
+        parse(MyGit, [*path, "-h"], output=output)
+
+    pages = render_help(MyGit, prog="my-cli-app", width=80)
+    assert pages[tuple(path)] == output.file.getvalue()
+
+
+def test_ansi():
+    pages = render_help(MyGit, prog="my-cli-app", format="ansi")
+
+    assert "\x1b[" in pages[("clone",)]
+    assert "\x1b[" not in render_help(MyGit, prog="my-cli-app")[("clone",)]
+
+
+def test_markdown():
+    pages = render_help(MyGit, prog="my-cli-app", format="markdown")
+
+    assert pages[("clone",)] == (
+        """# my-cli-app clone
+
+Clone a repo.
+
+Clones into the current folder.
+
+## Arguments
+
+| Argument | Description | Type | Default |
+| --- | --- | --- | --- |
+| repo | Repository to clone. | str |  |
+
+## Options
+
+| Option | Description | Type | Default |
+| --- | --- | --- | --- |
+| --depth |  | int | default = 1 |
+"""
+    )
+    assert "- `clone`: Clone a repo.\n- `info`: Show info.\n" in pages[()]
+
+
+def test_roff():
+    pages = render_help(MyGit, prog="my-cli-app", format="roff")
+
+    assert pages[("clone",)] == (
+        """.TH "MY\\-CLI\\-APP\\-CLONE" 1
+.SH NAME
+my\\-cli\\-app clone \\- Clone a repo.
+.SH SYNOPSIS
+.B my\\-cli\\-app clone
+[Arguments] [Options]
+.SH DESCRIPTION
+Clone a repo.
+.PP
+Clones into the current folder.
+.SH ARGUMENTS
+.TP
+.B repo
+Repository to clone. [str]
+.SH OPTIONS
+.TP
+.B \\-\\-depth
+[int] [default = 1]
+"""
+    )
@@ -0,0 +1,62 @@
+from pathlib import Path
+
+import pytest
+from clipstick import parse
+from clipstick._exceptions import InvalidResponseFile
+from clipstick._streams import expand_response_files
+from pydantic import BaseModel
+
+
+class Files(BaseModel):
+    name: str
+    files: list[Path] = []
+    verbose: bool = False
+
+
+@pytest.fixture
+def response_file(tmp_path):
+    response_file = tmp_path / "args.txt"
+    response_file.write_text("--files\na.txt\n--files\nb c.txt\n")
+    return response_file
+
+
+def test_parse_response_file(response_file):
+    model = parse(
+        Files, ["my_name", f"@{response_file}", "--verbose"], fromfile_prefix="@"
+    )
+    assert model == Files(
+        name="my_name", files=[Path("a.txt"), Path("b c.txt")], verbose=True
+    )
+
+
+def test_response_file_not_expanded_by_default(response_file):
+    model = parse(Files, [f"@{response_file}"])
+    assert model == Files(name=f"@{response_file}")
+
+
+def test_no_expansion_after_separator(response_file):
+    model = parse(Files, ["--", f"@{response_file}"], fromfile_prefix="@")
+    assert model == Files(name=f"@{response_file}")
+
+
+def test_windows_line_endings(tmp_path):
+    response_file = tmp_path / "args.txt"
+    response_file.write_bytes(b"--files\r\na.txt\r\n")
+
+    assert list(expand_response_files([f"@{response_file}"], "@")) == [
+        "--files",
+        "a.txt",
+    ]
+
+
+def test_missing_response_file_raises(tmp_path):
+    with pytest.raises(InvalidResponseFile):
+        list(expand_response_files([f"@{tmp_path / 'missing.txt'}"], "@"))
+
+
+def test_missing_response_file_error(tmp_path, capsys):
+    with pytest.raises(SystemExit) as err:
+        parse(Files, ["@missing.txt"], fromfile_prefix="@")
+
+    assert err.value.code == 1
+    assert "Unable to read arguments from 'missing.txt'" in capsys.readouterr().out
@@ -0,0 +1,72 @@
+import pytest
+from clipstick._suggest import SuggestionIndex
+from pydantic import BaseModel
+
+
+class Clone(BaseModel):
+    """Clone a repo."""
+
+    depth: int = 1
+
+
+class Merge(BaseModel):
+    """Merge a branch."""
+
+    branch: str
+
+
+class MyGit(BaseModel):
+    verbose: bool = False
+
+    sub_command: Clone | Merge
+
+
+@pytest.mark.parametrize(
+    "word,suggestions",
+    [
+        ("--verbos", ["--verbose"]),
+        ("-verbose", ["--verbose"]),
+        ("clnoe", ["clone"]),
+        ("--depht", ["--depth"]),
+        ("something-else", []),
+    ],
+)
+def test_suggestion_index(word, suggestions):
+    index = SuggestionIndex(["--verbose", "--version", "clone", "merge", "--depth"])
+    assert index.suggest(word) == suggestions
+
+
+@pytest.mark.parametrize(
+    "args,output",
+    [
+        (["clnoe"], "clnoe is unknown. Did you mean clone?"),
+        (["--verbos", "clone"], "--verbos is unknown. Did you mean --verbose?"),
+        (["clone", "--deph", "1"], "--deph is unknown. Did you mean --depth?"),
+    ],
+    ids=["subcommand", "flag", "option"],
+)
+def test_did_you_mean(capture_output, args, output):
+    with pytest.raises(SystemExit) as err:
+        capture_output(MyGit, args)
+
+    assert err.value.code == 1
+    assert (
+        f"""ERROR:
+{output}
+Use the-h argument to help
+"""
+        == capture_output.captured_output
+    )
+
+
+@pytest.mark.parametrize(
+    "args",
+    [["clone", "--depth", "1", "junk"], ["merge"]],
+    ids=["unexpected-value", "missing-value"],
+)
+def test_no_suggestion(capture_output, args):
+    with pytest.raises(SystemExit) as err:
+        capture_output(MyGit, args)
+
+    assert err.value.code == 1
+    assert "Did you mean" not in capture_output.captured_output
@@ -0,0 +1,85 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated
+
+from clipstick import variadic
+from clipstick.testing import CliRunner
+from pydantic import BaseModel, PositiveInt
+
+
+class Clone(BaseModel):
+    """Clone a repo."""
+
+    repo: str
+    depth: PositiveInt = 1
+
+
+class Tag(BaseModel):
+    """Tag files."""
+
+    files: Annotated[list[str], variadic()] = []
+
+
+class MyGit(BaseModel):
+    """My git cli."""
+
+    sub_command: Clone | Tag
+
+
+runner = CliRunner(MyGit)
+
+
+def test_invoke():
+    result = runner.invoke(["clone", "my_repo", "--depth", "2"])
+
+    assert result.exit_code == 0
+    assert result.model == MyGit(sub_command=Clone(repo="my_repo", depth=2))
+    assert result.stdout == result.stderr == ""
+
+
+def test_invoke_help():
+    result = runner.invoke(["clone", "-h"])
+
+    assert result.exit_code == 0
+    assert result.model is None
+    assert result.stdout.startswith("\nUsage: my-cli-app clone [Arguments] [Options]")
+    assert result.stderr == ""
+
+
+def test_invoke_error():
+    result = runner.invoke(["clone", "my_repo", "--depth", "0"])
+
+    assert result.exit_code == 1
+    assert result.model is None
+    assert result.stdout == ""
+    assert result.stderr == (
+        "ERROR:\n"
+        "Incorrect value for --depth in clone  ('0'). Input should be greater than 0\n"
+    )
+
+
+def test_invoke_with_input():
+    result = runner.invoke(["tag", "--files", "-"], input="a.txt\nb.txt\n")
+
+    assert result.model == MyGit(sub_command=Tag(files=["a.txt", "b.txt"]))
+
+
+def test_invoke_from_threads():
+    args = [["clone", f"repo_{idx}", "--depth", str(idx % 3)] for idx in range(200)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(runner.invoke, args))
+
+    for idx, result in enumerate(results):
+        if idx % 3:
+            assert result.model == MyGit(
+                sub_command=Clone(repo=f"repo_{idx}", depth=idx % 3)
+            )
+        else:
+            assert result.exit_code == 1
+            assert "('0')" in result.stderr
+
+
+def test_options_are_passed():
+    result = CliRunner(MyGit, allow_abbrev=True).invoke(["clone", "repo", "--dep=3"])
+
+    assert result.model == MyGit(sub_command=Clone(repo="repo", depth=3))
@@ -0,0 +1,75 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated
+
+import pytest
+from clipstick import parse, short
+from pydantic import BaseModel
+from rich.console import Console
+
+
+class Clone(BaseModel):
+    """Clone a repo."""
+
+    repo: str
+    """Repository to clone."""
+
+    depth: int = 1
+
+
+class Info(BaseModel):
+    verbose: bool = False
+
+
+class MyGit(BaseModel):
+    """My git cli."""
+
+    remotes: Annotated[list[str], short("r")] = []
+    sub_command: Clone | Info
+
+
+def _parse(idx: int) -> MyGit:
+    if idx % 2:
+        return parse(
+            MyGit, ["-r", f"remote_{idx}", "clone", f"repo_{idx}", "--depth", str(idx)]
+        )
+    return parse(MyGit, ["info", "--verbose"] if idx % 4 else ["info"])
+
+
+def _expected(idx: int) -> MyGit:
+    if idx % 2:
+        return MyGit(
+            remotes=[f"remote_{idx}"], sub_command=Clone(repo=f"repo_{idx}", depth=idx)
+        )
+    return MyGit(sub_command=Info(verbose=bool(idx % 4)))
+
+
+def test_parse_from_multiple_threads():
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(_parse, range(2000)))
+
+    assert results == [_expected(idx) for idx in range(2000)]
+
+
+def _capture_error(idx: int) -> str:
+    output = Console(file=io.StringIO(), width=200)
+    with pytest.raises(SystemExit):
+        parse(MyGit, ["clone", f"repo_{idx}", "--depth", f"deep_{idx}"], output=output)
+    return output.file.getvalue()
+
+
+def test_output_per_parse():
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        outputs = list(executor.map(_capture_error, range(200)))
+
+    for idx, output in enumerate(outputs):
+        assert output == (
+            "ERROR:\n"
+            f"Incorrect value for --depth in clone  ('deep_{idx}'). "
+            "Input should be a valid integer, unable to parse string as an integer\n"
+        )
+
+
+def test_model_is_not_modified():
+    parse(MyGit, ["clone", "my_repo"])
+    assert Clone.model_fields["repo"].description is None
@@ -17,7 +17,7 @@ def test_too_many_arguments(capture_output):
     assert err.value.code == 1
     assert (
         """ERROR:
-Unable to consume all provided arguments.
+Unexpected value '12'
 Use the-h argument to help
 """
         == capture_output.captured_output
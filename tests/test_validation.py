@@ -0,0 +1,151 @@
+from typing import Annotated, Literal
+
+import pytest
+from clipstick import short
+from clipstick._clipstick import parse
+from clipstick._exceptions import FieldError, ParseErrors
+from clipstick._lexer import lex
+from clipstick._parse import compile_model
+from clipstick._tokens import ParseOptions, ParseState
+from clipstick._validation import supports_field_validation
+from clipstick.testing import CliRunner
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    ConfigDict,
+    Field,
+    PositiveInt,
+    field_validator,
+)
+
+
+class Clone(BaseModel):
+    repo: str
+    depth: PositiveInt = 1
+
+
+class Info(BaseModel):
+    verbose: bool = False
+
+
+class MyModel(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    name: str
+    count: Annotated[PositiveInt, short("c")] = 1
+    values: list[int] = Field(default_factory=list, max_length=3)
+    mode: Literal["fast", "slow"] | None = None
+
+    sub_command: Clone | Info
+
+
+class MyValidatedModel(BaseModel):
+    name: str
+
+    @field_validator("name")
+    @classmethod
+    def upper(cls, value: str) -> str:
+        return value.upper()
+
+
+def _parse_error(model: type[BaseModel], args: list[str]) -> FieldError:
+    root_node = compile_model(model, "my-cli-app")
+    state = ParseState(root_node, lex(args), ParseOptions())
+    root_node.match(0, state)
+    with pytest.raises(ParseErrors) as err:
+        root_node.parse(state)
+    assert isinstance(err.value.errors[0], FieldError)
+    return err.value.errors[0]
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        [" my_name ", "info"],
+        ["my_name", "-c", "3", "--values", "1", "--mode=fast", "clone", "my_repo"],
+        ["--values", "1", "--values", "2", "--", "-name", "clone", "-repo"],
+    ],
+)
+def test_field_validation_equals_model_validation(args):
+    model = parse(MyModel, args)
+
+    fields = model.model_dump(exclude_unset=True)
+    assert model == MyModel.model_validate(fields)
+    assert model.model_fields_set == MyModel.model_validate(fields).model_fields_set
+
+
+def test_field_validation_is_used():
+    assert supports_field_validation(MyModel)
+    assert not supports_field_validation(MyValidatedModel)
+
+
+def test_model_with_validators_is_validated_as_a_whole():
+    assert parse(MyValidatedModel, ["my_name"]) == MyValidatedModel(name="MY_NAME")
+
+
+@pytest.mark.parametrize(
+    "args,indexes",
+    [
+        (["my_name", "--count", "-1", "info"], [2]),
+        (["my_name", "--count=-1", "info"], [1]),
+        (["--values", "1", "--values", "a", "--", "name", "info"], [3]),
+        (["--values", "a", "--count=0", "--values", "b", "name", "info"], [2, 1, 4]),
+    ],
+)
+def test_error_argument_indexes(args, indexes):
+    assert _parse_error(MyModel, args).argument_indexes == indexes
+
+
+class ValidatedSubcommands(BaseModel):
+    sub_command: MyValidatedModel | Info
+
+    @field_validator("sub_command")
+    @classmethod
+    def keep(cls, value: BaseModel) -> BaseModel:
+        return value
+
+
+@pytest.mark.parametrize(
+    "model,args,error",
+    [
+        (MyValidatedModel, [], "Missing a value for positional argument 'name'"),
+        (MyValidatedModel, ["--name"], "--name is unknown"),
+        (ValidatedSubcommands, [], "Missing a subcommand"),
+        (ValidatedSubcommands, ["inof"], "inof is unknown"),
+    ],
+)
+def test_model_with_validators_reports_missing_arguments(model, args, error):
+    result = CliRunner(model).invoke(args)
+
+    assert result.exit_code == 1
+    assert error in result.stderr
+
+
+class MyAliasedModel(BaseModel):
+    name: str = Field(validation_alias="n")
+    count: int = Field(1, validation_alias=AliasChoices("c", "cnt"))
+
+
+@pytest.mark.parametrize(
+    "args,expected",
+    [
+        (["alpha"], MyAliasedModel(n="alpha")),
+        (["alpha", "--count", "3"], MyAliasedModel(n="alpha", c=3)),
+    ],
+)
+def test_aliased_fields_are_validated(args, expected):
+    assert CliRunner(MyAliasedModel).invoke(args).model == expected
+
+
+@pytest.mark.parametrize(
+    "args,error",
+    [
+        ([], "Missing a value for positional argument 'name'"),
+        (["alpha", "--count", "x"], "Incorrect value for --count ('x')"),
+    ],
+)
+def test_aliased_field_errors(args, error):
+    result = CliRunner(MyAliasedModel).invoke(args)
+
+    assert result.exit_code == 1
+    assert error in result.stderr